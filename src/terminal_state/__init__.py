@@ -1,15 +1,34 @@
 """Terminal State - Terminal automation with state capture and export."""
 
-from terminal_state.capture import Frame, Recording
+from terminal_state.capture import (
+    DeltaFrameStore,
+    Frame,
+    FrameStore,
+    JournalFrameStore,
+    MappedFrameStore,
+    OutputEvent,
+    Recording,
+)
 from terminal_state.export import (
     AsciinemaExporter,
     GifConfig,
     GifExporter,
     ScreenshotExporter,
+    SvgExporter,
 )
 from terminal_state.input import KeySequence, Keys
-from terminal_state.models import SessionConfig
-from terminal_state.session import TerminalSession, TmuxBackend
+from terminal_state.models import SessionConfig, SettleConfig
+from terminal_state.session import (
+    AsyncTerminalSession,
+    AsyncTmuxBackend,
+    ExpectMatch,
+    PtyBackend,
+    ScenarioResult,
+    ScenarioRunner,
+    SessionPool,
+    TerminalSession,
+    TmuxBackend,
+)
 
 __version__ = "0.1.0"
 
@@ -17,10 +36,23 @@ __all__ = [
     # Core session
     "TerminalSession",
     "TmuxBackend",
+    "PtyBackend",
+    "AsyncTerminalSession",
+    "AsyncTmuxBackend",
+    "ExpectMatch",
+    "SessionPool",
+    "ScenarioRunner",
+    "ScenarioResult",
     "SessionConfig",
+    "SettleConfig",
     # Capture
     "Frame",
+    "OutputEvent",
     "Recording",
+    "FrameStore",
+    "DeltaFrameStore",
+    "JournalFrameStore",
+    "MappedFrameStore",
     # Input
     "KeySequence",
     "Keys",
@@ -29,4 +61,5 @@ __all__ = [
     "GifExporter",
     "GifConfig",
     "ScreenshotExporter",
+    "SvgExporter",
 ]
@@ -1,6 +1,23 @@
 """Capture module for frames and recordings."""
 
+from terminal_state.capture.archive import ArchiveWriter, MappedFrameStore
+from terminal_state.capture.cast import CastEventStore, CastFrameStore
+from terminal_state.capture.delta import DeltaFrameStore
+from terminal_state.capture.events import OutputEvent
 from terminal_state.capture.frame import Frame
+from terminal_state.capture.journal import JournalFrameStore
 from terminal_state.capture.recorder import Recording
+from terminal_state.capture.store import FrameStore
 
-__all__ = ["Frame", "Recording"]
+__all__ = [
+    "ArchiveWriter",
+    "CastEventStore",
+    "CastFrameStore",
+    "DeltaFrameStore",
+    "Frame",
+    "FrameStore",
+    "JournalFrameStore",
+    "MappedFrameStore",
+    "OutputEvent",
+    "Recording",
+]
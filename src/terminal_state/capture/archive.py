@@ -0,0 +1,272 @@
+"""Indexed binary recording archive, read through mmap.
+
+Layout (little-endian)::
+
+    header   magic, version, metadata length, metadata JSON
+    frames   one record per frame: fixed fields, content, ANSI data, metadata
+    events   one record per output event: timestamp, length, data
+    index    frame timestamps (float64[n]) then frame offsets (uint64[n])
+    footer   index offset, frame count, events offset, event count, magic
+
+The index is read in place from the mapping, so looking a frame up by
+position or timestamp costs O(1) or O(log n) without parsing the file.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+import weakref
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self, overload
+
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import Frame
+from terminal_state.capture.recorder import Recording
+from terminal_state.capture.store import FrameStore
+
+MAGIC = b"TSREC\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<6sHI")
+_FRAME = struct.Struct("<dHHIiI")
+_EVENT = struct.Struct("<dI")
+_FOOTER = struct.Struct("<QQQQ6s")
+
+# Recording fields describing the captured session rather than in-memory layout
+_SAVED_FIELDS = ("started_at", "width", "height", "title", "environment", "ended_at")
+
+
+class ArchiveWriter:
+    """Streams frames into an archive; the index is written on close."""
+
+    def __init__(self, path: Path | str, metadata: dict[str, Any]) -> None:
+        self.path = Path(path)
+        self._file: IO[bytes] = open(self.path, "wb")  # noqa: SIM115
+        self._timestamps: list[float] = []
+        self._offsets: list[int] = []
+        self._events: list[OutputEvent] = []
+
+        meta = json.dumps(metadata).encode()
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(meta)))
+        self._file.write(meta)
+        self._offset = _HEADER.size + len(meta)
+
+    def add_frame(self, frame: Frame) -> None:
+        """Append one frame record."""
+        content = frame.content.encode()
+        ansi = frame.ansi_data or b""
+        metadata = json.dumps(frame.metadata).encode() if frame.metadata else b""
+        record = _FRAME.pack(
+            frame.timestamp,
+            frame.width,
+            frame.height,
+            len(content),
+            -1 if frame.ansi_data is None else len(ansi),
+            len(metadata),
+        )
+        self._file.write(record)
+        self._file.write(content)
+        self._file.write(ansi)
+        self._file.write(metadata)
+
+        self._timestamps.append(frame.timestamp)
+        self._offsets.append(self._offset)
+        self._offset += len(record) + len(content) + len(ansi) + len(metadata)
+
+    def add_event(self, event: OutputEvent) -> None:
+        """Queue an output event; events are written after the frames."""
+        self._events.append(event)
+
+    def close(self) -> None:
+        """Write events, index and footer, then close the file."""
+        if self._file.closed:
+            return
+
+        events_offset = self._offset
+        for event in self._events:
+            data = event.data.encode()
+            self._file.write(_EVENT.pack(event.timestamp, len(data)))
+            self._file.write(data)
+            self._offset += _EVENT.size + len(data)
+
+        padding = -self._offset % 8
+        self._file.write(b"\0" * padding)
+        index_offset = self._offset + padding
+        count = len(self._offsets)
+        self._file.write(struct.pack(f"<{count}d", *self._timestamps))
+        self._file.write(struct.pack(f"<{count}Q", *self._offsets))
+        self._file.write(_FOOTER.pack(index_offset, count, events_offset, len(self._events), MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def _release(views: list[memoryview], mapping: mmap.mmap, file: IO[bytes]) -> None:
+    for view in views:
+        view.release()
+    mapping.close()
+    file.close()
+
+
+class MappedFrameStore(FrameStore):
+    """Read-only frame store over a memory-mapped archive."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        file = open(self.path, "rb")  # noqa: SIM115
+        try:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            file.close()
+            raise ValueError(f"{self.path} is not a recording archive") from None
+
+        self._map = mapping
+        if len(mapping) < _HEADER.size + _FOOTER.size or mapping[:6] != MAGIC:
+            _release([], mapping, file)
+            raise ValueError(f"{self.path} is not a recording archive")
+
+        _, version, meta_len = _HEADER.unpack_from(mapping, 0)
+        index_offset, count, events_offset, event_count, end = _FOOTER.unpack_from(
+            mapping, len(mapping) - _FOOTER.size
+        )
+        if version != VERSION or end != MAGIC:
+            _release([], mapping, file)
+            raise ValueError(f"{self.path} is truncated or has an unsupported version")
+
+        self.metadata: dict[str, Any] = json.loads(mapping[_HEADER.size : _HEADER.size + meta_len])
+        self._events_region = (events_offset, event_count)
+
+        view = memoryview(mapping)
+        self._timestamps = view[index_offset : index_offset + 8 * count].cast("d")
+        offsets_start = index_offset + 8 * count
+        self._offsets = view[offsets_start : offsets_start + 8 * count].cast("Q")
+        self._finalizer = weakref.finalize(
+            self, _release, [self._timestamps, self._offsets, view], mapping, file
+        )
+
+    def append(self, frame: Frame) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _get(self, index: int) -> Frame:
+        offset = self._offsets[index]
+        timestamp, width, height, content_len, ansi_len, meta_len = _FRAME.unpack_from(
+            self._map, offset
+        )
+        start = offset + _FRAME.size
+        content = self._map[start : start + content_len].decode()
+        start += content_len
+        ansi_data = None
+        if ansi_len >= 0:
+            ansi_data = self._map[start : start + ansi_len]
+            start += ansi_len
+        metadata = json.loads(self._map[start : start + meta_len]) if meta_len else None
+        return Frame.trusted(content, width, height, timestamp, ansi_data, metadata)
+
+    def index_at(self, timestamp: float) -> int:
+        """Index of the last frame at or before ``timestamp``, or -1."""
+        return bisect_right(self._timestamps, timestamp) - 1
+
+    def events(self) -> ArchiveEventStore:
+        """The archived output events, decoded on access."""
+        return ArchiveEventStore(self)
+
+    def _event(self, offset: int) -> tuple[OutputEvent, int]:
+        """Event record at ``offset`` and the offset of the next one."""
+        timestamp, length = _EVENT.unpack_from(self._map, offset)
+        offset += _EVENT.size
+        data = self._map[offset : offset + length].decode()
+        return OutputEvent.model_construct(timestamp=timestamp, data=data), offset + length
+
+    @property
+    def closed(self) -> bool:
+        """Whether the mapping has been released."""
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Release the mapping and the file."""
+        self._finalizer()
+
+
+class ArchiveEventStore(Sequence[OutputEvent]):
+    """Output events of an archive, decoded on access.
+
+    Iterating walks the records in order; indexing first collects the
+    record offsets, reading only their fixed-size headers.
+    """
+
+    def __init__(self, store: MappedFrameStore) -> None:
+        self.store = store
+        self._offsets: array[int] | None = None
+
+    def __len__(self) -> int:
+        return self.store._events_region[1]
+
+    @overload
+    def __getitem__(self, item: int) -> OutputEvent: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[OutputEvent]: ...
+
+    def __getitem__(self, item: int | slice) -> OutputEvent | list[OutputEvent]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if self._offsets is None:
+            self._offsets = self._scan()
+        return self.store._event(self._offsets[item])[0]
+
+    def __iter__(self) -> Iterator[OutputEvent]:
+        offset, count = self.store._events_region
+        for _ in range(count):
+            event, offset = self.store._event(offset)
+            yield event
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} events>)"
+
+    def _scan(self) -> array[int]:
+        offsets = array("q")
+        offset, count = self.store._events_region
+        for _ in range(count):
+            offsets.append(offset)
+            _, length = _EVENT.unpack_from(self.store._map, offset)
+            offset += _EVENT.size + length
+        return offsets
+
+
+def write_archive(recording: Recording, path: Path | str) -> None:
+    """Save a recording as an indexed binary archive."""
+    metadata = {name: getattr(recording, name) for name in _SAVED_FIELDS}
+    with ArchiveWriter(path, metadata) as writer:
+        for frame in recording.frames:
+            writer.add_frame(frame)
+        for event in recording.events:
+            writer.add_event(event)
+
+
+def read_archive(path: Path | str) -> Recording:
+    """Open an archive as a recording whose frames and events are read on demand."""
+    store = MappedFrameStore(path)
+    return Recording.model_construct(**store.metadata, frames=store, events=store.events())
@@ -0,0 +1,225 @@
+"""Lazy reader for asciicast v2 files."""
+
+from __future__ import annotations
+
+import copy
+import json
+import re
+import weakref
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import ANSI_ESCAPE, Frame
+from terminal_state.capture.recorder import Recording
+from terminal_state.capture.store import FrameStore
+
+# Matches the start of an output event line without parsing the JSON
+_OUTPUT_LINE = re.compile(rb'\s*\[\s*[-+0-9.eE]+\s*,\s*"o"')
+
+
+class CastIndex:
+    """Header and output-event offsets of a cast file, found in one scan.
+
+    The scan only tests each line's event type; event payloads are parsed
+    when they are read.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header_line = f.readline()
+            self.header: dict[str, Any] = json.loads(header_line) if header_line.strip() else {}
+            if self.header.get("version") != 2:
+                raise ValueError(f"{self.path} is not an asciicast v2 file")
+
+            self.body_offset = len(header_line)
+            self.offsets = array("q")
+            offset = self.body_offset
+            for line in f:
+                if _OUTPUT_LINE.match(line):
+                    self.offsets.append(offset)
+                offset += len(line)
+
+    @property
+    def started_at(self) -> float:
+        return float(self.header.get("timestamp", 0))
+
+
+class CastEventStore(Sequence[OutputEvent]):
+    """Output events of a cast file, parsed on access."""
+
+    def __init__(self, index: CastIndex) -> None:
+        self.index = index
+        self._file = open(index.path, "rb")  # noqa: SIM115
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def __len__(self) -> int:
+        return len(self.index.offsets)
+
+    @overload
+    def __getitem__(self, item: int) -> OutputEvent: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[OutputEvent]: ...
+
+    def __getitem__(self, item: int | slice) -> OutputEvent | list[OutputEvent]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        offset = self.index.offsets[item]
+        self._file.seek(offset)
+        return self._event(self._file.readline())
+
+    def __iter__(self) -> Iterator[OutputEvent]:
+        with open(self.index.path, "rb") as f:
+            f.seek(self.index.body_offset)
+            for line in f:
+                if _OUTPUT_LINE.match(line):
+                    yield self._event(line)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} events>)"
+
+    def _event(self, line: bytes) -> OutputEvent:
+        time, _, data = json.loads(line)
+        return OutputEvent.model_construct(timestamp=self.index.started_at + time, data=data)
+
+    def close(self) -> None:
+        """Close the file handle used for random access."""
+        self._finalizer()
+
+
+def _between_escapes(data: str, clean: bool) -> bool:
+    """Whether a parser that was between escape sequences (``clean``) still is after ``data``.
+
+    Conservative: a sequence this cannot recognize as complete counts as
+    still open until a later one completes.
+    """
+    start = data.rfind("\x1b")
+    if start < 0:
+        return clean
+    return ANSI_ESCAPE.match(data, start) is not None
+
+
+class CastFrameStore(FrameStore):
+    """Screens rebuilt by replaying a cast through the ``pyte`` emulator.
+
+    There is one frame per output event, showing the screen after that
+    event. Iteration replays the file once. Random access resumes from the
+    nearest emulator checkpoint, taken about every ``checkpoint_interval``
+    frames as they are first replayed, at a point where no escape sequence
+    is open. Trailing blank rows are dropped as in live captures.
+    """
+
+    def __init__(self, index: CastIndex, checkpoint_interval: int = 1000) -> None:
+        try:
+            import pyte
+        except ImportError as e:
+            raise ImportError(
+                "Rebuilding frames from a cast requires pyte: pip install terminal-state[pyte]"
+            ) from e
+
+        if checkpoint_interval < 1:
+            raise ValueError("checkpoint_interval must be at least 1")
+
+        self._pyte = pyte
+        self.index = index
+        self.checkpoint_interval = checkpoint_interval
+        width = int(index.header.get("width", 80))
+        height = int(index.header.get("height", 24))
+        # (frame index, file offset, screen) to resume from
+        self._checkpoints: list[tuple[int, int, Any]] = [
+            (0, index.body_offset, pyte.Screen(width, height))
+        ]
+
+    def append(self, frame: Frame) -> None:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    def __len__(self) -> int:
+        return len(self.index.offsets)
+
+    def _get(self, index: int) -> Frame:
+        position = bisect_right(self._checkpoints, index, key=lambda c: c[0]) - 1
+        for frame_index, frame in self._replay(self._checkpoints[position]):
+            if frame_index == index:
+                return frame
+        raise IndexError("frame index out of range")
+
+    def __iter__(self) -> Iterator[Frame]:
+        for _, frame in self._replay(self._checkpoints[0]):
+            yield frame
+
+    def _replay(self, checkpoint: tuple[int, int, Any]) -> Iterator[tuple[int, Frame]]:
+        frame_index, offset, saved = checkpoint
+        screen = copy.deepcopy(saved)
+        stream = self._pyte.Stream(screen)
+        started_at = self.index.started_at
+        clean = True
+
+        with open(self.index.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                if not line.strip():
+                    continue
+                time, kind, data = json.loads(line)
+                if kind == "r":
+                    columns, rows = (int(n) for n in data.split("x"))
+                    screen.resize(rows, columns)
+                    continue
+                if kind != "o":
+                    continue
+
+                stream.feed(data)
+                frame_index += 1
+                # A resumed replay starts a fresh stream, so only checkpoint
+                # where that stream's parser state matches this one's
+                clean = _between_escapes(data, clean)
+                if clean and frame_index - self._checkpoints[-1][0] >= self.checkpoint_interval:
+                    self._checkpoints.append((frame_index, offset, copy.deepcopy(screen)))
+
+                rows = [row.rstrip() for row in screen.display]
+                while rows and not rows[-1]:
+                    rows.pop()
+                content = "\n".join(rows)
+                yield (
+                    frame_index - 1,
+                    Frame.trusted(content, screen.columns, screen.lines, started_at + time),
+                )
+
+
+def read_asciinema(
+    path: Path | str,
+    emulate: bool = False,
+    checkpoint_interval: int = 1000,
+) -> Recording:
+    """Open a cast file as a lazily evaluated recording.
+
+    Output events are always available as ``recording.events``. With
+    ``emulate`` the events are also replayed through ``pyte`` so that
+    ``recording.frames`` holds the screen after each event.
+    """
+    index = CastIndex(path)
+    header = index.header
+    frames: list[Frame] | FrameStore = []
+    if emulate:
+        frames = CastFrameStore(index, checkpoint_interval)
+
+    return Recording.model_construct(
+        started_at=index.started_at,
+        width=int(header.get("width", 80)),
+        height=int(header.get("height", 24)),
+        title=header.get("title", ""),
+        environment=header.get("env") or {},
+        frames=frames,
+        events=CastEventStore(index),
+        dedupe=False,
+    )
@@ -0,0 +1,15 @@
+"""Terminal cell widths of characters."""
+
+from __future__ import annotations
+
+import unicodedata
+
+
+def cell_width(char: str) -> int:
+    """Number of terminal cells ``char`` occupies (2 for wide characters)."""
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def is_zero_width(char: str) -> bool:
+    """Whether ``char`` combines with the character before it instead of taking a cell."""
+    return unicodedata.combining(char) != 0 or unicodedata.category(char) in ("Me", "Cf")
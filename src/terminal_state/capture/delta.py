@@ -0,0 +1,186 @@
+"""Delta-encoded frame storage: periodic keyframes plus line diffs."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from typing import TypeVar
+
+from terminal_state.capture.frame import Frame
+from terminal_state.capture.store import FrameStore
+
+T = TypeVar("T", str, bytes)
+
+
+# Lines of a frame's content and of its escaped screen (None without one)
+_Rows = tuple[list[str], list[bytes] | None]
+
+
+def _ansi_rows(frame: Frame) -> tuple[bytes, ...] | None:
+    return None if frame.ansi_data is None else tuple(frame.ansi_data.split(b"\n"))
+
+
+def _diff(previous: Sequence[T], lines: Sequence[T]) -> tuple[tuple[int, T], ...]:
+    return tuple(
+        (i, line) for i, line in enumerate(lines) if i >= len(previous) or previous[i] != line
+    )
+
+
+def _patch(lines: list[T], count: int, changes: tuple[tuple[int, T], ...], blank: T) -> list[T]:
+    updated = lines[:count]
+    updated.extend([blank] * (count - len(updated)))
+    for i, line in changes:
+        updated[i] = line
+    return updated
+
+
+class _Entry:
+    """One stored frame: full content for keyframes, changed lines otherwise.
+
+    The escaped screen in ``ansi_data``, when there is one, is stored the
+    same way row by row, so colors cost little more than the text.
+    """
+
+    __slots__ = (
+        "ansi_changes",
+        "ansi_data",
+        "ansi_line_count",
+        "changes",
+        "content",
+        "height",
+        "line_count",
+        "metadata",
+        "timestamp",
+        "width",
+    )
+
+    def __init__(
+        self,
+        frame: Frame,
+        content: str | None,
+        changes: tuple[tuple[int, str], ...],
+        line_count: int,
+        ansi_changes: tuple[tuple[int, bytes], ...] = (),
+    ) -> None:
+        self.content = content
+        self.changes = changes
+        self.line_count = line_count
+        # Keyframes keep the escaped screen whole, deltas its changed rows;
+        # a row count of -1 marks a frame without one
+        self.ansi_data = frame.ansi_data if content is not None else None
+        self.ansi_changes = ansi_changes
+        self.ansi_line_count = -1 if frame.ansi_data is None else frame.ansi_data.count(b"\n") + 1
+        self.width = frame.width
+        self.height = frame.height
+        self.timestamp = frame.timestamp
+        self.metadata = frame.metadata or None
+
+    def to_frame(self, rows: _Rows) -> Frame:
+        """Materialize this entry given its reconstructed rows."""
+        lines, ansi_rows = rows
+        ansi_data = self.ansi_data
+        if self.content is None and ansi_rows is not None:
+            ansi_data = b"\n".join(ansi_rows)
+        return Frame.trusted(
+            "\n".join(lines) if self.content is None else self.content,
+            self.width,
+            self.height,
+            self.timestamp,
+            ansi_data,
+            dict(self.metadata) if self.metadata else None,
+        )
+
+
+class DeltaFrameStore(FrameStore):
+    """Stores every ``keyframe_interval``-th frame in full, the rest as diffs.
+
+    A delta holds only the lines that differ from the previous frame, so a
+    screen where one line changed costs one line instead of the whole
+    screen. Random access replays at most ``keyframe_interval - 1`` deltas;
+    sequential iteration applies one delta per frame.
+    """
+
+    def __init__(self, keyframe_interval: int = 50) -> None:
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+
+        self.keyframe_interval = keyframe_interval
+        self._entries: list[_Entry] = []
+        self._keyframes: list[int] = []
+        self._last_lines: tuple[str, ...] = ()
+        self._last_ansi: tuple[bytes, ...] | None = None
+        self._last_size: tuple[int, int] | None = None
+        self._cursor: tuple[int, _Rows] | None = None
+
+    def append(self, frame: Frame) -> None:
+        """Encode a frame against its predecessor and store it."""
+        lines = frame.lines
+        ansi_rows = _ansi_rows(frame)
+        index = len(self._entries)
+        size = (frame.width, frame.height)
+        since_key = index - self._keyframes[-1] if self._keyframes else 0
+
+        if self._keyframes and since_key < self.keyframe_interval and size == self._last_size:
+            changes = _diff(self._last_lines, lines)
+            ansi_changes: tuple[tuple[int, bytes], ...] = ()
+            total = len(lines)
+            if ansi_rows is not None:
+                ansi_changes = _diff(self._last_ansi or (), ansi_rows)
+                total += len(ansi_rows)
+            # A delta touching most lines is no cheaper than a keyframe.
+            if (len(changes) + len(ansi_changes)) * 2 <= total:
+                self._entries.append(_Entry(frame, None, changes, len(lines), ansi_changes))
+                self._last_lines, self._last_ansi = lines, ansi_rows
+                return
+
+        self._keyframes.append(index)
+        self._entries.append(_Entry(frame, frame.content, (), len(lines)))
+        self._last_lines, self._last_ansi = lines, ansi_rows
+        self._last_size = size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, index: int) -> Frame:
+        return self._entries[index].to_frame(self._lines_at(index))
+
+    def __iter__(self) -> Iterator[Frame]:
+        rows: _Rows = ([], None)
+        for entry in self._entries:
+            rows = self._apply(entry, rows)
+            yield entry.to_frame(rows)
+
+    @property
+    def keyframe_count(self) -> int:
+        """Number of frames stored in full."""
+        return len(self._keyframes)
+
+    def _lines_at(self, index: int) -> _Rows:
+        """Reconstruct the screen lines and escaped rows of frame ``index``."""
+        start = self._keyframe_before(index)
+        rows: _Rows = ([], None)
+        if self._cursor is not None and start <= self._cursor[0] <= index:
+            start, rows = self._cursor[0] + 1, self._cursor[1]
+
+        for i in range(start, index + 1):
+            rows = self._apply(self._entries[i], rows)
+
+        self._cursor = (index, rows)
+        return rows
+
+    def _keyframe_before(self, index: int) -> int:
+        """Index of the last keyframe at or before ``index``."""
+        return self._keyframes[bisect_right(self._keyframes, index) - 1]
+
+    @staticmethod
+    def _apply(entry: _Entry, rows: _Rows) -> _Rows:
+        """Return the rows of ``entry`` given those of the previous frame."""
+        if entry.content is not None:
+            ansi = entry.ansi_data.split(b"\n") if entry.ansi_data is not None else None
+            return entry.content.split("\n"), ansi
+
+        lines, ansi_rows = rows
+        lines = _patch(lines, entry.line_count, entry.changes, "")
+        if entry.ansi_line_count < 0:
+            return lines, None
+        return lines, _patch(ansi_rows or [], entry.ansi_line_count, entry.ansi_changes, b"")
@@ -0,0 +1,14 @@
+"""Output event model for streamed terminal output."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class OutputEvent(BaseModel):
+    """Chunk of raw pane output, timestamped when it was produced."""
+
+    model_config = ConfigDict(frozen=True)
+
+    timestamp: float = Field(description="Unix timestamp")
+    data: str = Field(description="Raw terminal output (including ANSI)")
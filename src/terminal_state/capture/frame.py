@@ -2,11 +2,41 @@
 
 from __future__ import annotations
 
+import hashlib
+import re
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Self
+
 from pydantic import BaseModel, ConfigDict, Field
 
+# CSI sequences, OSC strings (BEL or ST terminated) and two-byte escapes
+ANSI_ESCAPE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])")
+
+if TYPE_CHECKING:
+    from terminal_state.capture.grid import CellGrid
+    from terminal_state.capture.sgr import StyledLine
+
+_REQUIRED_FIELDS = frozenset({"content", "width", "height", "timestamp"})
+# Keys the cached properties store in the instance ``__dict__``
+_CACHED = frozenset({"lines", "text", "content_hash", "grid", "styled_lines"})
+
+
+def cell_grid_class() -> type[CellGrid]:
+    """Import :class:`CellGrid`, explaining how to get NumPy if it is missing."""
+    try:
+        from terminal_state.capture.grid import CellGrid
+    except ImportError as e:
+        raise ImportError("Cell grids require numpy: pip install terminal-state[numpy]") from e
+    return CellGrid
+
 
 class Frame(BaseModel):
-    """Immutable terminal state snapshot."""
+    """Immutable terminal state snapshot.
+
+    Derived views (``lines``, ``text``, ``content_hash``, ``styled_lines``,
+    ``grid``) are computed on first access and cached on the frame. Copies
+    and pickles leave them behind, so they are recomputed from the copy.
+    """
 
     model_config = ConfigDict(frozen=True)
 
@@ -18,3 +48,111 @@ class Frame(BaseModel):
     # Optional enrichments
     ansi_data: bytes | None = Field(default=None, description="Preserved ANSI sequences")
     metadata: dict[str, str] = Field(default_factory=dict)
+
+    @classmethod
+    def trusted(
+        cls,
+        content: str,
+        width: int,
+        height: int,
+        timestamp: float,
+        ansi_data: bytes | None = None,
+        metadata: dict[str, str] | None = None,
+        grid: CellGrid | None = None,
+        styled_lines: tuple[StyledLine, ...] | None = None,
+    ) -> Frame:
+        """Build a frame from values the library produced itself, skipping validation.
+
+        Cheaper than both the validating constructor and ``model_construct``;
+        callers are responsible for passing correctly typed values. A
+        ``grid`` or ``styled_lines`` captured alongside the content are cached
+        on the frame as they are.
+        """
+        frame = cls.__new__(cls)
+        fields_set = _REQUIRED_FIELDS
+        if ansi_data is not None or metadata:
+            fields_set = fields_set | {"ansi_data", "metadata"}
+        object.__setattr__(
+            frame,
+            "__dict__",
+            {
+                "content": content,
+                "width": width,
+                "height": height,
+                "timestamp": timestamp,
+                "ansi_data": ansi_data,
+                "metadata": metadata if metadata is not None else {},
+            },
+        )
+        if grid is not None:
+            frame.__dict__["grid"] = grid
+        if styled_lines is not None:
+            frame.__dict__["styled_lines"] = styled_lines
+        object.__setattr__(frame, "__pydantic_fields_set__", set(fields_set))
+        object.__setattr__(frame, "__pydantic_extra__", None)
+        object.__setattr__(frame, "__pydantic_private__", None)
+        return frame
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the frame, dropping cached views that ``update`` could make stale."""
+        copy = super().model_copy(update=update, deep=deep)
+        for key in _CACHED & copy.__dict__.keys():
+            del copy.__dict__[key]
+        return copy
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        state["__dict__"] = {k: v for k, v in state["__dict__"].items() if k not in _CACHED}
+        return state
+
+    @cached_property
+    def lines(self) -> tuple[str, ...]:
+        """Content split into screen lines."""
+        return tuple(self.content.split("\n"))
+
+    @cached_property
+    def text(self) -> str:
+        """Content with ANSI escape sequences removed."""
+        if "\x1b" not in self.content:
+            return self.content
+        return ANSI_ESCAPE.sub("", self.content)
+
+    @cached_property
+    def content_hash(self) -> int:
+        """Digest of everything that makes two frames look different on screen.
+
+        Stable across processes, unlike the built-in ``hash``.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.width}x{self.height}\0".encode())
+        digest.update(self.content.encode("utf-8", errors="surrogatepass"))
+        if self.ansi_data is not None:
+            digest.update(b"\0")
+            digest.update(self.ansi_data)
+        return int.from_bytes(digest.digest())
+
+    @cached_property
+    def grid(self) -> CellGrid:
+        """Screen as NumPy cell arrays (requires the ``numpy`` extra).
+
+        Backends capturing with ``cell_grid`` enabled supply the cursor.
+        Colors and attributes come from ``styled_lines`` when the frame
+        carries escape sequences; otherwise the grid is built from ``text``.
+        """
+        grid_class = cell_grid_class()
+        if self.ansi_data is None and "\x1b" not in self.content:
+            return grid_class.from_text(self.content, self.width, self.height)
+        return grid_class.from_styled(self.styled_lines, self.width, self.height)
+
+    @cached_property
+    def styled_lines(self) -> tuple[StyledLine, ...]:
+        """Lines as runs of text with their colors and attributes.
+
+        Parsed once from ``ansi_data`` when colors were captured, else from
+        ``content``.
+        """
+        from terminal_state.capture.sgr import parse_styled
+
+        if self.ansi_data is not None:
+            return parse_styled(self.ansi_data.decode("utf-8", errors="replace"))
+        return parse_styled(self.content)
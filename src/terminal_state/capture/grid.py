@@ -0,0 +1,235 @@
+"""Structured screen representation as NumPy cell arrays.
+
+Requires the optional ``numpy`` extra.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from terminal_state.capture.cells import cell_width, is_zero_width
+from terminal_state.capture.sgr import (
+    BLINK,
+    BOLD,
+    DEFAULT_COLOR,
+    DIM,
+    HIDDEN,
+    ITALIC,
+    REVERSE,
+    RGB_FLAG,
+    STRIKE,
+    UNDERLINE,
+    StyledLine,
+    decode_color,
+    palette_color,
+    pyte_color,
+    pyte_style,
+    rgb_color,
+)
+
+__all__ = [
+    "BLINK",
+    "BOLD",
+    "DEFAULT_COLOR",
+    "DIM",
+    "HIDDEN",
+    "ITALIC",
+    "REVERSE",
+    "RGB_FLAG",
+    "STRIKE",
+    "UNDERLINE",
+    "CellGrid",
+    "decode_color",
+    "palette_color",
+    "pyte_color",
+    "rgb_color",
+]
+
+
+def _cell_codes(text: str) -> np.ndarray:
+    """Codepoints of ``text`` laid out in cells: 0 after each wide character."""
+    if text.isascii():
+        return np.frombuffer(text.encode("utf-32-le"), np.uint32)
+    codes = []
+    for char in text:
+        if is_zero_width(char):
+            continue
+        codes.append(ord(char))
+        if cell_width(char) == 2:
+            codes.append(0)
+    return np.array(codes, np.uint32)
+
+
+class CellGrid:
+    """A screen as parallel ``(height, width)`` arrays.
+
+    ``chars`` holds codepoints (0 for an empty cell or the right half of a
+    wide character), ``fg``/``bg`` encoded colors and ``attrs`` attribute
+    bits. ``cursor`` is ``(row, column)`` when known.
+    """
+
+    __slots__ = ("attrs", "bg", "chars", "cursor", "fg")
+
+    def __init__(
+        self,
+        chars: np.ndarray,
+        fg: np.ndarray | None = None,
+        bg: np.ndarray | None = None,
+        attrs: np.ndarray | None = None,
+        cursor: tuple[int, int] | None = None,
+    ) -> None:
+        self.chars = chars
+        self.fg = fg if fg is not None else np.zeros(chars.shape, np.uint32)
+        self.bg = bg if bg is not None else np.zeros(chars.shape, np.uint32)
+        self.attrs = attrs if attrs is not None else np.zeros(chars.shape, np.uint8)
+        self.cursor = cursor
+
+    @classmethod
+    def blank(cls, width: int, height: int) -> CellGrid:
+        """An empty screen."""
+        return cls(np.zeros((height, width), np.uint32))
+
+    @classmethod
+    def from_text(
+        cls,
+        content: str,
+        width: int,
+        height: int,
+        cursor: tuple[int, int] | None = None,
+    ) -> CellGrid:
+        """Grid of plain text, one line per row; excess text is cut off.
+
+        Wide characters take two cells, as on the terminal.
+        """
+        chars = np.zeros((height, width), np.uint32)
+        for row, line in enumerate(content.split("\n")[:height]):
+            if line:
+                codes = _cell_codes(line)[:width]
+                chars[row, : len(codes)] = codes
+        return cls(chars, cursor=cursor)
+
+    @classmethod
+    def from_screen(cls, screen: Any) -> CellGrid:
+        """Grid of a ``pyte`` screen, including colors, attributes and cursor."""
+        height, width = screen.lines, screen.columns
+        grid = cls.blank(width, height)
+        chars, fg, bg, attrs = grid.chars, grid.fg, grid.bg, grid.attrs
+        for row in range(height):
+            line = screen.buffer[row]
+            for column, char in line.items():
+                if column >= width:
+                    continue
+                if char.data:
+                    chars[row, column] = ord(char.data[0])
+                fg[row, column], bg[row, column], attrs[row, column] = pyte_style(char)
+        if not screen.cursor.hidden:
+            grid.cursor = (screen.cursor.y, screen.cursor.x)
+        return grid
+
+    @classmethod
+    def from_styled(
+        cls,
+        lines: tuple[StyledLine, ...],
+        width: int,
+        height: int,
+        cursor: tuple[int, int] | None = None,
+    ) -> CellGrid:
+        """Grid of styled runs, as parsed from escaped capture output."""
+        grid = cls.blank(width, height)
+        grid.cursor = cursor
+        for row, line in enumerate(lines[:height]):
+            column = 0
+            for text, style in line:
+                if column >= width:
+                    break
+                codes = _cell_codes(text)[: width - column]
+                end = column + len(codes)
+                grid.chars[row, column:end] = codes
+                grid.fg[row, column:end], grid.bg[row, column:end] = style.fg, style.bg
+                grid.attrs[row, column:end] = style.attrs
+                column = end
+        return grid
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """``(height, width)``."""
+        return self.chars.shape  # type: ignore[return-value]
+
+    def row_text(self, row: int) -> str:
+        """Text of one row with trailing blanks removed."""
+        codes = self.chars[row]
+        if codes.max(initial=0) >= 0x1100:
+            # Drop the right halves of wide characters
+            keep = np.ones(len(codes), bool)
+            for column in np.flatnonzero(codes[:-1] >= 0x1100):
+                if codes[column + 1] == 0 and cell_width(chr(codes[column])) == 2:
+                    keep[column + 1] = False
+            codes = codes[keep]
+        text = np.where(codes == 0, 32, codes).astype("<u4").tobytes().decode("utf-32-le")
+        return text.rstrip()
+
+    @property
+    def text(self) -> str:
+        """The screen as text, one line per row."""
+        return "\n".join(self.row_text(row) for row in range(self.shape[0]))
+
+    def changed(self, other: CellGrid) -> np.ndarray:
+        """Boolean mask of cells that differ from ``other`` in any plane."""
+        if self.shape != other.shape:
+            return np.ones(self.shape, bool)
+        return (
+            (self.chars != other.chars)
+            | (self.fg != other.fg)
+            | (self.bg != other.bg)
+            | (self.attrs != other.attrs)
+        )
+
+    def changed_rows(self, other: CellGrid) -> np.ndarray:
+        """Indices of rows that differ from ``other``."""
+        return np.flatnonzero(self.changed(other).any(axis=1))
+
+    def changed_bbox(self, other: CellGrid) -> tuple[int, int, int, int] | None:
+        """``(top, left, bottom, right)`` of changed cells, exclusive end, or None."""
+        mask = self.changed(other)
+        rows = np.flatnonzero(mask.any(axis=1))
+        if not rows.size:
+            return None
+        columns = np.flatnonzero(mask.any(axis=0))
+        return int(rows[0]), int(columns[0]), int(rows[-1]) + 1, int(columns[-1]) + 1
+
+    def region(self, top: int, left: int, bottom: int, right: int) -> CellGrid:
+        """Sub-grid of rows ``top:bottom`` and columns ``left:right`` (views, not copies)."""
+        cursor = None
+        if self.cursor is not None:
+            row, column = self.cursor
+            if top <= row < bottom and left <= column < right:
+                cursor = (row - top, column - left)
+        window = (slice(top, bottom), slice(left, right))
+        return CellGrid(
+            self.chars[window], self.fg[window], self.bg[window], self.attrs[window], cursor
+        )
+
+    def find(self, text: str) -> list[tuple[int, int]]:
+        """``(row, column)`` of every occurrence of ``text`` within a row."""
+        hits = []
+        for row in range(self.shape[0]):
+            line = self.row_text(row)
+            start = line.find(text)
+            while start != -1:
+                column = start
+                if not line.isascii():
+                    column = sum(cell_width(char) for char in line[:start])
+                hits.append((row, column))
+                start = line.find(text, start + 1)
+        return hits
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CellGrid):
+            return NotImplemented
+        return self.cursor == other.cursor and not self.changed(other).any()
+
+    def __repr__(self) -> str:
+        height, width = self.shape
+        return f"CellGrid({width}x{height}, cursor={self.cursor})"
@@ -0,0 +1,148 @@
+"""Append-only on-disk frame journal with a small in-memory window."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import tempfile
+import weakref
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from terminal_state.capture.frame import ANSI_ESCAPE, Frame
+from terminal_state.capture.store import FrameStore
+
+
+def _encode(frame: Frame) -> bytes:
+    content: str | None = frame.content
+    ansi = None
+    if frame.ansi_data is not None:
+        try:
+            escaped = frame.ansi_data.decode()
+        except UnicodeDecodeError:
+            ansi = base64.b64encode(frame.ansi_data).decode()
+        else:
+            # Captured content is the escaped screen stripped of its escapes;
+            # a null content marks it as derived and the escapes as text.
+            if ANSI_ESCAPE.sub("", escaped) == content:
+                content, ansi = None, escaped
+            else:
+                ansi = base64.b64encode(frame.ansi_data).decode()
+    record = [content, frame.width, frame.height, frame.timestamp, ansi, frame.metadata]
+    return json.dumps(record, separators=(",", ":")).encode() + b"\n"
+
+
+def _decode(line: bytes) -> Frame:
+    content, width, height, timestamp, ansi, metadata = json.loads(line)
+    if content is None:
+        content, ansi_data = ANSI_ESCAPE.sub("", ansi), ansi.encode()
+    else:
+        ansi_data = base64.b64decode(ansi) if ansi is not None else None
+    return Frame.trusted(content, width, height, timestamp, ansi_data, metadata or None)
+
+
+def _close_files(files: list[IO[bytes]], temporary: Path | None) -> None:
+    for handle in files:
+        handle.close()
+    if temporary is not None:
+        temporary.unlink(missing_ok=True)
+
+
+class JournalFrameStore(FrameStore):
+    """Writes each frame to a JSON-lines journal as it is appended.
+
+    Only the last ``window`` frames stay in memory, plus one file offset per
+    frame. Older frames are read back from the journal on access; iteration
+    streams the file. Without a ``path`` a temporary journal is created and
+    removed when the store is closed or garbage collected. An existing file
+    at ``path`` is replaced, or indexed and appended to with ``resume``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        window: int = 64,
+        resume: bool = False,
+    ) -> None:
+        if window < 0:
+            raise ValueError("window must not be negative")
+
+        temporary = None
+        if path is None:
+            fd, name = tempfile.mkstemp(prefix="terminal-state-", suffix=".journal")
+            os.close(fd)
+            path = temporary = Path(name)
+
+        self.path = Path(path)
+        self.window = window
+        self._offsets = array("q")
+        self._recent: deque[Frame] = deque(maxlen=window)
+        self._size = 0
+
+        if resume and self.path.exists():
+            self._index()
+
+        self._writer = open(self.path, "ab" if resume else "wb")  # noqa: SIM115
+        self._reader = open(self.path, "rb")  # noqa: SIM115
+        self._finalizer = weakref.finalize(
+            self, _close_files, [self._writer, self._reader], temporary
+        )
+
+    def _index(self) -> None:
+        """Record the offset of every complete frame already in the journal."""
+        recent: deque[bytes] = deque(maxlen=self.window)
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self._offsets.append(offset)
+                recent.append(line)
+                offset += len(line)
+            self._size = offset
+        # Drop a partially written trailing frame
+        if self._size != self.path.stat().st_size:
+            os.truncate(self.path, self._size)
+        self._recent.extend(_decode(line) for line in recent)
+
+    def append(self, frame: Frame) -> None:
+        """Write a frame to the journal and keep it in the window."""
+        data = _encode(frame)
+        self._writer.write(data)
+        self._writer.flush()
+        self._offsets.append(self._size)
+        self._size += len(data)
+        if self.window:
+            self._recent.append(frame)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _get(self, index: int) -> Frame:
+        first_recent = len(self._offsets) - len(self._recent)
+        if index >= first_recent:
+            return self._recent[index - first_recent]
+        return self._read(index)
+
+    def _read(self, index: int) -> Frame:
+        self._reader.seek(self._offsets[index])
+        return _decode(self._reader.readline())
+
+    def __iter__(self) -> Iterator[Frame]:
+        count = len(self._offsets)
+        with open(self.path, "rb") as f:
+            for _, line in zip(range(count), f, strict=False):
+                yield _decode(line)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the journal files have been closed."""
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Close the journal, deleting it if it was temporary."""
+        self._finalizer()
@@ -3,36 +3,167 @@
 from __future__ import annotations
 
 import time
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_serializer,
+    model_validator,
+)
 
+from terminal_state.capture.delta import DeltaFrameStore
+from terminal_state.capture.events import OutputEvent
 from terminal_state.capture.frame import Frame
+from terminal_state.capture.journal import JournalFrameStore
+from terminal_state.capture.store import FrameStore
+from terminal_state.models.config import SessionConfig
 
 
 class Recording(BaseModel):
-    """Collection of frames with timing."""
+    """Collection of frames with timing.
 
-    frames: list[Frame] = Field(default_factory=list)
+    With ``storage="delta"`` frames are kept in a :class:`DeltaFrameStore`;
+    ``frames`` still indexes and iterates as a list of :class:`Frame`.
+    With ``storage="journal"`` they are written to an append-only file at
+    ``journal_path`` (a temporary file if unset) and only the last
+    ``memory_window`` frames are kept in memory.
+
+    With ``dedupe`` on, a frame identical to the previous one is dropped and
+    only moves ``ended_at`` forward, so the previous frame stays on screen
+    until then.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    frames: list[Frame] | FrameStore = Field(default_factory=list)
+    events: list[OutputEvent] = Field(default_factory=list)
     started_at: float = Field(default_factory=time.time)
     width: int = 0
     height: int = 0
     title: str = ""
     environment: dict[str, str] = Field(default_factory=dict)
+    storage: Literal["list", "delta", "journal"] = "list"
+    keyframe_interval: int = Field(default=50, ge=1, description="Frames per keyframe (delta)")
+    journal_path: Path | None = Field(default=None, description="Journal file (journal)")
+    memory_window: int = Field(default=64, ge=0, description="Frames kept in memory (journal)")
+    dedupe: bool = Field(default=True, description="Merge identical consecutive frames")
+    ended_at: float | None = Field(default=None, description="Last time the screen was sampled")
+
+    _last_key: int | None = PrivateAttr(default=None)
+    _listeners: list[Callable[[Frame | OutputEvent], None]] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, context: Any) -> None:
+        if self.dedupe and self.frames:
+            self._last_key = self.frames[-1].content_hash
+
+    @classmethod
+    def from_config(cls, config: SessionConfig) -> Recording:
+        """Create an empty recording with a session's size and storage settings."""
+        return cls(
+            width=config.width,
+            height=config.height,
+            storage=config.storage,
+            keyframe_interval=config.keyframe_interval,
+            journal_path=config.journal_path,
+            memory_window=config.memory_window,
+            dedupe=config.dedupe_frames,
+        )
+
+    @model_validator(mode="after")
+    def _apply_storage(self) -> Recording:
+        if self.storage == "delta" and not isinstance(self.frames, DeltaFrameStore):
+            store: FrameStore = DeltaFrameStore(self.keyframe_interval)
+        elif self.storage == "journal" and not isinstance(self.frames, JournalFrameStore):
+            store = JournalFrameStore(self.journal_path, self.memory_window)
+        else:
+            return self
+
+        store.extend(self.frames)
+        self.frames = store
+        return self
+
+    @field_serializer("frames", "events")
+    def _serialize_sequence(self, items: Sequence[Any]) -> list[Any]:
+        # Stores and lazily read events serialize as plain lists
+        return list(items)
 
     def add_frame(self, frame: Frame) -> None:
-        """Add frame to recording."""
+        """Add frame to recording, merging it into the previous one if identical."""
         if not self.frames:
             self.width = frame.width
             self.height = frame.height
+
+        if self.dedupe:
+            key = frame.content_hash
+            if key == self._last_key and self.frames:
+                self.ended_at = frame.timestamp
+                return
+            self._last_key = key
+
         self.frames.append(frame)
+        self.ended_at = frame.timestamp
+        for listener in self._listeners:
+            listener(frame)
+
+    def add_event(self, event: OutputEvent) -> None:
+        """Add streamed output event to recording."""
+        self.events.append(event)
+        for listener in self._listeners:
+            listener(event)
+
+    def subscribe(self, callback: Callable[[Frame | OutputEvent], None]) -> None:
+        """Call ``callback`` with every frame and event added from now on."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Frame | OutputEvent], None]) -> None:
+        """Stop calling ``callback``."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
 
     @property
     def duration(self) -> float:
         """Total duration in seconds."""
-        if not self.frames:
+        ends = [item[-1].timestamp for item in (self.frames, self.events) if item]
+        if self.ended_at is not None:
+            ends.append(self.ended_at)
+        if not ends:
             return 0.0
-        return self.frames[-1].timestamp - self.started_at
+        return max(ends) - self.started_at
+
+    def frame_at(self, seconds: float) -> Frame | None:
+        """Frame on screen ``seconds`` after the recording started."""
+        timestamp = self.started_at + seconds
+        if isinstance(self.frames, FrameStore):
+            index = self.frames.index_at(timestamp)
+        else:
+            index = bisect_right(self.frames, timestamp, key=lambda frame: frame.timestamp) - 1
+        return self.frames[index] if index >= 0 else None
+
+    @classmethod
+    def from_asciinema(cls, path: Path | str, emulate: bool = False) -> Recording:
+        """Open an asciicast v2 file lazily; ``emulate`` rebuilds frames with pyte."""
+        from terminal_state.capture.cast import read_asciinema
+
+        return read_asciinema(path, emulate=emulate)
+
+    def save(self, path: Path | str) -> None:
+        """Save to an indexed binary archive, reopened with :meth:`load`."""
+        from terminal_state.capture.archive import write_archive
+
+        write_archive(self, path)
+
+    @classmethod
+    def load(cls, path: Path | str) -> Recording:
+        """Open an archive written by :meth:`save`; frames are read on demand."""
+        from terminal_state.capture.archive import read_archive
+
+        return read_archive(path)
 
     def to_asciinema(self, path: Path | str) -> None:
         """Export to asciinema format."""
@@ -41,11 +172,18 @@ class Recording(BaseModel):
         exporter = AsciinemaExporter()
         exporter.export(self, Path(path))
 
-    def to_gif(self, path: Path | str, fps: int = 10) -> None:
-        """Export to animated GIF."""
+    def to_gif(self, path: Path | str, fps: int = 10, idle_time_limit: float | None = None) -> None:
+        """Export to animated GIF, paced by frame timestamps."""
         from terminal_state.export.gif import GifExporter
 
-        exporter = GifExporter(fps=fps)
+        exporter = GifExporter(fps=fps, idle_time_limit=idle_time_limit)
+        exporter.export(self, Path(path))
+
+    def to_svg(self, path: Path | str, fps: int = 10, idle_time_limit: float | None = None) -> None:
+        """Export to animated SVG, or HTML for ``.html`` paths."""
+        from terminal_state.export.svg import SvgExporter
+
+        exporter = SvgExporter(fps=fps, idle_time_limit=idle_time_limit)
         exporter.export(self, Path(path))
 
     def to_screenshot(self, path: Path | str, frame_index: int = -1) -> None:
@@ -0,0 +1,284 @@
+"""SGR (Select Graphic Rendition) escapes: parsing to styled runs and back."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, NamedTuple
+
+# Attribute bits
+BOLD = 1
+DIM = 2
+ITALIC = 4
+UNDERLINE = 8
+BLINK = 16
+REVERSE = 32
+HIDDEN = 64
+STRIKE = 128
+
+# Colors are ints: 0 is the terminal default, 1-256 a palette index plus
+# one, and values with bit 24 set a 24-bit RGB color.
+DEFAULT_COLOR = 0
+RGB_FLAG = 1 << 24
+
+
+def palette_color(index: int) -> int:
+    """Encode an xterm palette index (0-255)."""
+    return index + 1
+
+
+def rgb_color(r: int, g: int, b: int) -> int:
+    """Encode a 24-bit color."""
+    return RGB_FLAG | (r << 16) | (g << 8) | b
+
+
+def decode_color(value: int) -> int | tuple[int, int, int] | None:
+    """Palette index, RGB triple, or None for the default color."""
+    if value == DEFAULT_COLOR:
+        return None
+    if value & RGB_FLAG:
+        return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+    return value - 1
+
+
+class Style(NamedTuple):
+    """Colors and attribute bits of a run of cells."""
+
+    fg: int = DEFAULT_COLOR
+    bg: int = DEFAULT_COLOR
+    attrs: int = 0
+
+
+DEFAULT_STYLE = Style()
+
+
+class Run(NamedTuple):
+    """Text drawn in one style."""
+
+    text: str
+    style: Style
+
+
+StyledLine = tuple[Run, ...]
+
+_SGR = re.compile(r"\x1b\[([0-9;:]*)m")
+# Set and reset codes for single attributes
+_ATTR_ON = {1: BOLD, 2: DIM, 3: ITALIC, 4: UNDERLINE, 5: BLINK, 6: BLINK, 7: REVERSE}
+_ATTR_ON |= {8: HIDDEN, 9: STRIKE, 21: UNDERLINE}
+_ATTR_OFF = {22: BOLD | DIM, 23: ITALIC, 24: UNDERLINE, 25: BLINK, 27: REVERSE}
+_ATTR_OFF |= {28: HIDDEN, 29: STRIKE}
+
+# (style, parameters) -> style; terminal output repeats a handful of changes
+_transitions: dict[tuple[Style, str], Style] = {}
+_MAX_TRANSITIONS = 4096
+
+
+def _extended_color(params: list[list[str]], i: int) -> tuple[int, int]:
+    """Color of a 38/48 code at ``params[i]`` and the index after it."""
+    head = params[i]
+    if len(head) > 1:
+        # Colon form: 38:5:n or 38:2:[colorspace:]r:g:b
+        values = [int(v) if v else 0 for v in head[1:]]
+        if values[0] == 5 and len(values) >= 2:
+            return palette_color(values[1] & 0xFF), i + 1
+        if values[0] == 2 and len(values) >= 4:
+            r, g, b = values[-3:]
+            return rgb_color(r & 0xFF, g & 0xFF, b & 0xFF), i + 1
+        return DEFAULT_COLOR, i + 1
+
+    rest = [int(p[0]) if p[0] else 0 for p in params[i + 1 : i + 5]]
+    if rest[:1] == [5] and len(rest) >= 2:
+        return palette_color(rest[1] & 0xFF), i + 3
+    if rest[:1] == [2] and len(rest) >= 4:
+        r, g, b = rest[1:4]
+        return rgb_color(r & 0xFF, g & 0xFF, b & 0xFF), i + 5
+    return DEFAULT_COLOR, len(params)
+
+
+def apply_sgr(style: Style, parameters: str) -> Style:
+    """Style after an SGR sequence with ``parameters`` (the text between ``[`` and ``m``)."""
+    key = (style, parameters)
+    cached = _transitions.get(key)
+    if cached is not None:
+        return cached
+
+    fg, bg, attrs = style
+    params = [part.split(":") for part in parameters.split(";")]
+    i = 0
+    while i < len(params):
+        code = int(params[i][0]) if params[i][0] else 0
+        if code == 0:
+            fg, bg, attrs = DEFAULT_COLOR, DEFAULT_COLOR, 0
+        elif code == 4 and len(params[i]) > 1 and params[i][1] == "0":
+            attrs &= ~UNDERLINE
+        elif code in _ATTR_ON:
+            attrs |= _ATTR_ON[code]
+        elif code in _ATTR_OFF:
+            attrs &= ~_ATTR_OFF[code]
+        elif 30 <= code <= 37:
+            fg = palette_color(code - 30)
+        elif 90 <= code <= 97:
+            fg = palette_color(code - 90 + 8)
+        elif 40 <= code <= 47:
+            bg = palette_color(code - 40)
+        elif 100 <= code <= 107:
+            bg = palette_color(code - 100 + 8)
+        elif code == 39:
+            fg = DEFAULT_COLOR
+        elif code == 49:
+            bg = DEFAULT_COLOR
+        elif code in (38, 48):
+            color, i = _extended_color(params, i)
+            if code == 38:
+                fg = color
+            else:
+                bg = color
+            continue
+        i += 1
+
+    result = Style(fg, bg, attrs)
+    if len(_transitions) >= _MAX_TRANSITIONS:
+        _transitions.clear()
+    _transitions[key] = result
+    return result
+
+
+def parse_styled(text: str) -> tuple[StyledLine, ...]:
+    """Split escaped terminal text into lines of styled runs, in one pass.
+
+    SGR state carries over from line to line as it does on a terminal;
+    escape sequences other than SGR are dropped.
+    """
+    from terminal_state.capture.frame import ANSI_ESCAPE
+
+    lines: list[StyledLine] = []
+    style = DEFAULT_STYLE
+    for line in text.split("\n"):
+        if "\x1b" not in line:
+            lines.append((Run(line, style),) if line else ())
+            continue
+
+        runs: list[Run] = []
+        parts = _SGR.split(line)
+        for index, part in enumerate(parts):
+            if index % 2:
+                style = apply_sgr(style, part)
+                continue
+            if "\x1b" in part:
+                part = ANSI_ESCAPE.sub("", part)
+            if not part:
+                continue
+            if runs and runs[-1].style == style:
+                runs[-1] = Run(runs[-1].text + part, style)
+            else:
+                runs.append(Run(part, style))
+        lines.append(tuple(runs))
+    return tuple(lines)
+
+
+def line_text(line: StyledLine) -> str:
+    """Plain text of a styled line."""
+    return "".join(run.text for run in line)
+
+
+def plain_text(lines: tuple[StyledLine, ...]) -> str:
+    """Plain text of styled lines, one per line."""
+    return "\n".join(line_text(line) for line in lines)
+
+
+def _color_codes(value: int, base: int) -> str:
+    color = decode_color(value)
+    if color is None:
+        return ""
+    if isinstance(color, tuple):
+        return f";{base + 8};2;{color[0]};{color[1]};{color[2]}"
+    if color < 8:
+        return f";{base + color}"
+    if color < 16:
+        return f";{base + 60 + color - 8}"
+    return f";{base + 8};5;{color}"
+
+
+_ATTR_CODES = ((BOLD, 1), (DIM, 2), (ITALIC, 3), (UNDERLINE, 4), (BLINK, 5))
+_ATTR_CODES += ((REVERSE, 7), (HIDDEN, 8), (STRIKE, 9))
+
+
+def sgr(style: Style) -> str:
+    """Escape sequence that sets exactly ``style``, starting from a reset."""
+    codes = "".join(f";{code}" for bit, code in _ATTR_CODES if style.attrs & bit)
+    codes += _color_codes(style.fg, 30) + _color_codes(style.bg, 40)
+    return f"\x1b[0{codes}m"
+
+
+def render_line(line: StyledLine) -> str:
+    """Escaped text of a styled line that does not depend on earlier state."""
+    parts = []
+    style = DEFAULT_STYLE
+    for run in line:
+        if run.style != style:
+            parts.append(sgr(run.style))
+            style = run.style
+        parts.append(run.text)
+    if style != DEFAULT_STYLE:
+        parts.append("\x1b[0m")
+    return "".join(parts)
+
+
+_PYTE_NAMES = ("black", "red", "green", "brown", "blue", "magenta", "cyan", "white")
+_PYTE_COLORS = {name: palette_color(i) for i, name in enumerate(_PYTE_NAMES)}
+_PYTE_COLORS |= {f"bright{name}": palette_color(i + 8) for i, name in enumerate(_PYTE_NAMES)}
+
+
+def pyte_color(name: str) -> int:
+    """Encode a ``pyte`` color name or hex string."""
+    if name in _PYTE_COLORS:
+        return _PYTE_COLORS[name]
+    if name == "default":
+        return DEFAULT_COLOR
+    try:
+        return RGB_FLAG | int(name, 16)
+    except ValueError:
+        return DEFAULT_COLOR
+
+
+def pyte_style(char: Any) -> Style:
+    """Style of a ``pyte`` screen character."""
+    attrs = (
+        BOLD * char.bold
+        | ITALIC * char.italics
+        | UNDERLINE * char.underscore
+        | BLINK * char.blink
+        | REVERSE * char.reverse
+        | STRIKE * char.strikethrough
+    )
+    return Style(pyte_color(char.fg), pyte_color(char.bg), attrs)
+
+
+def styled_screen(screen: Any) -> tuple[StyledLine, ...]:
+    """Styled rows of a ``pyte`` screen, without trailing spaces as capture-pane."""
+    lines = []
+    for row in range(screen.lines):
+        buffer = screen.buffer[row]
+        runs: list[Run] = []
+        text: list[str] = []
+        style = DEFAULT_STYLE
+        for column in range(screen.columns):
+            char = buffer[column]
+            if not char.data:
+                continue  # right half of a wide character
+            char_style = pyte_style(char)
+            if char_style != style and text:
+                runs.append(Run("".join(text), style))
+                text = []
+            style = char_style
+            text.append(char.data)
+        if text:
+            runs.append(Run("".join(text), style))
+
+        while runs:
+            stripped = runs[-1].text.rstrip(" ")
+            if stripped:
+                runs[-1] = Run(stripped, runs[-1].style)
+                break
+            runs.pop()
+        lines.append(tuple(runs))
+    return tuple(lines)
@@ -0,0 +1,67 @@
+"""Frame storage backends for recordings."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+from terminal_state.capture.frame import Frame
+
+
+class FrameStore(Sequence[Frame]):
+    """Append-only frame sequence that may keep frames in a compact form.
+
+    Stores behave like a read-only list of :class:`Frame` plus ``append``;
+    frames are materialized on access, so callers never see the encoding.
+    """
+
+    @abstractmethod
+    def append(self, frame: Frame) -> None:
+        """Add a frame to the end of the store."""
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def _get(self, index: int) -> Frame:
+        """Materialize the frame at a non-negative, in-range index."""
+
+    def extend(self, frames: Iterable[Frame]) -> None:
+        """Append several frames."""
+        for frame in frames:
+            self.append(frame)
+
+    @overload
+    def __getitem__(self, index: int) -> Frame: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Frame]: ...
+
+    def __getitem__(self, index: int | slice) -> Frame | list[Frame]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("frame index out of range")
+        return self._get(index)
+
+    def index_at(self, timestamp: float) -> int:
+        """Index of the last frame at or before ``timestamp``, or -1."""
+        return bisect_right(self, timestamp, key=lambda frame: frame.timestamp) - 1
+
+    def __iter__(self) -> Iterator[Frame]:
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} frames>)"
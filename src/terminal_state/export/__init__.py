@@ -1,12 +1,16 @@
 """Export module for various output formats."""
 
-from terminal_state.export.asciinema import AsciinemaExporter
+from terminal_state.export.asciinema import AsciinemaExporter, AsciinemaWriter
 from terminal_state.export.gif import GifConfig, GifExporter
 from terminal_state.export.screenshot import ScreenshotExporter
+from terminal_state.export.svg import SvgConfig, SvgExporter
 
 __all__ = [
     "AsciinemaExporter",
+    "AsciinemaWriter",
     "GifExporter",
     "GifConfig",
     "ScreenshotExporter",
+    "SvgConfig",
+    "SvgExporter",
 ]
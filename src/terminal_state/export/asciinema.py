@@ -3,9 +3,149 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
+from types import TracebackType
+from typing import IO, Self
 
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import Frame
 from terminal_state.capture.recorder import Recording
+from terminal_state.capture.sgr import render_line
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+def screen_diff(previous: tuple[str, ...] | None, lines: tuple[str, ...]) -> str:
+    """Escape sequences that turn the ``previous`` screen into ``lines``.
+
+    Each changed row is rewritten in place: move the cursor to the start of
+    the row, print the new text and erase whatever is left of the old. With
+    no previous screen the display is cleared and every non-empty row drawn.
+    """
+    parts = []
+    if previous is None:
+        parts.append(CLEAR_SCREEN)
+        for row, line in enumerate(lines, 1):
+            if line:
+                parts.append(f"\x1b[{row};1H{line}")
+        return "".join(parts)
+
+    for row in range(max(len(previous), len(lines))):
+        line = lines[row] if row < len(lines) else ""
+        old = previous[row] if row < len(previous) else ""
+        if line != old:
+            parts.append(f"\x1b[{row + 1};1H{line}\x1b[K")
+    return "".join(parts)
+
+
+class AsciinemaWriter:
+    """Writes an asciicast incrementally, flushing after every event.
+
+    Frames are written as the difference from the previous frame (or as
+    full screens with ``diff=False``), in color when they carry escapes;
+    streamed output events verbatim.
+    While attached to a recording the file can be tailed as it grows.
+    """
+
+    def __init__(self, recording: Recording, path: Path | str, diff: bool = True) -> None:
+        self.recording = recording
+        self.path = Path(path)
+        self.diff = diff
+        self._file: IO[str] = open(self.path, "w")  # noqa: SIM115
+        self._lock = threading.Lock()
+        self._screen: tuple[str, ...] | None = None
+        self._size: tuple[int, int] | None = None
+        self._last_frame_at: float | None = None
+        self._last_item: Frame | OutputEvent | None = None
+        self._attached = False
+
+        header = {
+            "version": 2,
+            "width": recording.width,
+            "height": recording.height,
+            "timestamp": int(recording.started_at),
+            "title": recording.title or "Terminal Recording",
+            "env": recording.environment or {"TERM": "xterm-256color"},
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self._file.flush()
+
+    def attach(self) -> None:
+        """Write what the recording holds so far, then follow new frames and events."""
+        with self._lock:
+            self._attached = True
+            self.recording.subscribe(self.write)
+            # Streamed output already describes the screen; frames would repeat it
+            recording = self.recording
+            for item in list(recording.events) if recording.events else recording.frames:
+                self._write(item)
+
+    def write(self, item: Frame | OutputEvent) -> None:
+        """Write one frame or output event."""
+        with self._lock:
+            self._write(item)
+
+    def _write(self, item: Frame | OutputEvent) -> None:
+        # Drop repeats and anything older than what was written: an item can be
+        # both in the backlog and delivered to the subscription while attaching
+        if self._file.closed or item is self._last_item:
+            return
+        if self._last_item is not None and item.timestamp < self._last_item.timestamp:
+            return
+        self._last_item = item
+
+        if isinstance(item, OutputEvent):
+            self._event(item.timestamp, item.data)
+            return
+
+        if item.ansi_data is not None:
+            # Colored rows, each self-contained so any one can be rewritten alone
+            lines = tuple(render_line(line) for line in item.styled_lines[: item.height])
+        else:
+            lines = item.lines[: item.height]
+        size = (item.width, item.height)
+        if not self.diff:
+            data = item.content if item.ansi_data is None else "\n".join(lines)
+        elif size != self._size:
+            data = screen_diff(None, lines)
+        else:
+            data = screen_diff(self._screen, lines)
+        self._screen, self._size = lines, size
+        self._last_frame_at = item.timestamp
+        self._event(item.timestamp, data)
+
+    def _event(self, timestamp: float, data: str) -> None:
+        event = [timestamp - self.recording.started_at, "o", data]
+        self._file.write(json.dumps(event) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Stop following the recording and finish the file."""
+        if self._attached:
+            self.recording.unsubscribe(self.write)
+            self._attached = False
+
+        with self._lock:
+            if self._file.closed:
+                return
+            # Hold the final screen for as long as it was observed
+            ended_at = self.recording.ended_at
+            last = self._last_frame_at
+            if last is not None and ended_at is not None and ended_at > last:
+                self._event(ended_at, "")
+            self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
 
 
 class AsciinemaExporter:
@@ -14,22 +154,22 @@ class AsciinemaExporter:
     Format spec: https://docs.asciinema.org/manual/asciicast/v2/
     """
 
+    def __init__(self, diff: bool = True) -> None:
+        self.diff = diff
+
     def export(self, recording: Recording, path: Path) -> None:
         """Export recording to asciinema format."""
-        with open(path, "w") as f:
-            # Header
-            header = {
-                "version": 2,
-                "width": recording.width,
-                "height": recording.height,
-                "timestamp": int(recording.started_at),
-                "title": recording.title or "Terminal Recording",
-                "env": recording.environment or {"TERM": "xterm-256color"},
-            }
-            f.write(json.dumps(header) + "\n")
-
-            # Events
-            for frame in recording.frames:
-                timestamp = frame.timestamp - recording.started_at
-                event = [timestamp, "o", frame.content]
-                f.write(json.dumps(event) + "\n")
+        with AsciinemaWriter(recording, path, diff=self.diff) as writer:
+            # Streamed output is replayed verbatim with its original timing
+            items = recording.events if recording.events else recording.frames
+            for item in items:
+                writer.write(item)
+
+    def live(self, recording: Recording, path: Path | str) -> AsciinemaWriter:
+        """Start writing ``recording`` to ``path`` as it is captured.
+
+        Close the returned writer (or use it as a context manager) when done.
+        """
+        writer = AsciinemaWriter(recording, path, diff=self.diff)
+        writer.attach()
+        return writer
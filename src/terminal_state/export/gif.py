@@ -2,20 +2,48 @@
 
 from __future__ import annotations
 
-import re
+import itertools
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import IO, Literal
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import GifImagePlugin, Image
 from pydantic import BaseModel, Field
 
 from terminal_state.capture.frame import Frame
 from terminal_state.capture.recorder import Recording
+from terminal_state.capture.sgr import StyledLine, line_text
+from terminal_state.export.glyphs import GlyphAtlas, atlas_for, cell_width
+
+Box = tuple[int, int, int, int]
+
+# GIF delays are unsigned 16-bit centiseconds
+MAX_DELAY = 655350
+
+
+def worker_count(workers: int) -> int:
+    """Number of processes to use; 0 means one per core."""
+    return workers or os.cpu_count() or 1
 
 
 class GifConfig(BaseModel):
     """Configuration for GIF export."""
 
     fps: int = Field(default=10, ge=1, le=60)
+    timing: Literal["timestamps", "fixed"] = Field(
+        default="timestamps",
+        description="Pace frames by their timestamps, or show each for 1/fps seconds",
+    )
+    idle_time_limit: float | None = Field(
+        default=None, gt=0, description="Longest pause kept between frames, in seconds"
+    )
+    palette: Literal["fixed", "adaptive"] = Field(
+        default="fixed",
+        description="Draw against the xterm palette, or quantize each frame's colors",
+    )
+    workers: int = Field(default=1, ge=0, description="Render processes; 0 uses every core")
+    chunk_size: int = Field(default=64, ge=1, description="Frames per task when parallel")
     font_path: str = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
     font_size: int = 14
     bg_color: tuple[int, int, int] = (0, 0, 0)
@@ -24,52 +52,298 @@ class GifConfig(BaseModel):
     char_height: int = 18
 
 
+def frame_timings(
+    frames: Iterable[Frame],
+    fps: int,
+    idle_time_limit: float | None = None,
+    ended_at: float | None = None,
+) -> Iterator[tuple[Frame, int]]:
+    """Pair frames with display durations in milliseconds taken from their timestamps.
+
+    Time is divided into ticks of ``1 / fps`` seconds and each frame starts
+    at the tick it was captured in; when several frames share a tick only
+    the last is shown. Pauses longer than ``idle_time_limit`` are shortened
+    to it. The last frame is held until ``ended_at``, or for one tick.
+    """
+
+    def boundary(tick: int) -> int:
+        # GIF delays are centiseconds; rounding tick edges keeps the total exact
+        return round(tick * 100 / fps) * 10
+
+    def gap(start: float, end: float) -> float:
+        seconds = max(end - start, 0.0)
+        return seconds if idle_time_limit is None else min(seconds, idle_time_limit)
+
+    pending: Frame | None = None
+    pending_tick = 0
+    elapsed = 0.0
+    for frame in frames:
+        if pending is not None:
+            elapsed += gap(pending.timestamp, frame.timestamp)
+        tick = int(elapsed * fps + 1e-9)
+        if pending is not None and tick > pending_tick:
+            yield pending, boundary(tick) - boundary(pending_tick)
+            pending_tick = tick
+        pending = frame
+
+    if pending is None:
+        return
+    end_tick = pending_tick + 1
+    if ended_at is not None:
+        end_tick = max(end_tick, int((elapsed + gap(pending.timestamp, ended_at)) * fps + 1e-9))
+    yield pending, boundary(end_tick) - boundary(pending_tick)
+
+
+def changed_cells(old: str, new: str) -> tuple[int, int] | None:
+    """Cell columns ``(start, end)`` where ``new`` differs from ``old``, or None."""
+    if old == new:
+        return None
+    prefix = 0
+    for a, b in zip(old, new, strict=False):
+        if a != b:
+            break
+        prefix += 1
+    start = sum(cell_width(char) for char in new[:prefix])
+    old_cells = sum(cell_width(char) for char in old)
+    new_cells = start + sum(cell_width(char) for char in new[prefix:])
+    if old_cells != new_cells:
+        return start, max(old_cells, new_cells)
+
+    # Same width: the change ends where the common suffix begins
+    suffix = 0
+    limit = min(len(old), len(new)) - prefix
+    while suffix < limit and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    end = new_cells - sum(cell_width(char) for char in new[len(new) - suffix :])
+    return start, max(end, start + 1)
+
+
+def screen_lines(frame: Frame) -> list[str] | list[str | StyledLine]:
+    """Rows of ``frame`` padded to its height: styled runs if it carries escapes."""
+    lines: list[str] | list[str | StyledLine]
+    if frame.ansi_data is not None or "\x1b" in frame.content:
+        lines = list(frame.styled_lines[: frame.height])
+        lines += [()] * (frame.height - len(lines))
+    else:
+        lines = frame.text.split("\n")[: frame.height]
+        lines += [""] * (frame.height - len(lines))
+    return lines
+
+
+def _changed_row(old: str | StyledLine, new: str | StyledLine) -> tuple[int, int] | None:
+    if isinstance(old, str) and isinstance(new, str):
+        return changed_cells(old, new)
+    if old == new:
+        return None
+    # A style can change anywhere along a styled row; redraw all of it
+    widths = [
+        sum(cell_width(char) for char in (line if isinstance(line, str) else line_text(line)))
+        for line in (old, new)
+    ]
+    return 0, max(*widths, 1)
+
+
+class FrameRenderer:
+    """Renders consecutive frames onto one canvas, redrawing changed rows only.
+
+    ``render`` returns the pixel box that changed since the previous frame
+    together with a copy of that region, ready to be stored as a GIF
+    sub-rectangle.
+    """
+
+    def __init__(
+        self, atlas: GlyphAtlas, fg: tuple[int, int, int], bg: tuple[int, int, int]
+    ) -> None:
+        self.atlas = atlas
+        self.fg = fg
+        self.bg = bg
+        self.image: Image.Image | None = None
+        self._lines: list[str] | list[str | StyledLine] = []
+        self._size: tuple[int, int] | None = None
+
+    def render(self, frame: Frame) -> tuple[Image.Image, Box] | None:
+        """Draw ``frame`` and return the changed region, or None if nothing changed."""
+        lines = screen_lines(frame)
+        cw, ch = self.atlas.char_width, self.atlas.char_height
+
+        if self.image is None or self._size != (frame.width, frame.height):
+            self.image = self.atlas.render(lines, frame.width, frame.height, self.fg, self.bg)
+            self._lines, self._size = lines, (frame.width, frame.height)
+            return self.image.copy(), (0, 0, *self.image.size)
+
+        image = self.image
+        top = left = bottom = right = -1
+        for y, (old, new) in enumerate(zip(self._lines, lines, strict=True)):
+            cells = _changed_row(old, new)
+            if cells is None:
+                continue
+            row_box = (0, y * ch, image.width, (y + 1) * ch)
+            image.paste(self.atlas.ink(self.bg), row_box)
+            if new and not (isinstance(new, str) and new.isspace()):
+                image.paste(self.atlas.row(new, self.fg, self.bg), row_box[:2])
+            if top < 0:
+                top, left, right = y, cells[0], cells[1]
+            left, right, bottom = min(left, cells[0]), max(right, cells[1]), y + 1
+        self._lines = lines
+
+        if top < 0 or left * cw >= image.width:
+            return None
+        box = (left * cw, top * ch, min(right * cw, image.width), bottom * ch)
+        return image.crop(box), box
+
+
+class GifWriter:
+    """Encodes GIF frames one at a time as sub-rectangles of the canvas.
+
+    Each region is stored at its offset over the previous frame, so
+    unchanged pixels cost nothing. Palette-mode regions sharing the first
+    frame's palette are written as they are; anything else is quantized
+    on its own and carries a local color table. Repeated frames only
+    extend the duration of the frame before them; a hold longer than a
+    GIF delay can express continues in single-pixel frames that change
+    nothing.
+    """
+
+    def __init__(self, fp: IO[bytes], loop: int = 0) -> None:
+        self.fp = fp
+        self.loop = loop
+        self.frames = 0
+        self.size: tuple[int, int] | None = None
+        self.palette: bytes | None = None
+        self._pending: tuple[Image.Image, tuple[int, int], int] | None = None
+
+    def add(self, region: Image.Image | None, box: Box | None, duration: int) -> None:
+        """Queue a frame; ``region`` is the part at ``box`` that changed, or None."""
+        if region is None or box is None:
+            if self._pending is None:
+                raise ValueError("The first frame must cover the whole canvas")
+            image, offset, previous = self._pending
+            self._pending = (image, offset, previous + duration)
+            return
+        if self.size is None:
+            self.size = region.size
+        elif box[2] > self.size[0] or box[3] > self.size[1]:
+            # The canvas keeps the first frame's size
+            box = (box[0], box[1], min(box[2], self.size[0]), min(box[3], self.size[1]))
+            if box[0] >= box[2] or box[1] >= box[3]:
+                self.add(None, None, duration)
+                return
+            region = region.crop((0, 0, box[2] - box[0], box[3] - box[1]))
+        self._flush()
+        image = region
+        if region.mode != "P":
+            image = region.convert("P", palette=Image.Palette.ADAPTIVE)
+        self._pending = (image, box[:2], duration)
+
+    def _flush(self) -> None:
+        # getheader and getdata are Pillow internals; the public save() path
+        # holds every frame in memory. The pin in pyproject covers them.
+        if self._pending is None:
+            return
+        image, offset, duration = self._pending
+        self._pending = None
+        palette = image.palette.tobytes() if image.palette is not None else None
+        if self.frames == 0:
+            header, _ = GifImagePlugin.getheader(image, info={"loop": self.loop})
+            self.fp.write(b"".join(header))
+            self.palette = palette
+        local = palette != self.palette
+        hold = min(duration, MAX_DELAY)
+        self._write(image, offset, hold, local)
+        # Repeat the top-left pixel, which is already on the canvas
+        pixel = image.crop((0, 0, 1, 1))
+        while duration > hold:
+            duration -= hold
+            hold = min(duration, MAX_DELAY)
+            self._write(pixel, offset, hold, local)
+
+    def _write(
+        self, image: Image.Image, offset: tuple[int, int], duration: int, local: bool
+    ) -> None:
+        data = GifImagePlugin.getdata(image, offset, duration=duration, include_color_table=local)
+        self.fp.write(b"".join(data))
+        self.frames += 1
+
+    def close(self) -> None:
+        """Write the last frame and the trailer."""
+        self._flush()
+        self.fp.write(b";")
+
+
 class GifExporter:
-    """Export recordings to animated GIF."""
+    """Export recordings to animated GIF.
+
+    Frames are composed from a glyph atlas shared by every exporter with
+    the same font and cell size, so each glyph is rasterized only once.
+    """
 
     def __init__(self, config: GifConfig | None = None, **kwargs: object) -> None:
         self.config = config or GifConfig(**kwargs)  # type: ignore[arg-type]
-        try:
-            self.font = ImageFont.truetype(self.config.font_path, self.config.font_size)
-        except OSError:
-            self.font = ImageFont.load_default()
+        self.atlas = atlas_for(self.config)
+        self.font = self.atlas.font
 
-    def export(self, recording: Recording, path: Path) -> None:
+    def export(self, recording: Recording, path: Path | str | IO[bytes]) -> None:
         """Export recording as animated GIF."""
-        images = [self._render_frame(frame) for frame in recording.frames]
+        self.write(recording.frames, path, ended_at=recording.ended_at)
 
-        if not images:
+    def write(
+        self,
+        frames: Iterable[Frame],
+        path: Path | str | IO[bytes],
+        ended_at: float | None = None,
+    ) -> int:
+        """Render and encode ``frames`` one at a time, returning how many were drawn.
+
+        Only the current canvas and the last encoded region are held, so
+        memory stays constant however long the recording is. Each frame
+        after the first redraws and stores just the region that changed.
+        With ``timestamps`` timing, frames superseded within the same tick
+        are skipped and the last frame is held until ``ended_at``. With
+        several ``workers``, runs of frames are rendered in a process pool
+        and encoded in order as they come back.
+        """
+        frames = iter(frames)
+        first = next(frames, None)
+        if first is None:
             raise ValueError("No frames to export")
+        if isinstance(path, (str, Path)):
+            with open(path, "wb") as f:
+                return self.write(itertools.chain([first], frames), f, ended_at)
 
-        frame_duration = int(1000 / self.config.fps)
+        frames = itertools.chain([first], frames)
+        config = self.config
+        timed: Iterable[tuple[Frame, int]]
+        if config.timing == "timestamps":
+            timed = frame_timings(frames, config.fps, config.idle_time_limit, ended_at)
+        else:
+            timed = ((frame, int(1000 / config.fps)) for frame in frames)
 
-        images[0].save(
-            path,
-            save_all=True,
-            append_images=images[1:],
-            duration=frame_duration,
-            loop=0,
-            optimize=False,
-        )
+        updates: Iterable[tuple[tuple[Image.Image, Box] | None, int]]
+        workers = worker_count(config.workers)
+        if workers > 1:
+            from terminal_state.export.workers import render_parallel
+
+            updates = render_parallel(config, timed, workers, config.chunk_size)
+        else:
+            renderer = FrameRenderer(self.atlas, config.fg_color, config.bg_color)
+            updates = ((renderer.render(frame), duration) for frame, duration in timed)
+
+        writer = GifWriter(path)
+        count = 0
+        for update, frame_duration in updates:
+            region, box = update if update is not None else (None, None)
+            writer.add(region, box, frame_duration)
+            count += 1
+        writer.close()
+        return count
 
     def _render_frame(self, frame: Frame) -> Image.Image:
-        """Render single frame to image."""
-        img_width = frame.width * self.config.char_width
-        img_height = frame.height * self.config.char_height
-
-        image = Image.new("RGB", (img_width, img_height), self.config.bg_color)
-        draw = ImageDraw.Draw(image)
-
-        # Strip ANSI codes (simple version)
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        clean_content = ansi_escape.sub("", frame.content)
-
-        for y, line in enumerate(clean_content.split("\n")[: frame.height]):
-            draw.text(
-                (0, y * self.config.char_height),
-                line,
-                font=self.font,
-                fill=self.config.fg_color,
-            )
-
-        return image
+        """Render single frame to an RGB image."""
+        image = self.atlas.render(
+            screen_lines(frame),
+            frame.width,
+            frame.height,
+            self.config.fg_color,
+            self.config.bg_color,
+        )
+        return image.convert("RGB")
@@ -0,0 +1,191 @@
+"""Glyph atlas for composing terminal images from cached tiles."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageDraw, ImageFont
+
+from terminal_state.capture.cells import cell_width
+from terminal_state.capture.sgr import STRIKE, UNDERLINE, StyledLine
+from terminal_state.export.palette import Color, TerminalPalette, style_colors
+
+if TYPE_CHECKING:
+    from terminal_state.export.gif import GifConfig
+
+# Attributes drawn as lines through a glyph cell
+DECORATIONS = UNDERLINE | STRIKE
+
+
+class GlyphAtlas:
+    """Rasterizes each glyph once and composes rows by pasting tiles.
+
+    Tiles are keyed by character, colors and decorations; they and whole
+    rendered rows, plain or styled, are kept in bounded least-recently-used
+    caches since terminal rows repeat heavily from frame to frame. With a
+    ``palette`` everything is drawn in palette mode ("P") against that fixed
+    palette instead of in RGB.
+    """
+
+    def __init__(
+        self,
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+        char_width: int,
+        char_height: int,
+        max_rows: int = 1024,
+        palette: TerminalPalette | None = None,
+        max_glyphs: int = 4096,
+    ) -> None:
+        self.font = font
+        self.char_width = char_width
+        self.char_height = char_height
+        self.max_rows = max_rows
+        self.max_glyphs = max_glyphs
+        self.palette = palette
+        self.mode = "RGB" if palette is None else "P"
+        self._glyphs: OrderedDict[tuple[str, Color, Color, int], Image.Image] = OrderedDict()
+        self._rows: OrderedDict[tuple[object, Color, Color], Image.Image] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def glyph(self, char: str, fg: Color, bg: Color, decorations: int = 0) -> Image.Image:
+        """Tile for one character, one or two cells wide.
+
+        ``decorations`` are the ``UNDERLINE`` and ``STRIKE`` attribute bits.
+        """
+        key = (char, fg, bg, decorations)
+        with self._lock:
+            tile = self._glyphs.get(key)
+            if tile is not None:
+                self._glyphs.move_to_end(key)
+                return tile
+
+        size = (self.char_width * cell_width(char), self.char_height)
+        if self.palette is None:
+            tile = Image.new("RGB", size, bg)
+            self._draw_glyph(ImageDraw.Draw(tile), char, size, fg, decorations)
+        else:
+            # Draw coverage, then map it straight to palette indices
+            coverage = Image.new("L", size, 0)
+            self._draw_glyph(ImageDraw.Draw(coverage), char, size, 255, decorations)
+            tile = coverage.point(self.palette.coverage_table(fg, bg)).convert("P")
+            tile.putpalette(self.palette.data)
+
+        with self._lock:
+            self._glyphs[key] = tile
+            if len(self._glyphs) > self.max_glyphs:
+                self._glyphs.popitem(last=False)
+        return tile
+
+    def _draw_glyph(
+        self,
+        draw: ImageDraw.ImageDraw,
+        char: str,
+        size: tuple[int, int],
+        ink: Color | int,
+        decorations: int,
+    ) -> None:
+        draw.text((0, 0), char, font=self.font, fill=ink)
+        width, height = size
+        if decorations & UNDERLINE:
+            draw.line([(0, height - 2), (width - 1, height - 2)], fill=ink)
+        if decorations & STRIKE:
+            draw.line([(0, height // 2), (width - 1, height // 2)], fill=ink)
+
+    def ink(self, color: Color) -> int | Color:
+        """Pixel value of ``color`` in this atlas's image mode."""
+        return color if self.palette is None else self.palette.index(color)
+
+    def new_image(self, size: tuple[int, int], bg: Color) -> Image.Image:
+        """Blank image in this atlas's mode."""
+        image = Image.new(self.mode, size, self.ink(bg))
+        if self.palette is not None:
+            image.putpalette(self.palette.data)
+        return image
+
+    def row(self, line: str | StyledLine, fg: Color, bg: Color) -> Image.Image:
+        """Strip image of one line, plain or styled, on a grid of cells.
+
+        ``fg`` and ``bg`` are the default colors.
+        """
+        key = (line, fg, bg)
+        with self._lock:
+            strip = self._rows.get(key)
+            if strip is not None:
+                self._rows.move_to_end(key)
+                return strip
+
+        runs = [(line, fg, bg, 0)] if isinstance(line, str) else self._resolve(line, fg, bg)
+        width = sum(cell_width(char) for text, *_ in runs for char in text) * self.char_width
+        strip = self.new_image((max(width, 1), self.char_height), bg)
+        x = 0
+        for text, run_fg, run_bg, decorations in runs:
+            blank_visible = run_bg != bg or decorations
+            for char in text:
+                size = cell_width(char)
+                if blank_visible or not char.isspace():
+                    strip.paste(self.glyph(char, run_fg, run_bg, decorations), (x, 0))
+                x += size * self.char_width
+
+        with self._lock:
+            self._rows[key] = strip
+            if len(self._rows) > self.max_rows:
+                self._rows.popitem(last=False)
+        return strip
+
+    @staticmethod
+    def _resolve(line: StyledLine, fg: Color, bg: Color) -> list[tuple[str, Color, Color, int]]:
+        return [
+            (text, *style_colors(style, fg, bg), style.attrs & DECORATIONS) for text, style in line
+        ]
+
+    def render(
+        self,
+        lines: tuple[str | StyledLine, ...] | list[str] | list[str | StyledLine],
+        width: int,
+        height: int,
+        fg: Color,
+        bg: Color,
+    ) -> Image.Image:
+        """Image of a ``width`` x ``height`` cell screen showing ``lines``."""
+        image = self.new_image((width * self.char_width, height * self.char_height), bg)
+        for y, line in enumerate(lines[:height]):
+            if line and not (isinstance(line, str) and line.isspace()):
+                image.paste(self.row(line, fg, bg), (0, y * self.char_height))
+        return image
+
+
+def load_font(config: GifConfig) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """The configured font, or Pillow's default when it cannot be loaded."""
+    try:
+        return ImageFont.truetype(config.font_path, config.font_size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+_atlases: dict[tuple[object, ...], GlyphAtlas] = {}
+_atlases_lock = threading.Lock()
+
+
+def atlas_for(config: GifConfig) -> GlyphAtlas:
+    """Shared atlas for the font, cell size and palette of ``config``."""
+    key: tuple[object, ...] = (
+        config.font_path,
+        config.font_size,
+        config.char_width,
+        config.char_height,
+    )
+    if config.palette == "fixed":
+        key += (config.fg_color, config.bg_color)
+    with _atlases_lock:
+        atlas = _atlases.get(key)
+        if atlas is None:
+            palette = None
+            if config.palette == "fixed":
+                palette = TerminalPalette(config.fg_color, config.bg_color)
+            atlas = GlyphAtlas(
+                load_font(config), config.char_width, config.char_height, palette=palette
+            )
+            _atlases[key] = atlas
+        return atlas
@@ -0,0 +1,123 @@
+"""Fixed terminal palette for palette-mode rendering."""
+
+from __future__ import annotations
+
+from terminal_state.capture.sgr import BOLD, DIM, HIDDEN, REVERSE, Style, decode_color
+
+Color = tuple[int, int, int]
+
+
+def _xterm_colors() -> tuple[Color, ...]:
+    base = [
+        (0, 0, 0),
+        (205, 0, 0),
+        (0, 205, 0),
+        (205, 205, 0),
+        (0, 0, 238),
+        (205, 0, 205),
+        (0, 205, 205),
+        (229, 229, 229),
+        (127, 127, 127),
+        (255, 0, 0),
+        (0, 255, 0),
+        (255, 255, 0),
+        (92, 92, 255),
+        (255, 0, 255),
+        (0, 255, 255),
+        (255, 255, 255),
+    ]
+    steps = (0, 95, 135, 175, 215, 255)
+    cube = [(r, g, b) for r in steps for g in steps for b in steps]
+    grays = [(v, v, v) for v in range(8, 248, 10)]
+    return tuple(base + cube + grays)
+
+
+XTERM_COLORS = _xterm_colors()
+
+# Cube entries that repeat one of the 16 base colors, so they can be reused
+# without losing any xterm color: black, white, then bright red, green,
+# yellow, magenta and cyan
+_SPARE_SLOTS = (16, 231, 196, 46, 226, 201, 51)
+
+
+def style_colors(style: Style, fg: Color, bg: Color) -> tuple[Color, Color]:
+    """Foreground and background of ``style``, given the default colors."""
+    run_fg, run_bg = fg, bg
+    color = decode_color(style.fg)
+    if isinstance(color, int):
+        # Bold text in one of the eight base colors is shown bright
+        if style.attrs & BOLD and color < 8:
+            color += 8
+        run_fg = XTERM_COLORS[color]
+    elif color is not None:
+        run_fg = color
+    color = decode_color(style.bg)
+    if color is not None:
+        run_bg = XTERM_COLORS[color] if isinstance(color, int) else color
+
+    if style.attrs & DIM:
+        run_fg = _blend(run_fg, run_bg, 0.5)
+    if style.attrs & REVERSE:
+        run_fg, run_bg = run_bg, run_fg
+    if style.attrs & HIDDEN:
+        run_fg = run_bg
+    return run_fg, run_bg
+
+
+class TerminalPalette:
+    """The xterm-256 table with the default colors in its duplicate slots.
+
+    The default background and foreground take two duplicate entries and
+    the remaining five hold blends between them, which is enough to keep
+    antialiased default text smooth. Every frame can then share one global
+    palette, so nothing is quantized at encoding time.
+    """
+
+    def __init__(self, fg: Color, bg: Color) -> None:
+        self.fg = fg
+        self.bg = bg
+        colors = list(XTERM_COLORS)
+        self.bg_index, self.fg_index, *shade_slots = _SPARE_SLOTS
+        colors[self.bg_index] = bg
+        colors[self.fg_index] = fg
+        for step, slot in enumerate(shade_slots, 1):
+            weight = step / (len(shade_slots) + 1)
+            colors[slot] = _blend(fg, bg, weight)
+
+        self.colors = tuple(colors)
+        self.data = bytes(channel for color in colors for channel in color)
+        # Coverage levels from background to foreground
+        self._levels = (self.bg_index, *shade_slots, self.fg_index)
+        self._indices: dict[Color, int] = {}
+        for index in range(len(colors) - 1, -1, -1):
+            self._indices[colors[index]] = index
+        self._indices[bg] = self.bg_index
+        self._indices[fg] = self.fg_index
+
+    def index(self, color: Color) -> int:
+        """Palette index of ``color``, or of the nearest entry."""
+        index = self._indices.get(color)
+        if index is None:
+            index = min(
+                range(len(self.colors)),
+                key=lambda i: sum((a - b) ** 2 for a, b in zip(self.colors[i], color, strict=True)),
+            )
+            self._indices[color] = index
+        return index
+
+    def coverage_table(self, fg: Color, bg: Color) -> list[int]:
+        """Lookup table from glyph coverage (0-255) to palette indices.
+
+        The default colors get smooth edges from the blend entries; other
+        pairs are thresholded, as only the defaults have blends reserved.
+        """
+        if (fg, bg) == (self.fg, self.bg):
+            top = len(self._levels) - 1
+            return [self._levels[round(value * top / 255)] for value in range(256)]
+        fg_index, bg_index = self.index(fg), self.index(bg)
+        return [fg_index if value >= 128 else bg_index for value in range(256)]
+
+
+def _blend(fg: Color, bg: Color, weight: float) -> Color:
+    red, green, blue = (round(b + (f - b) * weight) for f, b in zip(fg, bg, strict=True))
+    return (red, green, blue)
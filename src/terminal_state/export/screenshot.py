@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 
 from terminal_state.capture.frame import Frame
-from terminal_state.export.gif import GifExporter
+from terminal_state.export.gif import GifExporter, worker_count
 
 
 class ScreenshotExporter:
@@ -18,3 +19,32 @@ class ScreenshotExporter:
         """Export frame as PNG image."""
         image = self.gif_exporter._render_frame(frame)
         image.save(path, format="PNG")
+
+    def export_frames(
+        self,
+        frames: Iterable[Frame],
+        directory: Path | str,
+        name: str = "frame-{index:05d}.png",
+        workers: int | None = None,
+    ) -> list[Path]:
+        """Export every frame as a PNG in ``directory``, named by ``name``.
+
+        ``workers`` defaults to the GIF config's setting; with more than one
+        the frames are rendered in a process pool.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        items = ((frame, directory / name.format(index=i)) for i, frame in enumerate(frames))
+
+        config = self.gif_exporter.config
+        count = worker_count(config.workers if workers is None else workers)
+        if count > 1:
+            from terminal_state.export.workers import save_pngs_parallel
+
+            return list(save_pngs_parallel(config, items, count))
+
+        paths = []
+        for frame, path in items:
+            self.export_frame(frame, path)
+            paths.append(path)
+        return paths
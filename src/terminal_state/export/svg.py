@@ -0,0 +1,270 @@
+"""Animated SVG and HTML export functionality."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Literal
+
+from pydantic import BaseModel, Field
+
+from terminal_state.capture.cells import cell_width, is_zero_width
+from terminal_state.capture.frame import Frame
+from terminal_state.capture.recorder import Recording
+from terminal_state.capture.sgr import BOLD, ITALIC, STRIKE, UNDERLINE, StyledLine
+from terminal_state.export.gif import frame_timings, screen_lines
+from terminal_state.export.palette import Color, style_colors
+
+# Control characters are not allowed in XML documents
+_XML_TEXT = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;"} | {chr(c): "" for c in range(32) if c != 9}
+)
+HTML_SUFFIXES = (".html", ".htm")
+
+
+class SvgConfig(BaseModel):
+    """Configuration for animated SVG export."""
+
+    fps: int = Field(default=10, ge=1, le=60)
+    timing: Literal["timestamps", "fixed"] = Field(
+        default="timestamps",
+        description="Pace frames by their timestamps, or show each for 1/fps seconds",
+    )
+    idle_time_limit: float | None = Field(
+        default=None, gt=0, description="Longest pause kept between frames, in seconds"
+    )
+    loop: bool = True
+    font_family: str = "'DejaVu Sans Mono', Menlo, Consolas, monospace"
+    font_size: int = 14
+    bg_color: tuple[int, int, int] = (0, 0, 0)
+    fg_color: tuple[int, int, int] = (200, 200, 200)
+    char_width: int = 9
+    char_height: int = 18
+
+
+def _hex(color: Color) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+def _segments(text: str) -> Iterator[tuple[str, int]]:
+    """Split ``text`` where it switches between narrow and wide characters.
+
+    Yields each piece with its width in cells; combining characters stay
+    with the character before them.
+    """
+    segment, cells, wide = "", 0, False
+    for char in text:
+        width = 0 if is_zero_width(char) else cell_width(char)
+        if width and cells and (width == 2) != wide:
+            yield segment, cells
+            segment, cells = "", 0
+        if width:
+            wide = width == 2
+        segment += char
+        cells += width
+    if segment:
+        yield segment, cells
+
+
+class SvgRows:
+    """Defines each distinct row once and hands out its id.
+
+    Rows are keyed by their text or styled runs, so a line that appears in
+    many frames, wherever it is on screen, is written a single time. Plain
+    and styled rows are laid out alike: every stretch of narrow or wide
+    characters starts at its cell column and is fitted to its cells with
+    ``textLength``, whatever the font's own advance.
+    """
+
+    def __init__(self, config: SvgConfig) -> None:
+        self.config = config
+        self.ids: dict[str | StyledLine, str] = {}
+        self._baseline = round(config.char_height * 0.78, 1)
+
+    def use(self, line: str | StyledLine, new: list[str]) -> str:
+        """Id of ``line``'s definition, appending it to ``new`` if it is the first use."""
+        row_id = self.ids.get(line)
+        if row_id is None:
+            row_id = self.ids[line] = f"r{len(self.ids)}"
+            new.append(self._define(row_id, line))
+        return row_id
+
+    def _place(self, column: int, cells: int) -> str:
+        """Attributes pinning text to ``cells`` cells from ``column``."""
+        char_width = self.config.char_width
+        if not cells:
+            return f' x="{column * char_width}"'
+        return (
+            f' x="{column * char_width}" textLength="{cells * char_width}"'
+            ' lengthAdjust="spacingAndGlyphs"'
+        )
+
+    def _spans(self, text: str, column: int, attributes: str, spans: list[str]) -> int:
+        """Append ``text`` as positioned ``<tspan>`` elements, returning its width in cells."""
+        start = column
+        for segment, cells in _segments(text):
+            placed = self._place(column, cells)
+            spans.append(f"<tspan{placed}{attributes}>{segment.translate(_XML_TEXT)}</tspan>")
+            column += cells
+        return column - start
+
+    def _define(self, row_id: str, line: str | StyledLine) -> str:
+        config = self.config
+        if isinstance(line, str):
+            segments = list(_segments(line))
+            if len(segments) == 1:
+                text, cells = segments[0]
+                placed = self._place(0, cells)
+                text = text.translate(_XML_TEXT)
+                return f'<text id="{row_id}" y="{self._baseline}"{placed}>{text}</text>'
+            spans: list[str] = []
+            self._spans(line, 0, "", spans)
+            return f'<text id="{row_id}" y="{self._baseline}">{"".join(spans)}</text>'
+
+        rects, spans = [], []
+        column = 0
+        for text, style in line:
+            fg, bg = style_colors(style, config.fg_color, config.bg_color)
+            attributes = ""
+            if fg != config.fg_color:
+                attributes += f' fill="{_hex(fg)}"'
+            if style.attrs & BOLD:
+                attributes += ' font-weight="bold"'
+            if style.attrs & ITALIC:
+                attributes += ' font-style="italic"'
+            decorations = [
+                name
+                for bit, name in ((UNDERLINE, "underline"), (STRIKE, "line-through"))
+                if style.attrs & bit
+            ]
+            if decorations:
+                attributes += f' text-decoration="{" ".join(decorations)}"'
+            cells = self._spans(text, column, attributes, spans)
+            if bg != config.bg_color:
+                x, width = column * config.char_width, cells * config.char_width
+                rects.append(
+                    f'<rect x="{x}" width="{width}" height="{config.char_height}" '
+                    f'fill="{_hex(bg)}"/>'
+                )
+            column += cells
+
+        text = f'<text y="{self._baseline}">{"".join(spans)}</text>'
+        return f'<g id="{row_id}">{"".join(rects)}{text}</g>'
+
+
+class SvgExporter:
+    """Export recording as one self-contained animated SVG or HTML file.
+
+    Frames are laid side by side on a strip that a CSS animation slides
+    past the visible screen. Each distinct row is defined once and frames
+    place it with ``<use>``, and a screen seen before reuses its earlier
+    place on the strip, so repeated content costs next to nothing. Text
+    stays vector and searchable; nothing is rasterized.
+    """
+
+    def __init__(self, config: SvgConfig | None = None, **kwargs: object) -> None:
+        self.config = config or SvgConfig(**kwargs)  # type: ignore[arg-type]
+
+    def export(self, recording: Recording, path: Path | str | IO[str]) -> None:
+        """Export recording as animated SVG, or as an HTML page for ``.html`` paths."""
+        html = isinstance(path, (str, Path)) and Path(path).suffix.lower() in HTML_SUFFIXES
+        self.write(recording.frames, path, ended_at=recording.ended_at, html=html)
+
+    def write(
+        self,
+        frames: Iterable[Frame],
+        path: Path | str | IO[str],
+        ended_at: float | None = None,
+        html: bool = False,
+    ) -> int:
+        """Write ``frames`` as they come, returning how many were shown.
+
+        Only the row definitions and the screens already placed are kept,
+        so the output is assembled in one pass. Timing follows the config
+        as for GIF export.
+        """
+        frames = iter(frames)
+        first = next(frames, None)
+        if first is None:
+            raise ValueError("No frames to export")
+        if isinstance(path, (str, Path)):
+            with open(path, "w", encoding="utf-8") as f:
+                return self.write(itertools.chain([first], frames), f, ended_at, html)
+
+        frames = itertools.chain([first], frames)
+        config = self.config
+        timed: Iterable[tuple[Frame, int]]
+        if config.timing == "timestamps":
+            timed = frame_timings(frames, config.fps, config.idle_time_limit, ended_at)
+        else:
+            timed = ((frame, int(1000 / config.fps)) for frame in frames)
+
+        width = first.width * config.char_width
+        height = first.height * config.char_height
+        fp = path
+        if html:
+            fp.write(
+                '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                "<title>Terminal Recording</title>\n</head>\n"
+                f'<body style="margin:0;background:{_hex(config.bg_color)}">\n'
+            )
+        else:
+            fp.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        fp.write(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">\n'
+            f'<rect width="100%" height="100%" fill="{_hex(config.bg_color)}"/>\n'
+            f'<svg width="{width}" height="{height}">\n'
+            f'<g class="strip" xml:space="preserve" font-family="{config.font_family}" '
+            f'font-size="{config.font_size}" fill="{_hex(config.fg_color)}">\n'
+        )
+
+        rows = SvgRows(config)
+        slots: dict[tuple[str, ...], int] = {}
+        # (slot, start) of each shown screen, in milliseconds
+        keyframes: list[tuple[int, int]] = []
+        elapsed = 0
+        count = 0
+        for frame, duration in timed:
+            count += 1
+            new: list[str] = []
+            uses = tuple(
+                rows.use(line, new) if line else "" for line in screen_lines(frame)[: first.height]
+            )
+            slot = slots.get(uses)
+            if slot is None:
+                slot = slots[uses] = len(slots)
+                if new:
+                    fp.write(f"<defs>{''.join(new)}</defs>\n")
+                placed = "".join(
+                    f'<use href="#{row_id}" y="{y * config.char_height}"/>'
+                    for y, row_id in enumerate(uses)
+                    if row_id
+                )
+                fp.write(f'<g transform="translate({slot * width})">{placed}</g>\n')
+            if keyframes and keyframes[-1][0] == slot:
+                elapsed += duration
+                continue
+            keyframes.append((slot, elapsed))
+            elapsed += duration
+
+        fp.write("</g>\n</svg>\n")
+        if len(keyframes) > 1:
+            fp.write(self._animation(keyframes, elapsed, width))
+        fp.write("</svg>\n")
+        if html:
+            fp.write("</body>\n</html>\n")
+        return count
+
+    def _animation(self, keyframes: list[tuple[int, int]], total: int, width: int) -> str:
+        steps = "".join(
+            f"{100 * start / total:.3f}%{{transform:translateX({-slot * width}px)}}"
+            for slot, start in keyframes
+        )
+        repeat = "infinite" if self.config.loop else "1 forwards"
+        return (
+            f"<style>@keyframes play{{{steps}"
+            f"100%{{transform:translateX({-keyframes[-1][0] * width}px)}}}}"
+            f".strip{{animation:play {total}ms steps(1,end) {repeat}}}</style>\n"
+        )
@@ -0,0 +1,109 @@
+"""Process pool rendering for GIF and PNG export."""
+
+from __future__ import annotations
+
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from PIL import Image
+
+from terminal_state.capture.frame import Frame
+from terminal_state.export.gif import Box, FrameRenderer, GifConfig, GifExporter
+
+T = TypeVar("T")
+
+# What a worker needs of a frame to draw it
+_Screen = tuple[str, int, int, bytes | None]
+_Update = tuple[Image.Image, Box] | None
+
+# Set in each worker process by _init_worker
+_exporter: GifExporter | None = None
+
+
+def _init_worker(config: GifConfig) -> None:
+    global _exporter
+    _exporter = GifExporter(config)
+
+
+def _screen(frame: Frame) -> _Screen:
+    return (frame.content, frame.width, frame.height, frame.ansi_data)
+
+
+def _frame(screen: _Screen) -> Frame:
+    content, width, height, ansi_data = screen
+    return Frame.trusted(content, width, height, 0.0, ansi_data)
+
+
+def _render_chunk(previous: _Screen | None, screens: list[_Screen]) -> list[_Update]:
+    """Changed regions of consecutive screens, starting from ``previous``."""
+    assert _exporter is not None
+    config = _exporter.config
+    renderer = FrameRenderer(_exporter.atlas, config.fg_color, config.bg_color)
+    if previous is not None:
+        renderer.render(_frame(previous))
+    return [renderer.render(_frame(screen)) for screen in screens]
+
+
+def _save_png(screen: _Screen, path: Path) -> Path:
+    assert _exporter is not None
+    _exporter._render_frame(_frame(screen)).save(path, format="PNG")
+    return path
+
+
+def _ordered(
+    pool: ProcessPoolExecutor,
+    fn: Callable[..., T],
+    calls: Iterable[tuple[Any, ...]],
+    limit: int,
+) -> Iterator[T]:
+    """Results of ``fn(*args)`` in submission order, with at most ``limit`` in flight."""
+    pending: deque[Future[T]] = deque()
+    for args in calls:
+        pending.append(pool.submit(fn, *args))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def render_parallel(
+    config: GifConfig,
+    timed: Iterable[tuple[Frame, int]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[tuple[_Update, int]]:
+    """Changed regions and durations of ``timed`` frames, rendered in a process pool.
+
+    Frames are split into runs of ``chunk_size``; each worker redraws its
+    run incrementally after first drawing the frame preceding it, so the
+    regions are the same as a single renderer would produce.
+    """
+    timed = iter(timed)
+    durations: deque[list[int]] = deque()
+
+    def chunks() -> Iterator[tuple[_Screen | None, list[_Screen]]]:
+        previous = None
+        while chunk := list(itertools.islice(timed, chunk_size)):
+            screens = [_screen(frame) for frame, _ in chunk]
+            durations.append([duration for _, duration in chunk])
+            yield previous, screens
+            previous = screens[-1]
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(config,)) as pool:
+        for updates in _ordered(pool, _render_chunk, chunks(), limit=2 * workers):
+            yield from zip(updates, durations.popleft(), strict=True)
+
+
+def save_pngs_parallel(
+    config: GifConfig,
+    items: Iterable[tuple[Frame, Path]],
+    workers: int,
+) -> Iterator[Path]:
+    """Render each frame to its PNG path in a process pool, yielding paths in order."""
+    calls = ((_screen(frame), path) for frame, path in items)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(config,)) as pool:
+        yield from _ordered(pool, _save_png, calls, limit=4 * workers)
@@ -1,5 +1,5 @@
 """Models module for configuration."""
 
-from terminal_state.models.config import SessionConfig
+from terminal_state.models.config import SessionConfig, SettleConfig
 
-__all__ = ["SessionConfig"]
+__all__ = ["SessionConfig", "SettleConfig"]
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
 
+class SettleConfig(BaseModel):
+    """How long to wait for output before recording a frame."""
+
+    strategy: Literal["fixed", "quiet"] = "fixed"
+    delay: float = Field(default=0.1, ge=0, description="Sleep before capture (fixed)")
+    quiet_period: float = Field(default=0.05, gt=0, description="Required idle time (quiet)")
+    timeout: float = Field(default=1.0, gt=0, description="Upper bound on waiting (quiet)")
+    poll_interval: float = Field(default=0.01, gt=0, description="Probe interval (quiet)")
+
+
 class SessionConfig(BaseModel):
     """Configuration for terminal session."""
 
@@ -15,3 +26,39 @@ class SessionConfig(BaseModel):
     shell: str = Field(default="/bin/bash")
     environment: dict[str, str] = Field(default_factory=dict)
     socket_dir: Path = Field(default=Path("/tmp/terminal-state"))
+    backend: Literal["tmux", "pty"] = Field(
+        default="tmux",
+        description="Run the shell under tmux, or on a local pty emulated in-process with pyte",
+    )
+    server_name: str | None = Field(
+        default=None,
+        description="Host sessions with the same name on one shared server socket",
+    )
+    control_mode: bool = Field(
+        default=False,
+        description="Route tmux commands through one persistent `tmux -C` client",
+    )
+    capture_mode: Literal["poll", "stream"] = Field(
+        default="poll",
+        description="Sample the pane after each input, or stream its output via pipe-pane",
+    )
+    storage: Literal["list", "delta", "journal"] = Field(
+        default="list",
+        description="Keep recorded frames in a list, delta-encoded, or in an on-disk journal",
+    )
+    keyframe_interval: int = Field(default=50, ge=1, description="Frames per keyframe (delta)")
+    journal_path: Path | None = Field(default=None, description="Journal file (journal)")
+    memory_window: int = Field(default=64, ge=0, description="Frames kept in memory (journal)")
+    dedupe_frames: bool = Field(
+        default=True,
+        description="Merge identical consecutive frames instead of recording each sample",
+    )
+    color_capture: bool = Field(
+        default=False,
+        description="Keep colors and attributes: capture with escapes into Frame.ansi_data",
+    )
+    cell_grid: bool = Field(
+        default=False,
+        description="Capture each frame's cell grid with cursor position (needs numpy)",
+    )
+    settle: SettleConfig = Field(default_factory=SettleConfig)
@@ -1,6 +1,22 @@
 """Session module for terminal management."""
 
+from terminal_state.session.async_backend import AsyncTmuxBackend
+from terminal_state.session.async_terminal import AsyncTerminalSession
 from terminal_state.session.backend import TmuxBackend
+from terminal_state.session.expect import ExpectMatch
+from terminal_state.session.pool import SessionPool
+from terminal_state.session.pty_backend import PtyBackend
+from terminal_state.session.runner import ScenarioResult, ScenarioRunner
 from terminal_state.session.terminal import TerminalSession
 
-__all__ = ["TerminalSession", "TmuxBackend"]
+__all__ = [
+    "AsyncTerminalSession",
+    "AsyncTmuxBackend",
+    "ExpectMatch",
+    "PtyBackend",
+    "ScenarioResult",
+    "ScenarioRunner",
+    "SessionPool",
+    "TerminalSession",
+    "TmuxBackend",
+]
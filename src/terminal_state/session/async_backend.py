@@ -0,0 +1,240 @@
+"""Asyncio tmux backend built on a control-mode connection."""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import time
+import uuid
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import Frame, cell_grid_class
+from terminal_state.capture.sgr import parse_styled, plain_text
+from terminal_state.input.keys import KeySequence
+from terminal_state.session.control import (
+    AsyncControlModeClient,
+    ControlNotification,
+    unescape_output,
+)
+
+if TYPE_CHECKING:
+    from terminal_state.models.config import SessionConfig
+
+OutputCallback = Callable[[OutputEvent], None]
+
+
+class AsyncOutputStream:
+    """Pane output delivered through control-mode ``%output`` notifications."""
+
+    def __init__(self, pane_id: str) -> None:
+        self.pane_id = pane_id
+        self.last_output_at: float | None = None
+        self.sequence = 0
+        self._prefix = f"{pane_id} ".encode()
+        self._changed = asyncio.Event()
+        self._subscribers: list[OutputCallback] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def subscribe(self, callback: OutputCallback) -> None:
+        """Register a callback invoked for every output event."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: OutputCallback) -> None:
+        """Remove a previously registered callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    async def wait_for_output(self, sequence: int, timeout: float | None = None) -> bool:
+        """Wait until an event newer than ``sequence`` arrives."""
+        if self.sequence > sequence:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def feed(self, notification: ControlNotification) -> None:
+        """Handle an ``%output`` notification, ignoring other panes."""
+        if not notification.data.startswith(self._prefix):
+            return
+
+        timestamp = time.time()
+        data = self._decoder.decode(unescape_output(notification.data[len(self._prefix) :]))
+        if not data:
+            return
+
+        self.last_output_at = timestamp
+        self.sequence += 1
+        event = OutputEvent(timestamp=timestamp, data=data)
+        for callback in list(self._subscribers):
+            callback(event)
+
+        # Wake current waiters and arm a fresh event for the next ones.
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+
+class AsyncTmuxBackend:
+    """Tmux backend whose commands are awaited over a control-mode client."""
+
+    def __init__(self, config: SessionConfig) -> None:
+        self.config = config
+        self.session_id = f"terminal-state-{uuid.uuid4().hex[:8]}"
+        self.shared = config.server_name is not None
+        server_name = config.server_name or self.session_id
+        self.socket_path = config.socket_dir / f"{server_name}.sock"
+        self.pane_id: str | None = None
+        self.control: AsyncControlModeClient | None = None
+        self.stream: AsyncOutputStream | None = None
+        self._grid = cell_grid_class() if config.cell_grid else None
+
+    async def create(self) -> None:
+        """Create new tmux session and attach the control client."""
+        self.config.socket_dir.mkdir(parents=True, exist_ok=True)
+
+        args = ["-s", self.session_id, "-x", str(self.config.width), "-y", str(self.config.height)]
+        for key, value in self.config.environment.items():
+            args += ["-e", f"{key}={value}"]
+
+        process = await asyncio.create_subprocess_exec(
+            "tmux",
+            "-S",
+            str(self.socket_path),
+            "new-session",
+            "-d",
+            "-P",
+            "-F",
+            "#{pane_id}",
+            *args,
+            self.config.shell,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"tmux new-session failed: {stderr.decode().strip()}")
+        self.pane_id = stdout.decode().strip()
+
+        self.control = AsyncControlModeClient(self.socket_path, self.session_id)
+        await self.control.start()
+        await self.control.command("refresh-client", "-f", "no-output")
+
+    async def cmd(self, *args: str) -> list[str]:
+        """Run a tmux command on this backend's server and return its output."""
+        if self.control is None:
+            raise RuntimeError("Session not created")
+        return await self.control.command(*args)
+
+    async def send_keys(self, keys: KeySequence) -> None:
+        """Send keys to terminal."""
+        if self.pane_id is None:
+            raise RuntimeError("Session not created")
+
+        args = ["send-keys", "-t", self.pane_id]
+        if keys.literal:
+            args.append("-l")
+        await self.cmd(*args, keys.keys)
+
+    async def capture(self) -> Frame:
+        """Capture current pane content."""
+        if self.pane_id is None:
+            raise RuntimeError("Session not created")
+
+        width, height = self.config.width, self.config.height
+        styled = ansi_data = None
+        if self.config.color_capture:
+            escaped = "\n".join(await self.cmd("capture-pane", "-e", "-p", "-t", self.pane_id))
+            styled = parse_styled(escaped)
+            content = plain_text(styled)
+            ansi_data = escaped.encode()
+        else:
+            content = "\n".join(await self.cmd("capture-pane", "-p", "-t", self.pane_id))
+
+        grid = None
+        if self._grid is not None:
+            cursor_format = "#{cursor_flag},#{cursor_y},#{cursor_x}"
+            output = await self.cmd("display-message", "-p", "-t", self.pane_id, cursor_format)
+            visible, row, column = output[0].split(",")
+            cursor = (int(row), int(column)) if visible == "1" else None
+            if styled is not None:
+                grid = self._grid.from_styled(styled, width, height, cursor)
+            else:
+                grid = self._grid.from_text(content, width, height, cursor)
+
+        return Frame.trusted(
+            content,
+            width,
+            height,
+            time.time(),
+            ansi_data=ansi_data,
+            grid=grid,
+            styled_lines=styled,
+        )
+
+    async def start_stream(self) -> AsyncOutputStream:
+        """Start delivering pane output as ``%output`` notifications."""
+        if self.stream is not None:
+            return self.stream
+        if self.control is None or self.pane_id is None:
+            raise RuntimeError("Session not created")
+
+        stream = AsyncOutputStream(self.pane_id)
+        self.control.subscribe("output", stream.feed)
+        await self.control.command("refresh-client", "-f", "!no-output")
+        self.stream = stream
+        return stream
+
+    async def stop_stream(self) -> None:
+        """Stop delivering pane output."""
+        if self.stream is None:
+            return
+
+        if self.control is not None:
+            self.control.unsubscribe("output", self.stream.feed)
+            if self.control.alive:
+                await self.control.command("refresh-client", "-f", "no-output")
+        self.stream = None
+
+    async def destroy(self) -> None:
+        """Destroy tmux session."""
+        await self.stop_stream()
+
+        if self.control is not None:
+            await self.control.close()
+            self.control = None
+
+        if self.pane_id is not None:
+            process = await asyncio.create_subprocess_exec(
+                "tmux",
+                "-S",
+                str(self.socket_path),
+                "kill-session",
+                "-t",
+                self.session_id,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await process.wait()
+            self.pane_id = None
+
+        # A shared server outlives this session while others remain on it.
+        if self.shared and await self._server_alive():
+            return
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    async def _server_alive(self) -> bool:
+        """Whether the tmux server on this backend's socket still runs."""
+        process = await asyncio.create_subprocess_exec(
+            "tmux",
+            "-S",
+            str(self.socket_path),
+            "list-sessions",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return await process.wait() == 0
@@ -0,0 +1,96 @@
+"""Asyncio terminal session interface."""
+
+from __future__ import annotations
+
+import re
+from typing import Self
+
+from terminal_state.capture.frame import Frame
+from terminal_state.capture.recorder import Recording
+from terminal_state.input.keys import KeySequence, Keys
+from terminal_state.models.config import SessionConfig
+from terminal_state.session.async_backend import AsyncTmuxBackend
+from terminal_state.session.expect import ExpectMatch, Expecter
+from terminal_state.session.settle import settle_async
+
+
+class AsyncTerminalSession:
+    """Asyncio counterpart of :class:`TerminalSession`.
+
+    Every tmux interaction is awaited over a control-mode connection, so a
+    single event loop can drive many sessions concurrently.
+    """
+
+    def __init__(self, config: SessionConfig) -> None:
+        if config.backend != "tmux":
+            raise ValueError("AsyncTerminalSession only supports the tmux backend")
+
+        self.config = config
+        self.backend = AsyncTmuxBackend(config)
+        self.recording = Recording.from_config(config)
+        self._started = False
+
+    @classmethod
+    async def create(cls, **kwargs) -> Self:  # type: ignore[misc]
+        """Create and start a new session."""
+        config = SessionConfig(**kwargs)
+        session = cls(config)
+        await session.start()
+        return session
+
+    async def start(self) -> None:
+        """Start the terminal session."""
+        if not self._started:
+            await self.backend.create()
+            self._started = True
+            if self.config.capture_mode == "stream":
+                stream = await self.backend.start_stream()
+                stream.subscribe(self.recording.add_event)
+
+    async def send_keys(self, keys: str | KeySequence, record: bool = True) -> None:
+        """Send key sequence to terminal."""
+        if isinstance(keys, str):
+            keys = KeySequence(keys=keys, literal=True)
+
+        await self.backend.send_keys(keys)
+
+        if record and self.config.capture_mode == "poll":
+            frame = await settle_async(self.capture, self.config.settle, self.backend.stream)
+            self.recording.add_frame(frame)
+
+    async def send_command(self, command: str, record: bool = True) -> None:
+        """Send command and press enter."""
+        await self.send_keys(KeySequence(keys=command, literal=True), record=False)
+        await self.send_keys(Keys.ENTER, record=record)
+
+    async def capture(self) -> Frame:
+        """Capture current terminal state."""
+        return await self.backend.capture()
+
+    async def expect(
+        self,
+        *patterns: str | re.Pattern[str],
+        timeout: float = 5.0,
+    ) -> ExpectMatch | None:
+        """Wait for any of the patterns to appear and report which matched."""
+        expecter = Expecter(patterns)
+        return await expecter.wait_async(self.capture, timeout, stream=self.backend.stream)
+
+    async def expect_text(self, pattern: str, timeout: float = 5.0) -> bool:
+        """Wait for text to appear in terminal output."""
+        return await self.expect(pattern, timeout=timeout) is not None
+
+    async def destroy(self) -> None:
+        """Destroy the terminal session."""
+        if self._started:
+            await self.backend.destroy()
+            self._started = False
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.destroy()
@@ -2,30 +2,88 @@
 
 from __future__ import annotations
 
+import shlex
+import threading
 import time
 import uuid
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from libtmux import Server
+from libtmux.exc import LibTmuxException
+from libtmux.pane import Pane
 from libtmux.session import Session as TmuxSession
 
-from terminal_state.capture.frame import Frame
+from terminal_state.capture.frame import Frame, cell_grid_class
+from terminal_state.capture.sgr import parse_styled, plain_text
 from terminal_state.input.keys import KeySequence
+from terminal_state.session.control import ControlModeClient
+from terminal_state.session.stream import OutputStream
 
 if TYPE_CHECKING:
     from terminal_state.models.config import SessionConfig
 
 
+class _SharedControlClients:
+    """Reference-counted control clients, one per shared server socket."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[Path, tuple[ControlModeClient, int]] = {}
+
+    def acquire(self, socket_path: Path, target: str) -> ControlModeClient:
+        """Return the server's control client, attaching one if needed."""
+        with self._lock:
+            client, users = self._clients.get(socket_path, (None, 0))
+            if client is None or not client.alive:
+                client, users = ControlModeClient(socket_path, target), 0
+                client.start()
+            self._clients[socket_path] = (client, users + 1)
+            return client
+
+    def release(self, socket_path: Path) -> None:
+        """Drop one reference, detaching the client after the last one."""
+        with self._lock:
+            client, users = self._clients.pop(socket_path, (None, 0))
+            if client is None:
+                return
+            if users > 1:
+                self._clients[socket_path] = (client, users - 1)
+            else:
+                client.close()
+
+
+_shared_clients = _SharedControlClients()
+
+
 class TmuxBackend:
-    """Tmux-based terminal backend."""
+    """Tmux-based terminal backend.
+
+    By default every backend starts its own tmux server. With
+    ``config.server_name`` set, backends share one server and each one owns
+    only its session on it.
+    """
 
     def __init__(self, config: SessionConfig) -> None:
         self.config = config
         self.session_id = f"terminal-state-{uuid.uuid4().hex[:8]}"
-        self.socket_path = config.socket_dir / f"{self.session_id}.sock"
+        self.shared = config.server_name is not None
+        server_name = config.server_name or self.session_id
+        self.socket_path = config.socket_dir / f"{server_name}.sock"
         self.server: Server | None = None
         self.session: TmuxSession | None = None
+        self.pane: Pane | None = None
+        self.control: ControlModeClient | None = None
+        self.stream: OutputStream | None = None
+        self._grid = cell_grid_class() if config.cell_grid else None
+
+    @property
+    def pane_id(self) -> str:
+        """Tmux id of the session's pane (e.g. ``%0``)."""
+        if not self.pane or not self.pane.pane_id:
+            raise RuntimeError("Session not created")
+        return self.pane.pane_id
 
     def create(self) -> None:
         """Create new tmux session."""
@@ -36,42 +94,165 @@ class TmuxBackend:
             session_name=self.session_id,
             x=self.config.width,
             y=self.config.height,
+            window_command=self.config.shell,
+            environment=self.config.environment or None,
             attach=False,
         )
 
+        self.pane = self.session.active_pane
+        if self.pane is None:
+            raise RuntimeError("No active pane in session")
+
+        if self.shared:
+            # Keep clients attached when the session they sit on is destroyed.
+            self.server.cmd("set-option", "-g", "detach-on-destroy", "off")
+
+        if self.config.control_mode:
+            if self.shared:
+                self.control = _shared_clients.acquire(self.socket_path, self.session_id)
+            else:
+                self.control = ControlModeClient(self.socket_path, self.session_id)
+                self.control.start()
+
+    def cmd(self, *args: str) -> list[str]:
+        """Run a tmux command on this backend's server and return its output."""
+        if self.control is not None:
+            return self.control.command(*args)
+
+        if not self.server:
+            raise RuntimeError("Session not created")
+
+        result = self.server.cmd(*args)
+        if result.stderr:
+            raise RuntimeError(f"tmux {args[0]} failed: {' '.join(result.stderr)}")
+        return result.stdout
+
     def send_keys(self, keys: KeySequence) -> None:
         """Send keys to terminal."""
-        if not self.session:
+        if not self.pane:
             raise RuntimeError("Session not created")
 
-        pane = self.session.active_pane
-        if pane is None:
-            raise RuntimeError("No active pane in session")
+        if self.control is not None:
+            args = ["send-keys", "-t", self.pane_id]
+            if keys.literal:
+                args.append("-l")
+            self.control.command(*args, keys.keys)
+            return
 
-        pane.send_keys(keys.keys, literal=keys.literal, suppress_history=False)
+        self.pane.send_keys(keys.keys, enter=False, literal=keys.literal, suppress_history=False)
 
     def capture(self) -> Frame:
         """Capture current pane content."""
-        if not self.session:
+        if not self.pane:
             raise RuntimeError("Session not created")
 
-        pane = self.session.active_pane
-        if pane is None:
-            raise RuntimeError("No active pane in session")
+        width, height = self.config.width, self.config.height
+        styled = ansi_data = None
+        if self.config.color_capture:
+            # One capture with escapes; the plain text is derived from it
+            escaped = "\n".join(self.cmd("capture-pane", "-e", "-p", "-t", self.pane_id))
+            styled = parse_styled(escaped)
+            content = plain_text(styled)
+            ansi_data = escaped.encode()
+        elif self.control is not None:
+            content = "\n".join(self.control.command("capture-pane", "-p", "-t", self.pane_id))
+        else:
+            content = self.pane.capture_pane()
+            if isinstance(content, list):
+                content = "\n".join(content)
 
-        content = pane.capture_pane()
+        grid = None
+        if self._grid is not None:
+            if styled is not None:
+                grid = self._grid.from_styled(styled, width, height, self._cursor())
+            else:
+                grid = self._grid.from_text(content, width, height, self._cursor())
+
+        return Frame.trusted(
+            content,
+            width,
+            height,
+            time.time(),
+            ansi_data=ansi_data,
+            grid=grid,
+            styled_lines=styled,
+        )
 
-        return Frame(
-            content="\n".join(content) if isinstance(content, list) else content,
-            width=self.config.width,
-            height=self.config.height,
-            timestamp=time.time(),
+    def _cursor(self) -> tuple[int, int] | None:
+        """Cursor ``(row, column)`` of the pane, or None while it is hidden."""
+        output = self.cmd(
+            "display-message", "-p", "-t", self.pane_id, "#{cursor_flag},#{cursor_y},#{cursor_x}"
         )
+        visible, row, column = output[0].split(",")
+        return (int(row), int(column)) if visible == "1" else None
+
+    def is_alive(self) -> bool:
+        """Whether the server answers and the pane's process is still running."""
+        if not self.pane:
+            return False
+
+        try:
+            return self.cmd("display-message", "-p", "-t", self.pane_id, "#{pane_dead}") == ["0"]
+        except (RuntimeError, TimeoutError, OSError):
+            return False
+
+    def reset(self, start_directory: Path | None = None) -> None:
+        """Restart the pane's shell with the configured environment.
+
+        The running process is killed and the shell respawned in place, which
+        clears the screen, working directory and any exported variables
+        without starting a new server. Scrollback is cleared as well.
+        """
+        args = ["respawn-pane", "-k", "-t", self.pane_id]
+        if start_directory is not None:
+            args += ["-c", str(start_directory)]
+        for key, value in self.config.environment.items():
+            args += ["-e", f"{key}={value}"]
+
+        self.cmd(*args)
+        self.cmd("clear-history", "-t", self.pane_id)
+
+    def start_stream(self) -> OutputStream:
+        """Tap the pane's output into a FIFO-backed stream via ``pipe-pane``."""
+        if self.stream is not None:
+            return self.stream
+
+        stream = OutputStream(self.config.socket_dir / f"{self.session_id}.fifo")
+        stream.open()
+        command = f"exec cat > {shlex.quote(str(stream.fifo_path))}"
+        self.cmd("pipe-pane", "-t", self.pane_id, command)
+        self.stream = stream
+        return stream
+
+    def stop_stream(self) -> None:
+        """Stop piping pane output and close the stream."""
+        if self.stream is None:
+            return
+
+        # If the pane is already gone there is nothing to unpipe.
+        with suppress(RuntimeError, TimeoutError):
+            self.cmd("pipe-pane", "-t", self.pane_id)
+        self.stream.close()
+        self.stream = None
 
     def destroy(self) -> None:
         """Destroy tmux session."""
+        self.stop_stream()
+
+        if self.control is not None:
+            if self.shared:
+                _shared_clients.release(self.socket_path)
+            else:
+                self.control.close()
+            self.control = None
+
         if self.session:
-            self.session.kill()
+            with suppress(LibTmuxException):
+                self.session.kill()
+
+        # A shared server outlives this session while others remain on it.
+        if self.shared and self.server is not None and self.server.is_alive():
+            return
 
         if self.socket_path.exists():
             self.socket_path.unlink()
@@ -0,0 +1,365 @@
+"""Tmux control-mode client multiplexing commands over one connection."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import subprocess
+import threading
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+_SAFE_ARGUMENT = re.compile(r"[A-Za-z0-9_%@.,:/=+-]+")
+_ARGUMENT_ESCAPES = {ord('"'): '\\"', ord("\\"): "\\\\", ord("$"): "\\$", ord("\n"): "\\n"}
+_ARGUMENT_ESCAPES.update(
+    {c: f"\\{c:03o}" for c in (*range(0x20), 0x7F) if c not in _ARGUMENT_ESCAPES}
+)
+_OUTPUT_ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+NotificationCallback = Callable[["ControlNotification"], None]
+
+# Stream reader limit for the asyncio client; %output lines can be long.
+_ASYNC_LINE_LIMIT = 16 * 1024 * 1024
+
+
+def quote_argument(value: str) -> str:
+    """Quote a command argument for the tmux command parser."""
+    if _SAFE_ARGUMENT.fullmatch(value):
+        return value
+    return '"' + value.translate(_ARGUMENT_ESCAPES) + '"'
+
+
+def unescape_output(data: bytes) -> bytes:
+    """Decode the octal escaping tmux applies to ``%output`` payloads."""
+    return _OUTPUT_ESCAPE.sub(lambda m: bytes([int(m.group(1), 8)]), data)
+
+
+class ControlReply:
+    """Output of one command, delimited by ``%begin`` and ``%end``/``%error``."""
+
+    __slots__ = ("error", "from_client", "lines", "number")
+
+    def __init__(self, number: int, from_client: bool, lines: list[str], error: bool) -> None:
+        self.number = number
+        self.from_client = from_client
+        self.lines = lines
+        self.error = error
+
+
+class ControlNotification:
+    """Asynchronous notification such as ``%output`` or ``%exit``."""
+
+    __slots__ = ("data", "name")
+
+    def __init__(self, name: str, data: bytes) -> None:
+        self.name = name
+        self.data = data
+
+
+class ControlModeParser:
+    """Incremental parser for the control-mode protocol.
+
+    The parser does no I/O: feed it one line at a time (without the trailing
+    newline) and it returns a reply once a command block is complete, a
+    notification for ``%``-lines outside a block, or ``None``.
+    """
+
+    def __init__(self) -> None:
+        self._guard: bytes | None = None
+        self._from_client = False
+        self._lines: list[str] = []
+
+    def feed(self, line: bytes) -> ControlReply | ControlNotification | None:
+        """Consume a single protocol line."""
+        if self._guard is not None:
+            if line.startswith((b"%end ", b"%error ")):
+                keyword, _, guard = line.partition(b" ")
+                if guard == self._guard:
+                    _, number, _ = guard.split(b" ", 2)
+                    reply = ControlReply(
+                        number=int(number),
+                        from_client=self._from_client,
+                        lines=self._lines,
+                        error=keyword == b"%error",
+                    )
+                    self._guard = None
+                    self._lines = []
+                    return reply
+            self._lines.append(line.decode("utf-8", errors="backslashreplace"))
+            return None
+
+        if line.startswith(b"%begin "):
+            self._guard = line[len(b"%begin ") :]
+            flags = self._guard.rsplit(b" ", 1)[-1]
+            self._from_client = bool(int(flags) & 1)
+            return None
+
+        if line.startswith(b"%"):
+            name, _, data = line[1:].partition(b" ")
+            return ControlNotification(name.decode("ascii", errors="replace"), data)
+
+        return None
+
+
+def _format_command(args: tuple[str, ...]) -> bytes:
+    """Encode a command as one control-mode input line."""
+    return " ".join(quote_argument(arg) for arg in args).encode() + b"\n"
+
+
+def _reply_lines(reply: ControlReply | None, command: str) -> list[str]:
+    """Return a reply's output lines, raising if the command failed."""
+    if reply is None:
+        raise RuntimeError(f"Control client exited during: {command}")
+    if reply.error:
+        raise RuntimeError(f"tmux {command} failed: {' '.join(reply.lines)}")
+
+    lines = reply.lines
+    while lines and lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+class _PendingCommand:
+    """Reply slot for a command awaiting its ``%end``."""
+
+    __slots__ = ("event", "reply")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.reply: ControlReply | None = None
+
+
+class ControlModeClient:
+    """Long-lived ``tmux -C`` client attached to a session.
+
+    Commands are written to the client's stdin and their replies are matched
+    back in order by a reader thread, so a round trip costs a pipe write
+    instead of spawning a new tmux process.
+    """
+
+    def __init__(self, socket_path: Path, target: str, tmux_bin: str = "tmux") -> None:
+        self.socket_path = socket_path
+        self.target = target
+        self.tmux_bin = tmux_bin
+        self.process: subprocess.Popen[bytes] | None = None
+        self._parser = ControlModeParser()
+        self._pending: deque[_PendingCommand] = deque()
+        self._write_lock = threading.Lock()
+        self._subscribers: dict[str, list[NotificationCallback]] = {}
+        self._reader: threading.Thread | None = None
+        self._attached = threading.Event()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the control client process is still running."""
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """Spawn the control client and start reading its output."""
+        self.process = subprocess.Popen(
+            [self.tmux_bin, "-S", str(self.socket_path), "-C", "attach-session", "-t", self.target],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._reader = threading.Thread(
+            target=self._read_loop,
+            name=f"tmux-control-{self.target}",
+            daemon=True,
+        )
+        self._reader.start()
+
+        # Commands sent before the attach completes fail with "no current client".
+        if not self._attached.wait(10.0) or not self.alive:
+            self.close()
+            raise RuntimeError(f"Could not attach control client to {self.target}")
+
+    def command(self, *args: str, timeout: float | None = 10.0) -> list[str]:
+        """Run a tmux command and return its output lines."""
+        if not self.alive or self.process is None or self.process.stdin is None:
+            raise RuntimeError("Control client not running")
+
+        line = _format_command(args)
+        pending = _PendingCommand()
+        with self._write_lock:
+            self._pending.append(pending)
+            self.process.stdin.write(line)
+            self.process.stdin.flush()
+
+        if not pending.event.wait(timeout):
+            raise TimeoutError(f"tmux command timed out: {args[0]}")
+
+        return _reply_lines(pending.reply, args[0])
+
+    def subscribe(self, name: str, callback: NotificationCallback) -> None:
+        """Register a callback for notifications named ``name``."""
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name: str, callback: NotificationCallback) -> None:
+        """Remove a previously registered notification callback."""
+        callbacks = self._subscribers.get(name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def close(self) -> None:
+        """Detach the control client."""
+        if self.process is None:
+            return
+
+        if self.process.stdin is not None and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+        if self._reader is not None:
+            self._reader.join(timeout=2.0)
+        self.process = None
+
+    def _read_loop(self) -> None:
+        """Dispatch replies and notifications until the client exits."""
+        assert self.process is not None and self.process.stdout is not None
+
+        for raw in self.process.stdout:
+            message = self._parser.feed(raw.rstrip(b"\n"))
+            if message is None:
+                continue
+            if isinstance(message, ControlReply):
+                if not message.from_client:
+                    self._attached.set()
+                elif self._pending:
+                    pending = self._pending.popleft()
+                    pending.reply = message
+                    pending.event.set()
+            else:
+                for callback in list(self._subscribers.get(message.name, ())):
+                    callback(message)
+
+        self._attached.set()
+        while self._pending:
+            self._pending.popleft().event.set()
+
+
+class AsyncControlModeClient:
+    """Asyncio counterpart of :class:`ControlModeClient`.
+
+    Replies resolve futures instead of waking threads, so one event loop can
+    drive many clients without a reader thread each.
+    """
+
+    def __init__(self, socket_path: Path, target: str, tmux_bin: str = "tmux") -> None:
+        self.socket_path = socket_path
+        self.target = target
+        self.tmux_bin = tmux_bin
+        self.process: asyncio.subprocess.Process | None = None
+        self._parser = ControlModeParser()
+        self._pending: deque[asyncio.Future[ControlReply | None]] = deque()
+        self._subscribers: dict[str, list[NotificationCallback]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._attached = asyncio.Event()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the control client process is still running."""
+        return self.process is not None and self.process.returncode is None
+
+    async def start(self) -> None:
+        """Spawn the control client and start reading its output."""
+        self.process = await asyncio.create_subprocess_exec(
+            self.tmux_bin,
+            "-S",
+            str(self.socket_path),
+            "-C",
+            "attach-session",
+            "-t",
+            self.target,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_ASYNC_LINE_LIMIT,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+
+        # Commands sent before the attach completes fail with "no current client".
+        try:
+            await asyncio.wait_for(self._attached.wait(), 10.0)
+        except TimeoutError:
+            pass
+        if not self._attached.is_set() or not self.alive:
+            await self.close()
+            raise RuntimeError(f"Could not attach control client to {self.target}")
+
+    async def command(self, *args: str, timeout: float | None = 10.0) -> list[str]:
+        """Run a tmux command and return its output lines."""
+        if not self.alive or self.process is None or self.process.stdin is None:
+            raise RuntimeError("Control client not running")
+
+        future: asyncio.Future[ControlReply | None] = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        self.process.stdin.write(_format_command(args))
+        await self.process.stdin.drain()
+
+        try:
+            reply = await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            raise TimeoutError(f"tmux command timed out: {args[0]}") from None
+
+        return _reply_lines(reply, args[0])
+
+    def subscribe(self, name: str, callback: NotificationCallback) -> None:
+        """Register a callback for notifications named ``name``."""
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name: str, callback: NotificationCallback) -> None:
+        """Remove a previously registered notification callback."""
+        callbacks = self._subscribers.get(name, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    async def close(self) -> None:
+        """Detach the control client."""
+        if self.process is None:
+            return
+
+        if self.process.stdin is not None and not self.process.stdin.is_closing():
+            self.process.stdin.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), 2.0)
+        except TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+
+        if self._reader is not None:
+            await self._reader
+        self.process = None
+
+    async def _read_loop(self) -> None:
+        """Dispatch replies and notifications until the client exits."""
+        assert self.process is not None and self.process.stdout is not None
+
+        while raw := await self.process.stdout.readline():
+            message = self._parser.feed(raw.rstrip(b"\n"))
+            if message is None:
+                continue
+            if isinstance(message, ControlReply):
+                if not message.from_client:
+                    self._attached.set()
+                elif self._pending:
+                    future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(message)
+            else:
+                for callback in list(self._subscribers.get(message.name, ())):
+                    callback(message)
+
+        self._attached.set()
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_result(None)
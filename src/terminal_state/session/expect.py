@@ -0,0 +1,157 @@
+"""Incremental pattern matching against terminal output."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from terminal_state.capture.frame import Frame
+
+if TYPE_CHECKING:
+    from terminal_state.session.async_backend import AsyncOutputStream
+    from terminal_state.session.stream import OutputStream
+
+# Tokens that can match a newline or depend on the whole-screen position; a
+# pattern containing any of them, or a literal newline, is matched against the
+# full content instead.
+_CROSS_LINE = re.compile(r"\n|\\[nsSWDAZ]|\[\^|\\x0[aA]|\\012|\\u000[aA]")
+
+# Upper bound on a single stream wait, in case output lands on screen after
+# the event that announced it.
+_STREAM_RECHECK = 0.25
+
+
+class ExpectMatch(BaseModel):
+    """Which pattern matched, where, and in which frame."""
+
+    index: int = Field(description="Position of the pattern in the expect call")
+    pattern: str
+    text: str = Field(description="Matched text")
+    line: int | None = Field(default=None, description="Screen line of the match, if line-local")
+    frame: Frame
+
+
+def _is_line_local(pattern: re.Pattern[str]) -> bool:
+    """Whether a match can always be found within a single line."""
+    if pattern.flags & re.DOTALL or _CROSS_LINE.search(pattern.pattern):
+        return False
+    if pattern.flags & re.MULTILINE:
+        return True
+    return "^" not in pattern.pattern and "$" not in pattern.pattern
+
+
+class Expecter:
+    """Waits for any of several patterns to appear on screen.
+
+    Patterns are compiled once. Line-local patterns are only re-checked on
+    lines that changed since the previous capture; other patterns are
+    re-checked against the full content when it changed at all.
+    """
+
+    def __init__(self, patterns: Sequence[str | re.Pattern[str]]) -> None:
+        if not patterns:
+            raise ValueError("At least one pattern is required")
+
+        self.patterns = [re.compile(p) if isinstance(p, str) else p for p in patterns]
+        self._line_local = [_is_line_local(p) for p in self.patterns]
+        self._lines: tuple[str, ...] = ()
+        self._content: str | None = None
+
+    def check(self, frame: Frame) -> ExpectMatch | None:
+        """Match the patterns against what changed in ``frame``."""
+        content = frame.content
+        if content == self._content:
+            return None
+
+        lines = frame.lines
+        previous = self._lines
+        changed = [i for i, line in enumerate(lines) if i >= len(previous) or previous[i] != line]
+        self._lines = lines
+        self._content = content
+
+        for index, pattern in enumerate(self.patterns):
+            if self._line_local[index]:
+                for i in changed:
+                    match = pattern.search(lines[i])
+                    if match:
+                        return self._result(index, match, frame, line=i)
+            else:
+                match = pattern.search(content)
+                if match:
+                    return self._result(index, match, frame)
+
+        return None
+
+    def wait(
+        self,
+        capture: Callable[[], Frame],
+        timeout: float,
+        stream: OutputStream | None = None,
+        poll_interval: float = 0.02,
+    ) -> ExpectMatch | None:
+        """Capture until a pattern matches or ``timeout`` elapses.
+
+        With an output stream the wait wakes as soon as new output arrives;
+        without one the pane is polled every ``poll_interval`` seconds.
+        """
+        deadline = time.time() + timeout
+
+        while True:
+            sequence = stream.sequence if stream is not None else 0
+            result = self.check(capture())
+            if result is not None:
+                return result
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+
+            if stream is not None:
+                stream.wait_for_output(sequence, min(remaining, _STREAM_RECHECK))
+            else:
+                time.sleep(min(poll_interval, remaining))
+
+    async def wait_async(
+        self,
+        capture: Callable[[], Awaitable[Frame]],
+        timeout: float,
+        stream: AsyncOutputStream | None = None,
+        poll_interval: float = 0.02,
+    ) -> ExpectMatch | None:
+        """Asyncio variant of :meth:`wait`."""
+        deadline = time.time() + timeout
+
+        while True:
+            sequence = stream.sequence if stream is not None else 0
+            result = self.check(await capture())
+            if result is not None:
+                return result
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+
+            if stream is not None:
+                await stream.wait_for_output(sequence, min(remaining, _STREAM_RECHECK))
+            else:
+                await asyncio.sleep(min(poll_interval, remaining))
+
+    def _result(
+        self,
+        index: int,
+        match: re.Match[str],
+        frame: Frame,
+        line: int | None = None,
+    ) -> ExpectMatch:
+        return ExpectMatch(
+            index=index,
+            pattern=self.patterns[index].pattern,
+            text=match.group(0),
+            line=line,
+            frame=frame,
+        )
@@ -0,0 +1,159 @@
+"""Pool of pre-warmed terminal sessions."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Self
+
+from terminal_state.capture.recorder import Recording
+from terminal_state.models.config import SessionConfig, SettleConfig
+from terminal_state.session.settle import settle
+from terminal_state.session.terminal import TerminalSession
+
+
+class SessionPool:
+    """Keeps ready sessions at a clean prompt and hands them out on demand.
+
+    Released sessions have their shell respawned in place (screen, working
+    directory and environment back to the configured state) instead of paying
+    for a new tmux server. Sessions that fail a health check are destroyed and
+    replaced.
+    """
+
+    def __init__(
+        self,
+        config: SessionConfig | None = None,
+        size: int = 4,
+        start_directory: Path | str | None = None,
+        ready_timeout: float = 10.0,
+        ready_pattern: str | None = None,
+        **kwargs: object,
+    ) -> None:
+        if size < 0:
+            raise ValueError("Pool size cannot be negative")
+
+        self.config = config or SessionConfig(**kwargs)  # type: ignore[arg-type]
+        self.size = size
+        self.start_directory = Path(start_directory) if start_directory else Path.cwd()
+        self.ready_timeout = ready_timeout
+        self.ready_pattern = ready_pattern
+        self._ready: deque[TerminalSession] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def available(self) -> int:
+        """Number of idle sessions ready to be acquired."""
+        return len(self._ready)
+
+    def fill(self) -> None:
+        """Start sessions until ``size`` are ready."""
+        while self.available < self.size and not self._closed:
+            session = self._spawn()
+            with self._lock:
+                self._ready.append(session)
+
+    def acquire(self) -> TerminalSession:
+        """Take a healthy session, creating one if none are idle."""
+        if self._closed:
+            raise RuntimeError("Session pool is closed")
+
+        while True:
+            with self._lock:
+                session = self._ready.popleft() if self._ready else None
+            if session is None:
+                return self._spawn()
+            if session.backend.is_alive():
+                return session
+            session.destroy()
+
+    def release(self, session: TerminalSession) -> None:
+        """Reset a session and return it to the pool, or destroy it."""
+        if self._closed or self.available >= self.size or not session.backend.is_alive():
+            session.destroy()
+            return
+
+        try:
+            self._reset(session)
+        except (RuntimeError, TimeoutError, OSError):
+            session.destroy()
+            return
+
+        with self._lock:
+            self._ready.append(session)
+
+    @contextmanager
+    def session(self) -> Iterator[TerminalSession]:
+        """Acquire a session for the duration of a ``with`` block."""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close(self) -> None:
+        """Destroy all idle sessions and refuse further use."""
+        self._closed = True
+        with self._lock:
+            sessions = list(self._ready)
+            self._ready.clear()
+        for session in sessions:
+            session.destroy()
+
+    def _spawn(self) -> TerminalSession:
+        """Start a session and wait for its prompt."""
+        session = TerminalSession(self.config)
+        session.start()
+        self._wait_ready(session)
+        return session
+
+    def _reset(self, session: TerminalSession) -> None:
+        """Respawn the shell and give the session a fresh recording."""
+        backend = session.backend
+        streaming = backend.stream is not None
+        if streaming:
+            backend.stop_stream()
+
+        backend.reset(self.start_directory)
+        self._wait_ready(session)
+
+        session.recording = Recording.from_config(self.config)
+        if streaming:
+            backend.start_stream().subscribe(session.recording.add_event)
+
+    def _wait_ready(self, session: TerminalSession) -> None:
+        """Block until the prompt is shown.
+
+        With ``ready_pattern`` the prompt is matched explicitly; otherwise the
+        shell counts as ready once it has drawn something and gone quiet.
+        """
+        if self.ready_pattern is not None:
+            if session.expect(self.ready_pattern, timeout=self.ready_timeout) is not None:
+                return
+            session.destroy()
+            raise TimeoutError("Shell did not become ready in time")
+
+        deadline = time.time() + self.ready_timeout
+        quiet = SettleConfig(strategy="quiet", quiet_period=0.1, timeout=self.ready_timeout)
+
+        while time.time() < deadline:
+            frame = settle(session.capture, quiet)
+            if frame.content.strip():
+                return
+
+        session.destroy()
+        raise TimeoutError("Shell did not become ready in time")
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        self.fill()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,272 @@
+"""Direct pty backend with an in-process terminal emulator."""
+
+from __future__ import annotations
+
+import fcntl
+import os
+import signal
+import struct
+import subprocess
+import sys
+import termios
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import Frame, cell_grid_class
+from terminal_state.capture.sgr import plain_text, render_line, styled_screen
+from terminal_state.input.keys import KeySequence
+from terminal_state.session.stream import OutputStream
+
+if TYPE_CHECKING:
+    from terminal_state.models.config import SessionConfig
+
+# Bytes sent for tmux key names, as a terminal in normal cursor mode would
+_KEY_BYTES = {
+    "Enter": b"\r",
+    "Escape": b"\x1b",
+    "Tab": b"\t",
+    "BTab": b"\x1b[Z",
+    "BSpace": b"\x7f",
+    "Space": b" ",
+    "Up": b"\x1b[A",
+    "Down": b"\x1b[B",
+    "Right": b"\x1b[C",
+    "Left": b"\x1b[D",
+    "Home": b"\x1b[H",
+    "End": b"\x1b[F",
+    "IC": b"\x1b[2~",
+    "DC": b"\x1b[3~",
+    "PPage": b"\x1b[5~",
+    "NPage": b"\x1b[6~",
+    "F1": b"\x1bOP",
+    "F2": b"\x1bOQ",
+    "F3": b"\x1bOR",
+    "F4": b"\x1bOS",
+    "F5": b"\x1b[15~",
+    "F6": b"\x1b[17~",
+    "F7": b"\x1b[18~",
+    "F8": b"\x1b[19~",
+    "F9": b"\x1b[20~",
+    "F10": b"\x1b[21~",
+    "F11": b"\x1b[23~",
+    "F12": b"\x1b[24~",
+}
+_KEY_ALIASES = {
+    "Insert": "IC",
+    "Delete": "DC",
+    "PageUp": "PPage",
+    "PgUp": "PPage",
+    "PageDown": "NPage",
+    "PgDn": "NPage",
+}
+# pyte stores private modes shifted left by five bits; DECCKM is ?1
+_DECCKM = 1 << 5
+
+
+def encode_key(name: str, application_cursor: bool = False) -> bytes:
+    """Translate a tmux key name such as ``C-c`` or ``M-Left`` to bytes.
+
+    Names tmux would not recognise are sent as literal text, as
+    ``tmux send-keys`` does.
+    """
+    if name.startswith("M-") and len(name) > 2:
+        return b"\x1b" + encode_key(name[2:], application_cursor)
+    if name.startswith("C-") and len(name) == 3:
+        char = name[2]
+        if char == "?":
+            return b"\x7f"
+        if char in " @":
+            return b"\0"
+        return bytes([ord(char.upper()) & 0x1F])
+
+    name = _KEY_ALIASES.get(name, name)
+    if application_cursor and name in ("Up", "Down", "Right", "Left"):
+        return b"\x1bO" + _KEY_BYTES[name][-1:]
+    return _KEY_BYTES.get(name, name.encode())
+
+
+# Exec wrapper run in the new session: make the pty on stdin the controlling
+# tty, then replace itself with the shell, keeping the pid. Avoids running
+# code between fork and exec (preexec_fn), which is unsafe with threads.
+_CONTROLLING_TTY = (
+    "import fcntl, os, sys, termios; "
+    "fcntl.ioctl(0, termios.TIOCSCTTY, 0); "
+    "os.execvp(sys.argv[1], sys.argv[1:])"
+)
+
+
+class PtyBackend:
+    """Runs the shell on a local pty and emulates the screen with ``pyte``.
+
+    Offers the same ``create``/``send_keys``/``capture``/``destroy`` surface
+    as :class:`TmuxBackend` for single-pane sessions. Output is fed to the
+    emulator by a reader thread as it arrives, so ``capture`` only reads
+    memory.
+    """
+
+    def __init__(self, config: SessionConfig) -> None:
+        try:
+            import pyte
+        except ImportError as e:
+            raise ImportError(
+                "The pty backend requires pyte: pip install terminal-state[pyte]"
+            ) from e
+
+        self.config = config
+        self.process: subprocess.Popen[bytes] | None = None
+        self.stream: OutputStream | None = None
+        self._pyte = pyte
+        self._lock = threading.Lock()
+        self._master: int | None = None
+        self._output: OutputStream | None = None
+        self._grid = cell_grid_class() if config.cell_grid else None
+        self.screen: Any = pyte.Screen(config.width, config.height)
+        self._parser: Any = pyte.Stream(self.screen)
+
+    def create(self, start_directory: Path | None = None) -> None:
+        """Spawn the shell on a new pty."""
+        master, slave = os.openpty()
+        winsize = struct.pack("HHHH", self.config.height, self.config.width, 0, 0)
+        fcntl.ioctl(slave, termios.TIOCSWINSZ, winsize)
+
+        env = os.environ.copy()
+        env.update(
+            TERM="xterm-256color",
+            COLUMNS=str(self.config.width),
+            LINES=str(self.config.height),
+        )
+        env.update(self.config.environment)
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-S", "-c", _CONTROLLING_TTY, self.config.shell],
+                stdin=slave,
+                stdout=slave,
+                stderr=slave,
+                cwd=start_directory,
+                env=env,
+                start_new_session=True,
+            )
+        finally:
+            os.close(slave)
+
+        self._master = master
+        # Answer device status and attribute queries from the application
+        self.screen.write_process_input = self._write_input
+        self._output = OutputStream()
+        self._output.subscribe(self._feed)
+        self._output.attach(master, f"pty-{self.process.pid}")
+
+    def _feed(self, event: OutputEvent) -> None:
+        with self._lock:
+            self._parser.feed(event.data)
+
+    def _write_input(self, data: str) -> None:
+        if self._master is not None:
+            with suppress(OSError):
+                os.write(self._master, data.encode())
+
+    def send_keys(self, keys: KeySequence) -> None:
+        """Send keys to terminal."""
+        if self._master is None:
+            raise RuntimeError("Session not created")
+
+        if keys.literal:
+            data = keys.keys.encode()
+        else:
+            with self._lock:
+                application_cursor = _DECCKM in self.screen.mode
+            data = encode_key(keys.keys, application_cursor)
+
+        view = memoryview(data)
+        while view:
+            written = os.write(self._master, view)
+            view = view[written:]
+
+    def capture(self) -> Frame:
+        """Read the emulated screen."""
+        if self._master is None:
+            raise RuntimeError("Session not created")
+
+        styled = ansi_data = None
+        with self._lock:
+            if self.config.color_capture:
+                styled = list(styled_screen(self.screen))
+            else:
+                rows = [row.rstrip() for row in self.screen.display]
+            grid = self._grid.from_screen(self.screen) if self._grid is not None else None
+
+        # Match tmux capture-pane, which omits trailing blank rows
+        if styled is not None:
+            while styled and not styled[-1]:
+                styled.pop()
+            content = plain_text(tuple(styled))
+            ansi_data = "\n".join(render_line(line) for line in styled).encode()
+            styled = tuple(styled)
+        else:
+            while rows and not rows[-1]:
+                rows.pop()
+            content = "\n".join(rows)
+
+        return Frame.trusted(
+            content,
+            self.config.width,
+            self.config.height,
+            time.time(),
+            ansi_data=ansi_data,
+            grid=grid,
+            styled_lines=styled,
+        )
+
+    def is_alive(self) -> bool:
+        """Whether the shell is still running."""
+        return self.process is not None and self.process.poll() is None
+
+    def reset(self, start_directory: Path | None = None) -> None:
+        """Replace the shell with a fresh one on a new pty and clear the screen."""
+        self._terminate()
+        with self._lock:
+            self.screen.reset()
+            self._parser = self._pyte.Stream(self.screen)
+        self.create(start_directory)
+
+    def start_stream(self) -> OutputStream:
+        """Expose the pty output as a stream of timestamped events."""
+        if self._output is None:
+            raise RuntimeError("Session not created")
+        self.stream = self._output
+        return self.stream
+
+    def stop_stream(self) -> None:
+        """Detach stream subscribers; the emulator keeps reading."""
+        if self.stream is None:
+            return
+        self.stream.reset_subscribers(keep=[self._feed])
+        self.stream = None
+
+    def destroy(self) -> None:
+        """Stop the shell and release the pty."""
+        self.stop_stream()
+        self._terminate()
+
+    def _terminate(self) -> None:
+        """Hang up the shell's process group and stop reading."""
+        if self.process is not None:
+            with suppress(ProcessLookupError):
+                os.killpg(self.process.pid, signal.SIGHUP)
+            try:
+                self.process.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                with suppress(ProcessLookupError):
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                self.process.wait()
+            self.process = None
+
+        if self._output is not None:
+            # Closing the stream closes the master descriptor it owns
+            self._output.close()
+            self._output = None
+        self._master = None
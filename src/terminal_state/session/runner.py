@@ -0,0 +1,166 @@
+"""Run one scenario against many session configurations in parallel."""
+
+from __future__ import annotations
+
+import os
+import traceback
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from pydantic import BaseModel
+
+from terminal_state.capture.delta import DeltaFrameStore
+from terminal_state.capture.events import OutputEvent
+from terminal_state.capture.frame import Frame
+from terminal_state.capture.journal import JournalFrameStore
+from terminal_state.capture.recorder import Recording
+from terminal_state.capture.store import FrameStore
+from terminal_state.models.config import SessionConfig
+from terminal_state.session.terminal import TerminalSession
+
+Scenario = Callable[[TerminalSession], Any]
+
+# Plain tuples pickle far faster than Pydantic models; the parent rebuilds the
+# models without re-validating data it produced itself.
+_PackedFrame = tuple[str, int, int, float, bytes | None, dict[str, str]]
+_PackedRecording = tuple[dict[str, Any], list[_PackedFrame], list[tuple[float, str]]]
+
+
+class ScenarioResult(BaseModel):
+    """Outcome of running a scenario against one configuration."""
+
+    config: SessionConfig
+    recording: Recording
+    value: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the scenario completed without raising."""
+        return self.error is None
+
+
+def _pack_recording(recording: Recording) -> _PackedRecording:
+    """Flatten a recording into builtin types for cheap pickling.
+
+    Frames of a recording journaled to an explicit path stay on disk; the
+    parent reopens the journal instead of receiving them.
+    """
+    settings = recording.model_dump(exclude={"frames", "events"})
+    if isinstance(recording.frames, JournalFrameStore) and recording.journal_path is not None:
+        recording.frames.close()
+        frames = []
+    else:
+        frames = [
+            (f.content, f.width, f.height, f.timestamp, f.ansi_data, f.metadata)
+            for f in recording.frames
+        ]
+    return settings, frames, [(e.timestamp, e.data) for e in recording.events]
+
+
+def _unpack_recording(packed: _PackedRecording) -> Recording:
+    """Rebuild a recording packed by :func:`_pack_recording`."""
+    settings, frames, events = packed
+    storage = settings["storage"]
+    store: list[Frame] | FrameStore
+    if storage == "delta":
+        store = DeltaFrameStore(settings["keyframe_interval"])
+    elif storage == "journal":
+        store = JournalFrameStore(settings["journal_path"], settings["memory_window"], resume=True)
+    else:
+        store = []
+    store.extend(Frame.trusted(*frame) for frame in frames)
+
+    return Recording.model_construct(
+        **settings,
+        frames=store,
+        events=[OutputEvent.model_construct(timestamp=t, data=d) for t, d in events],
+    )
+
+
+def _run_batch(
+    scenario: Scenario,
+    configs: list[dict[str, Any]],
+) -> list[tuple[_PackedRecording, Any, str | None]]:
+    """Worker entry point: run the scenario once per configuration."""
+    results = []
+    for data in configs:
+        session = TerminalSession(SessionConfig.model_validate(data))
+        value, error = None, None
+        try:
+            session.start()
+            value = scenario(session)
+        # Any failure belongs to this configuration alone; raising it would
+        # discard the results of every other configuration in the run.
+        except Exception:  # noqa: BLE001
+            error = traceback.format_exc()
+        finally:
+            session.destroy()
+        results.append((_pack_recording(session.recording), value, error))
+    return results
+
+
+class ScenarioRunner:
+    """Fans a scenario out over a process pool.
+
+    Each worker process runs ``sessions_per_task`` configurations back to back,
+    and at most ``workers_per_core`` workers run per CPU core. Results come
+    back in the order of the given configurations.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        workers_per_core: float = 1.0,
+        sessions_per_task: int = 1,
+    ) -> None:
+        if sessions_per_task < 1:
+            raise ValueError("sessions_per_task must be at least 1")
+
+        cores = os.cpu_count() or 1
+        self.max_workers = max_workers or max(1, int(cores * workers_per_core))
+        self.sessions_per_task = sessions_per_task
+
+    def run(
+        self,
+        scenario: Scenario,
+        configs: Iterable[SessionConfig | dict[str, Any]],
+    ) -> list[ScenarioResult]:
+        """Run ``scenario`` once per configuration and collect the results."""
+        return list(self.iter_results(scenario, configs))
+
+    def iter_results(
+        self,
+        scenario: Scenario,
+        configs: Iterable[SessionConfig | dict[str, Any]],
+    ) -> Iterator[ScenarioResult]:
+        """Yield results in configuration order as batches complete.
+
+        ``scenario`` and its return value must be picklable, e.g. a
+        module-level function.
+        """
+        resolved = [
+            c if isinstance(c, SessionConfig) else SessionConfig.model_validate(c) for c in configs
+        ]
+        batches = [
+            resolved[i : i + self.sessions_per_task]
+            for i in range(0, len(resolved), self.sessions_per_task)
+        ]
+        if not batches:
+            return
+
+        workers = min(self.max_workers, len(batches))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_run_batch, scenario, [c.model_dump() for c in batch])
+                for batch in batches
+            ]
+            for batch, future in zip(batches, futures, strict=True):
+                for config, (packed, value, error) in zip(batch, future.result(), strict=True):
+                    yield ScenarioResult.model_construct(
+                        config=config,
+                        recording=_unpack_recording(packed),
+                        value=value,
+                        error=error,
+                    )
@@ -0,0 +1,93 @@
+"""Output-settle detection before recording a frame."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from terminal_state.capture.frame import Frame
+
+if TYPE_CHECKING:
+    from terminal_state.models.config import SettleConfig
+    from terminal_state.session.async_backend import AsyncOutputStream
+    from terminal_state.session.stream import OutputStream
+
+
+def settle(
+    capture: Callable[[], Frame],
+    config: SettleConfig,
+    stream: OutputStream | None = None,
+) -> Frame:
+    """Wait until the pane stops changing, then return a frame of it.
+
+    The ``fixed`` strategy sleeps for ``config.delay``. The ``quiet`` strategy
+    returns as soon as no change has been seen for ``config.quiet_period``,
+    but never waits longer than ``config.timeout``. With an output stream the
+    quiet period is measured from the last streamed byte and only one capture
+    is taken; otherwise consecutive captures are compared and the last one is
+    returned.
+    """
+    if config.strategy == "fixed":
+        time.sleep(config.delay)
+        return capture()
+
+    start = time.time()
+    deadline = start + config.timeout
+
+    if stream is not None:
+        while True:
+            now = time.time()
+            last_change = max(start, stream.last_output_at or start)
+            remaining = min(last_change + config.quiet_period, deadline) - now
+            if remaining <= 0:
+                return capture()
+            time.sleep(remaining)
+
+    frame = capture()
+    last_change = start
+    while True:
+        now = time.time()
+        if now - last_change >= config.quiet_period or now >= deadline:
+            return frame
+        time.sleep(min(config.poll_interval, max(deadline - now, 0)))
+        probe = capture()
+        if probe.content != frame.content:
+            last_change = probe.timestamp
+        frame = probe
+
+
+async def settle_async(
+    capture: Callable[[], Awaitable[Frame]],
+    config: SettleConfig,
+    stream: AsyncOutputStream | None = None,
+) -> Frame:
+    """Asyncio variant of :func:`settle`."""
+    if config.strategy == "fixed":
+        await asyncio.sleep(config.delay)
+        return await capture()
+
+    start = time.time()
+    deadline = start + config.timeout
+
+    if stream is not None:
+        while True:
+            now = time.time()
+            last_change = max(start, stream.last_output_at or start)
+            remaining = min(last_change + config.quiet_period, deadline) - now
+            if remaining <= 0:
+                return await capture()
+            await asyncio.sleep(remaining)
+
+    frame = await capture()
+    last_change = start
+    while True:
+        now = time.time()
+        if now - last_change >= config.quiet_period or now >= deadline:
+            return frame
+        await asyncio.sleep(min(config.poll_interval, max(deadline - now, 0)))
+        probe = await capture()
+        if probe.content != frame.content:
+            last_change = probe.timestamp
+        frame = probe
@@ -0,0 +1,141 @@
+"""Streaming pane output through a FIFO or a pty."""
+
+from __future__ import annotations
+
+import codecs
+import os
+import select
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from terminal_state.capture.events import OutputEvent
+
+OutputCallback = Callable[[OutputEvent], None]
+
+_READ_SIZE = 65536
+
+
+class OutputStream:
+    """Reads pane output from a FIFO and emits timestamped events.
+
+    The backend points ``tmux pipe-pane`` at the FIFO once; from then on every
+    byte the pane writes arrives here without further tmux round trips.
+    Without a FIFO path, :meth:`attach` reads an already open descriptor
+    such as a pty master instead.
+    """
+
+    def __init__(self, fifo_path: Path | None = None) -> None:
+        self.fifo_path = fifo_path
+        self.last_output_at: float | None = None
+        self.sequence = 0
+        self._changed = threading.Condition()
+        self._subscribers: list[OutputCallback] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._fd: int | None = None
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._reader: threading.Thread | None = None
+
+    def open(self) -> None:
+        """Create the FIFO and start the reader thread."""
+        if self.fifo_path is None:
+            raise RuntimeError("No FIFO path to open")
+        if self.fifo_path.exists():
+            self.fifo_path.unlink()
+        os.mkfifo(self.fifo_path, 0o600)
+
+        # Opening read-write keeps a writer reference, so the FIFO never
+        # reports EOF between the pipe-pane command starting and stopping.
+        self.attach(os.open(self.fifo_path, os.O_RDWR | os.O_NONBLOCK), self.fifo_path.stem)
+
+    def attach(self, fd: int, name: str = "fd") -> None:
+        """Start the reader thread on an open descriptor, taking ownership of it."""
+        os.set_blocking(fd, False)
+        self._fd = fd
+        self._wake_r, self._wake_w = os.pipe()
+        self._reader = threading.Thread(
+            target=self._read_loop,
+            name=f"output-stream-{name}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def subscribe(self, callback: OutputCallback) -> None:
+        """Register a callback invoked for every output event."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: OutputCallback) -> None:
+        """Remove a previously registered callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def reset_subscribers(self, keep: list[OutputCallback] | None = None) -> None:
+        """Remove every callback except those in ``keep``."""
+        self._subscribers = [cb for cb in self._subscribers if cb in (keep or [])]
+
+    def wait_for_output(self, sequence: int, timeout: float | None = None) -> bool:
+        """Block until an event newer than ``sequence`` arrives."""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.sequence > sequence, timeout)
+
+    def close(self) -> None:
+        """Stop reading, flush pending output and remove the FIFO."""
+        if self._reader is not None and self._wake_w is not None:
+            os.write(self._wake_w, b"\0")
+            self._reader.join(timeout=2.0)
+            self._reader = None
+
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._wake_r = self._wake_w = None
+
+        if self.fifo_path is not None and self.fifo_path.exists():
+            self.fifo_path.unlink()
+
+    def _read_loop(self) -> None:
+        """Read until woken by ``close``, then drain what is left."""
+        assert self._fd is not None and self._wake_r is not None
+
+        watched = [self._fd, self._wake_r]
+        while True:
+            ready, _, _ = select.select(watched, [], [])
+            if self._fd in ready and not self._drain():
+                # Writer side is gone: only a wake-up can follow
+                watched = [self._wake_r]
+            if self._wake_r in ready:
+                if self._fd in watched:
+                    self._drain()
+                return
+
+    def _drain(self) -> bool:
+        """Read everything currently buffered; False once the input has ended."""
+        assert self._fd is not None
+
+        while True:
+            try:
+                chunk = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return True
+            except OSError:
+                # A pty master reports EIO once the child side is closed
+                return False
+            if not chunk:
+                return False
+            self._emit(time.time(), chunk)
+
+    def _emit(self, timestamp: float, chunk: bytes) -> None:
+        """Decode a chunk and hand it to subscribers."""
+        data = self._decoder.decode(chunk)
+        if not data:
+            return
+        self.last_output_at = timestamp
+        event = OutputEvent(timestamp=timestamp, data=data)
+        for callback in list(self._subscribers):
+            callback(event)
+
+        with self._changed:
+            self.sequence += 1
+            self._changed.notify_all()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import re
-import time
 from typing import Self
 
 from terminal_state.capture.frame import Frame
@@ -11,6 +10,9 @@ from terminal_state.capture.recorder import Recording
 from terminal_state.input.keys import KeySequence, Keys
 from terminal_state.models.config import SessionConfig
 from terminal_state.session.backend import TmuxBackend
+from terminal_state.session.expect import ExpectMatch, Expecter
+from terminal_state.session.pty_backend import PtyBackend
+from terminal_state.session.settle import settle
 
 
 class TerminalSession:
@@ -18,8 +20,10 @@ class TerminalSession:
 
     def __init__(self, config: SessionConfig) -> None:
         self.config = config
-        self.backend = TmuxBackend(config)
-        self.recording = Recording(width=config.width, height=config.height)
+        self.backend: TmuxBackend | PtyBackend = (
+            PtyBackend(config) if config.backend == "pty" else TmuxBackend(config)
+        )
+        self.recording = Recording.from_config(config)
         self._started = False
 
     @classmethod
@@ -35,6 +39,9 @@ class TerminalSession:
         if not self._started:
             self.backend.create()
             self._started = True
+            if self.config.capture_mode == "stream":
+                stream = self.backend.start_stream()
+                stream.subscribe(self.recording.add_event)
 
     def send_keys(self, keys: str | KeySequence, record: bool = True) -> None:
         """Send key sequence to terminal."""
@@ -43,9 +50,9 @@ class TerminalSession:
 
         self.backend.send_keys(keys)
 
-        if record:
-            time.sleep(0.1)  # Brief delay for output
-            self.recording.add_frame(self.capture())
+        if record and self.config.capture_mode == "poll":
+            frame = settle(self.capture, self.config.settle, self.backend.stream)
+            self.recording.add_frame(frame)
 
     def send_command(self, command: str, record: bool = True) -> None:
         """Send command and press enter."""
@@ -56,17 +63,18 @@ class TerminalSession:
         """Capture current terminal state."""
         return self.backend.capture()
 
+    def expect(
+        self,
+        *patterns: str | re.Pattern[str],
+        timeout: float = 5.0,
+    ) -> ExpectMatch | None:
+        """Wait for any of the patterns to appear and report which matched."""
+        expecter = Expecter(patterns)
+        return expecter.wait(self.capture, timeout, stream=self.backend.stream)
+
     def expect_text(self, pattern: str, timeout: float = 5.0) -> bool:
         """Wait for text to appear in terminal output."""
-        start_time = time.time()
-
-        while (time.time() - start_time) < timeout:
-            frame = self.capture()
-            if re.search(pattern, frame.content):
-                return True
-            time.sleep(0.1)
-
-        return False
+        return self.expect(pattern, timeout=timeout) is not None
 
     def destroy(self) -> None:
         """Destroy the terminal session."""
@@ -0,0 +1,119 @@
+# tests/test_archive.py
+"""Tests for the indexed binary recording archive."""
+
+from __future__ import annotations
+
+import pytest
+
+from terminal_state import Frame, MappedFrameStore, OutputEvent, Recording
+from terminal_state.capture.archive import ArchiveEventStore
+
+
+def make_recording(count: int) -> Recording:
+    """Recording with one frame per second and a couple of events."""
+    recording = Recording(started_at=1000.0, title="archived", environment={"TERM": "xterm"})
+    for i in range(count):
+        recording.add_frame(
+            Frame(content=f"frame {i}\n✓ done", width=80, height=24, timestamp=1000.0 + i)
+        )
+    recording.add_frame(
+        Frame(
+            content="styled",
+            width=80,
+            height=24,
+            timestamp=1000.0 + count,
+            ansi_data=b"\x1b[1mstyled",
+            metadata={"source": "test"},
+        )
+    )
+    recording.add_event(OutputEvent(timestamp=1000.5, data="héllo\r\n"))
+    return recording
+
+
+def test_archive_roundtrip(tmp_path):
+    """Test that a saved recording loads back equal."""
+    recording = make_recording(200)
+    path = tmp_path / "rec.tsrec"
+    recording.save(path)
+
+    loaded = Recording.load(path)
+    assert isinstance(loaded.frames, MappedFrameStore)
+    assert len(loaded.frames) == 201
+    assert list(loaded.frames) == list(recording.frames)
+    assert loaded.events == recording.events
+    assert loaded.title == "archived"
+    assert loaded.environment == {"TERM": "xterm"}
+    assert loaded.duration == recording.duration
+    assert loaded.frames[-1].ansi_data == b"\x1b[1mstyled"
+    assert loaded.frames[-1].metadata == {"source": "test"}
+
+
+def test_archive_events_are_lazy(tmp_path):
+    """Test that opening an archive decodes no events until they are read."""
+    recording = make_recording(1)
+    for i in range(1000):
+        recording.add_event(OutputEvent(timestamp=1001.0 + i, data=f"line {i}\r\n"))
+    path = tmp_path / "stream.tsrec"
+    recording.save(path)
+
+    loaded = Recording.load(path)
+    assert isinstance(loaded.events, ArchiveEventStore)
+    assert len(loaded.events) == 1001
+    assert loaded.events._offsets is None
+
+    assert loaded.events[-1].data == "line 999\r\n"
+    assert loaded.events[1:3] == recording.events[1:3]
+    assert list(loaded.events) == recording.events
+
+
+def test_archive_seek(tmp_path):
+    """Test timestamp and range lookups."""
+    path = tmp_path / "rec.tsrec"
+    make_recording(5000).save(path)
+    loaded = Recording.load(path)
+
+    assert loaded.frame_at(1834.2).content.startswith("frame 1834\n")
+    assert loaded.frame_at(-1.0) is None
+    assert loaded.frame_at(10**6).content == "styled"
+    assert [f.timestamp for f in loaded.frames[1000:1003]] == [2000.0, 2001.0, 2002.0]
+    assert loaded.frames.index_at(1000.0 + 42.5) == 42
+
+
+def test_frame_at_without_archive():
+    """Test that frame_at works for in-memory recordings too."""
+    recording = make_recording(10)
+    assert recording.frame_at(3.5).content.startswith("frame 3\n")
+
+    delta = Recording(frames=list(recording.frames), started_at=1000.0, storage="delta")
+    assert delta.frame_at(3.5).content.startswith("frame 3\n")
+
+
+def test_archive_is_read_only(tmp_path):
+    """Test that loaded frames cannot be appended and the mapping can be closed."""
+    path = tmp_path / "rec.tsrec"
+    make_recording(3).save(path)
+    store = MappedFrameStore(path)
+
+    with pytest.raises(TypeError):
+        store.append(store[0])
+    store.close()
+    assert store.closed
+
+
+def test_archive_rejects_other_files(tmp_path):
+    """Test that non-archives and truncated archives are refused."""
+    other = tmp_path / "other.cast"
+    other.write_text('{"version": 2}\n' * 10)
+    with pytest.raises(ValueError):
+        MappedFrameStore(other)
+
+    path = tmp_path / "rec.tsrec"
+    make_recording(3).save(path)
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError):
+        MappedFrameStore(path)
+
+    empty = tmp_path / "empty.tsrec"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        MappedFrameStore(empty)
@@ -0,0 +1,93 @@
+# tests/test_asciinema.py
+"""Tests for diff-based and live asciinema export."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from terminal_state import AsciinemaExporter, Frame, OutputEvent, Recording
+from terminal_state.export.asciinema import screen_diff
+
+
+def read_events(path):
+    """Parse the event lines of a cast file."""
+    return [json.loads(line) for line in path.read_text().splitlines()[1:]]
+
+
+def make_recording() -> Recording:
+    """Recording of a screen where one row changes per frame."""
+    recording = Recording(started_at=0.0)
+    screens = [
+        ["$ ls", "", ""],
+        ["$ ls", "a.txt  b.txt", ""],
+        ["$ ls", "a.txt  b.txt", "$ "],
+        ["$ clear", "", ""],
+    ]
+    for i, rows in enumerate(screens):
+        recording.add_frame(Frame(content="\n".join(rows), width=20, height=3, timestamp=i + 1.0))
+    return recording
+
+
+def test_screen_diff_rewrites_changed_rows():
+    """Test the escapes emitted for a full redraw and for a change."""
+    assert screen_diff(None, ("ab", "", "c")) == "\x1b[H\x1b[2J\x1b[1;1Hab\x1b[3;1Hc"
+    assert screen_diff(("ab", "x"), ("ab", "y")) == "\x1b[2;1Hy\x1b[K"
+    assert screen_diff(("ab", "x"), ("ab",)) == "\x1b[2;1H\x1b[K"
+    assert screen_diff(("ab",), ("ab",)) == ""
+
+
+def test_diff_export_is_smaller(tmp_path):
+    """Test that diff export only writes what changed."""
+    recording = make_recording()
+    AsciinemaExporter().export(recording, tmp_path / "diff.cast")
+    AsciinemaExporter(diff=False).export(recording, tmp_path / "full.cast")
+
+    diff_events = read_events(tmp_path / "diff.cast")
+    full_events = read_events(tmp_path / "full.cast")
+    assert [e[0] for e in diff_events] == [e[0] for e in full_events]
+    assert full_events[1][2] == "$ ls\na.txt  b.txt\n"
+    assert diff_events[1][2] == "\x1b[2;1Ha.txt  b.txt\x1b[K"
+
+
+def test_diff_export_replays_screens(tmp_path):
+    """Test that feeding the diff events to an emulator reproduces every frame."""
+    pyte = pytest.importorskip("pyte")
+    recording = make_recording()
+    path = tmp_path / "diff.cast"
+    AsciinemaExporter().export(recording, path)
+
+    screen = pyte.Screen(20, 3)
+    stream = pyte.Stream(screen)
+    for event, frame in zip(read_events(path), recording.frames, strict=True):
+        stream.feed(event[2])
+        assert [row.rstrip() for row in screen.display] == [line.rstrip() for line in frame.lines]
+
+
+def test_live_export_follows_recording(tmp_path):
+    """Test that a live writer appends events as frames are recorded."""
+    recording = Recording(started_at=0.0)
+    recording.add_frame(Frame(content="one", width=10, height=2, timestamp=1.0))
+    path = tmp_path / "live.cast"
+
+    with AsciinemaExporter().live(recording, path):
+        assert len(read_events(path)) == 1
+        recording.add_frame(Frame(content="one\ntwo", width=10, height=2, timestamp=2.0))
+        assert read_events(path)[-1] == [2.0, "o", "\x1b[2;1Htwo\x1b[K"]
+        recording.add_frame(Frame(content="one\ntwo", width=10, height=2, timestamp=5.0))
+
+    assert read_events(path)[-1] == [5.0, "o", ""]
+    recording.add_frame(Frame(content="after", width=10, height=2, timestamp=6.0))
+    assert len(read_events(path)) == 3
+
+
+def test_live_export_streams_events(tmp_path):
+    """Test that streamed output events are written verbatim as they arrive."""
+    recording = Recording(started_at=0.0)
+    path = tmp_path / "live.cast"
+    writer = AsciinemaExporter().live(recording, path)
+    recording.add_event(OutputEvent(timestamp=0.5, data="hi\r\n"))
+    writer.close()
+
+    assert read_events(path) == [[0.5, "o", "hi\r\n"]]
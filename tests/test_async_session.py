@@ -0,0 +1,72 @@
+# tests/test_async_session.py
+"""Tests for AsyncTerminalSession requiring tmux."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+
+import pytest
+
+from terminal_state import AsyncTerminalSession
+from terminal_state.input import Keys
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+def test_async_session_roundtrip():
+    """Test sending commands and capturing asynchronously."""
+
+    async def scenario() -> None:
+        async with await AsyncTerminalSession.create(width=80, height=24) as session:
+            await session.send_command("echo async-$((2 * 21))")
+            assert await session.expect_text("async-42", timeout=5.0)
+
+            frame = await session.capture()
+            assert frame.width == 80
+            assert "async-42" in frame.content
+            assert len(session.recording.frames) == 1
+
+        assert session._started is False
+        assert not session.backend.socket_path.exists()
+
+    asyncio.run(scenario())
+
+
+def test_async_sessions_concurrently():
+    """Test driving several sessions from one event loop."""
+
+    async def run_one(index: int) -> bool:
+        session = await AsyncTerminalSession.create(width=80, height=24)
+        try:
+            assert await session.expect(r"[$#] ?$", timeout=30.0) is not None
+            await session.send_keys(f"echo session-{index}-done", record=False)
+            await session.send_keys(Keys.ENTER, record=False)
+            match = await session.expect(rf"(?m)^session-{index}-done", timeout=10.0)
+            return match is not None
+        finally:
+            await session.destroy()
+
+    async def scenario() -> list[bool]:
+        return await asyncio.gather(*(run_one(i) for i in range(4)))
+
+    assert asyncio.run(scenario()) == [True, True, True, True]
+
+
+def test_async_stream_mode():
+    """Test streaming output through control-mode notifications."""
+
+    async def scenario() -> None:
+        session = await AsyncTerminalSession.create(width=80, height=24, capture_mode="stream")
+        try:
+            await session.send_command("echo streamed-$((3 + 4))")
+            assert await session.expect_text("streamed-7", timeout=5.0)
+            output = "".join(event.data for event in session.recording.events)
+            assert "streamed-7" in output
+        finally:
+            await session.destroy()
+
+    asyncio.run(scenario())
@@ -0,0 +1,112 @@
+# tests/test_cast.py
+"""Tests for reading asciicast files back into recordings."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from terminal_state import AsciinemaExporter, Frame, OutputEvent, Recording
+from terminal_state.capture import CastEventStore, CastFrameStore
+
+
+def write_cast(path, events, width=20, height=3):
+    """Write a minimal asciicast v2 file."""
+    header = {"version": 2, "width": width, "height": height, "timestamp": 1000}
+    lines = [json.dumps(header)] + [json.dumps(event) for event in events]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_read_events_lazily(tmp_path):
+    """Test that output events are indexed and parsed on access."""
+    path = tmp_path / "in.cast"
+    write_cast(path, [[0.5, "o", "hello\r\n"], [0.7, "i", "x"], [1.0, "o", "world"]])
+
+    recording = Recording.from_asciinema(path)
+    assert isinstance(recording.events, CastEventStore)
+    assert len(recording.events) == 2
+    assert recording.events[-1] == OutputEvent(timestamp=1001.0, data="world")
+    assert [e.data for e in recording.events] == ["hello\r\n", "world"]
+    assert recording.started_at == 1000.0
+    assert recording.duration == 1.0
+    assert len(recording.frames) == 0
+
+
+def test_reexport_is_verbatim(tmp_path):
+    """Test that an imported cast exports back to the same events."""
+    path = tmp_path / "in.cast"
+    events = [[0.5, "o", "a\x1b[31mb"], [1.25, "o", "\r\nc"]]
+    write_cast(path, events)
+
+    out = tmp_path / "out.cast"
+    Recording.from_asciinema(path).to_asciinema(out)
+    assert [json.loads(line) for line in out.read_text().splitlines()[1:]] == events
+
+
+def test_emulated_frames_match_recorded_screens(tmp_path):
+    """Test rebuilding screens from a diff-encoded cast."""
+    pytest.importorskip("pyte")
+    original = Recording(started_at=0.0)
+    for i in range(30):
+        rows = [f"step {i}", "x" * (i % 7), "done" if i % 2 else ""]
+        original.add_frame(Frame(content="\n".join(rows), width=20, height=3, timestamp=i + 1.0))
+    path = tmp_path / "diff.cast"
+    AsciinemaExporter().export(original, path)
+
+    imported = Recording.from_asciinema(path, emulate=True)
+    assert isinstance(imported.frames, CastFrameStore)
+    assert len(imported.frames) == 30
+    # Trailing blank rows are dropped, as tmux and the pty backend do
+    expected = [f.content.rstrip("\n") for f in original.frames]
+    assert [f.content for f in imported.frames] == expected
+    assert imported.frames[17].content == expected[17]
+    assert imported.frame_at(4.5).content == expected[3]
+    assert imported.frames[2].content == "step 2\nxx"
+
+
+def test_emulated_random_access_uses_checkpoints(tmp_path):
+    """Test that checkpoints are taken and random access stays correct."""
+    pytest.importorskip("pyte")
+    path = tmp_path / "count.cast"
+    write_cast(path, [[i * 0.1, "o", f"\r{i:>4}"] for i in range(100)], width=10, height=2)
+
+    store = Recording.from_asciinema(path, emulate=True).frames
+    store.checkpoint_interval = 10
+    assert store[99].lines[0] == "  99"
+    assert [c[0] for c in store._checkpoints] == list(range(0, 101, 10))
+    assert store[42].lines[0] == "  42"
+    assert store[5].lines[0] == "   5"
+
+
+def test_checkpoints_skip_open_escape_sequences(tmp_path):
+    """Test that no checkpoint is taken while an escape sequence is split across events."""
+    pytest.importorskip("pyte")
+    path = tmp_path / "split.cast"
+    events = [[0.1, "o", "\ra"], [0.2, "o", "\x1b[3"], [0.3, "o", "1mb"], [0.4, "o", "\x1b[0mc"]]
+    write_cast(path, events, width=10, height=2)
+
+    store = Recording.from_asciinema(path, emulate=True).frames
+    store.checkpoint_interval = 1
+    assert [f.content for f in store] == ["a", "a", "ab", "abc"]
+    assert [c[0] for c in store._checkpoints] == [0, 1, 4]
+    assert store[3].content == "abc"
+
+
+def test_emulated_resize(tmp_path):
+    """Test that resize events change the rebuilt frame size."""
+    pytest.importorskip("pyte")
+    path = tmp_path / "resize.cast"
+    write_cast(path, [[0.1, "o", "a"], [0.2, "r", "30x5"], [0.3, "o", "b"]])
+
+    frames = list(Recording.from_asciinema(path, emulate=True).frames)
+    assert [(f.width, f.height) for f in frames] == [(20, 3), (30, 5)]
+    assert frames[-1].lines[0] == "ab"
+
+
+def test_rejects_non_cast(tmp_path):
+    """Test that files without an asciicast v2 header are refused."""
+    path = tmp_path / "bad.cast"
+    path.write_text('{"version": 1}\n')
+    with pytest.raises(ValueError):
+        Recording.from_asciinema(path)
@@ -0,0 +1,108 @@
+# tests/test_control.py
+"""Tests for the tmux control-mode client."""
+
+from __future__ import annotations
+
+import shutil
+import time
+
+import pytest
+
+from terminal_state import TerminalSession
+from terminal_state.input import Keys
+from terminal_state.session.control import (
+    ControlModeParser,
+    ControlNotification,
+    ControlReply,
+    quote_argument,
+    unescape_output,
+)
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+def test_quote_argument():
+    """Test quoting for the tmux command parser."""
+    assert quote_argument("send-keys") == "send-keys"
+    assert quote_argument("%1") == "%1"
+    assert quote_argument("echo $HOME") == '"echo \\$HOME"'
+    assert quote_argument('say "hi"') == '"say \\"hi\\""'
+    assert quote_argument("a\nb\x1b") == '"a\\nb\\033"'
+    assert quote_argument("") == '""'
+
+
+def test_unescape_output():
+    """Test decoding of %output payloads."""
+    assert unescape_output(b"hi\\015\\012") == b"hi\r\n"
+    assert unescape_output(b"back\\134slash") == b"back\\slash"
+
+
+def test_parser_reply():
+    """Test parsing a command reply block."""
+    parser = ControlModeParser()
+    assert parser.feed(b"%begin 1700000000 12 1") is None
+    assert parser.feed(b"line one") is None
+    assert parser.feed(b"%output looks like a notification") is None
+    reply = parser.feed(b"%end 1700000000 12 1")
+
+    assert isinstance(reply, ControlReply)
+    assert reply.number == 12
+    assert reply.from_client is True
+    assert reply.error is False
+    assert reply.lines == ["line one", "%output looks like a notification"]
+
+
+def test_parser_error_and_notification():
+    """Test parsing errors and notifications."""
+    parser = ControlModeParser()
+    parser.feed(b"%begin 1700000000 3 1")
+    parser.feed(b"unknown command: bogus")
+    reply = parser.feed(b"%error 1700000000 3 1")
+    assert isinstance(reply, ControlReply)
+    assert reply.error is True
+
+    notification = parser.feed(b"%output %0 hello\\015\\012")
+    assert isinstance(notification, ControlNotification)
+    assert notification.name == "output"
+    assert notification.data == b"%0 hello\\015\\012"
+
+
+@requires_tmux
+def test_control_mode_session():
+    """Test driving a session through the control client."""
+    with TerminalSession.create(width=80, height=24, control_mode=True) as session:
+        assert session.backend.control is not None
+        assert session.backend.control.alive
+
+        session.send_command("echo \"quoted $((40 + 2))\" 'single'")
+        assert session.expect_text("quoted 42 single", timeout=5.0)
+
+        frame = session.capture()
+        assert frame.width == 80
+        assert len(frame.content.split("\n")) <= 24
+
+    assert session.backend.control is None
+
+
+@requires_tmux
+def test_control_mode_special_keys():
+    """Test special keys through the control client."""
+    with TerminalSession.create(width=80, height=24, control_mode=True) as session:
+        session.send_keys("sleep 30", record=False)
+        session.send_keys(Keys.ENTER, record=False)
+        time.sleep(0.2)
+        session.send_keys(Keys.CTRL_C, record=False)
+        session.send_command("echo inter''rupted")
+        assert session.expect_text("(?m)^interrupted", timeout=5.0)
+
+
+@requires_tmux
+def test_control_mode_command_error():
+    """Test that failing commands raise."""
+    with TerminalSession.create(width=80, height=24, control_mode=True) as session:
+        with pytest.raises(RuntimeError):
+            session.backend.cmd("no-such-command")
+        assert session.backend.cmd("display-message", "-p", "#{pane_width}") == ["80"]
@@ -0,0 +1,134 @@
+# tests/test_delta.py
+"""Tests for delta-encoded frame storage."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from terminal_state import DeltaFrameStore, Frame, Recording
+
+
+def make_frames(count: int, width: int = 40, height: int = 10) -> list[Frame]:
+    """Frames where one line changes per step, like a scrolling log."""
+    frames = []
+    lines = [""] * height
+    for i in range(count):
+        lines[i % height] = f"line {i}"
+        frames.append(
+            Frame(content="\n".join(lines), width=width, height=height, timestamp=100.0 + i)
+        )
+    return frames
+
+
+def test_delta_roundtrip():
+    """Test that every stored frame materializes unchanged."""
+    frames = make_frames(120)
+    store = DeltaFrameStore(keyframe_interval=16)
+    store.extend(frames)
+
+    assert len(store) == 120
+    assert list(store) == frames
+    assert store == frames
+    assert store.keyframe_count == 8
+
+
+def test_delta_random_access():
+    """Test indexing out of order, negative indices and slices."""
+    frames = make_frames(60)
+    store = DeltaFrameStore(keyframe_interval=10)
+    store.extend(frames)
+
+    for index in (37, 3, 59, 0, 38, 12):
+        assert store[index] == frames[index]
+    assert store[-1] == frames[-1]
+    assert store[5:9] == frames[5:9]
+    with pytest.raises(IndexError):
+        store[60]
+
+
+def test_delta_stores_only_changes():
+    """Test that deltas hold the changed lines rather than the whole screen."""
+    store = DeltaFrameStore()
+    store.extend(make_frames(5))
+
+    entries = store._entries
+    assert entries[0].content is not None
+    assert all(entry.content is None for entry in entries[1:])
+    assert all(len(entry.changes) == 1 for entry in entries[1:])
+
+
+def make_colored_frames(count: int, height: int = 10) -> list[Frame]:
+    """Frames like ``make_frames`` with a colored escaped screen, as color capture yields."""
+    frames = []
+    rows = [b""] * height
+    for i in range(count):
+        rows[i % height] = f"\x1b[3{i % 8}mline {i}\x1b[0m".encode()
+        ansi_data = b"\n".join(rows)
+        content = "\n".join(row.decode()[5:-4] if row else "" for row in rows)
+        frames.append(Frame.trusted(content, 40, height, 100.0 + i, ansi_data))
+    return frames
+
+
+def test_delta_encodes_colors_per_row():
+    """Test that escaped screens round trip while deltas keep only their changed rows."""
+    frames = make_colored_frames(40)
+    frames.insert(20, Frame.trusted(frames[19].content, 40, 10, 119.5))
+    store = DeltaFrameStore(keyframe_interval=16)
+    store.extend(frames)
+
+    assert [f.ansi_data for f in store] == [f.ansi_data for f in frames]
+    assert [store[i].ansi_data for i in (33, 20, 5, 21)] == [
+        frames[i].ansi_data for i in (33, 20, 5, 21)
+    ]
+    assert list(store) == frames
+
+    deltas = [entry for entry in store._entries if entry.content is None]
+    assert all(entry.ansi_data is None for entry in deltas)
+    assert all(len(entry.ansi_changes) <= 1 for entry in deltas)
+    stored = sum(
+        len(entry.ansi_data or b"") + sum(len(row) for _, row in entry.ansi_changes)
+        for entry in store._entries
+    )
+    assert stored * 4 < sum(len(f.ansi_data or b"") for f in frames)
+
+
+def test_delta_keyframe_on_resize_or_rewrite():
+    """Test that size changes and full redraws start a new keyframe."""
+    store = DeltaFrameStore()
+    store.append(Frame(content="a\nb", width=10, height=2, timestamp=1.0))
+    store.append(Frame(content="a\nb", width=20, height=2, timestamp=2.0))
+    store.append(Frame(content="x\ny", width=20, height=2, timestamp=3.0))
+
+    assert store.keyframe_count == 3
+    assert [f.content for f in store] == ["a\nb", "a\nb", "x\ny"]
+
+
+def test_recording_delta_storage(tmp_path):
+    """Test that a delta-backed recording behaves like a list-backed one."""
+    frames = make_frames(30)
+    plain = Recording(started_at=100.0)
+    delta = Recording(started_at=100.0, storage="delta", keyframe_interval=8)
+    for frame in frames:
+        plain.add_frame(frame)
+        delta.add_frame(frame)
+
+    assert isinstance(delta.frames, DeltaFrameStore)
+    assert delta.duration == plain.duration
+    assert delta.frames[-1].content == frames[-1].content
+    assert delta.model_dump()["frames"] == plain.model_dump()["frames"]
+
+    plain.to_asciinema(tmp_path / "plain.cast")
+    delta.to_asciinema(tmp_path / "delta.cast")
+    assert (tmp_path / "plain.cast").read_text() == (tmp_path / "delta.cast").read_text()
+
+
+def test_recording_delta_from_frames():
+    """Test that frames passed at construction are converted to the store."""
+    frames = make_frames(5)
+    recording = Recording(frames=frames, storage="delta")
+
+    assert isinstance(recording.frames, DeltaFrameStore)
+    assert recording.frames == frames
+    assert json.loads(recording.model_dump_json())["frames"][2]["content"] == frames[2].content
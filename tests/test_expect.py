@@ -0,0 +1,124 @@
+# tests/test_expect.py
+"""Tests for the incremental expect engine."""
+
+from __future__ import annotations
+
+import re
+import shutil
+import time
+
+import pytest
+
+from terminal_state import Frame, TerminalSession
+from terminal_state.session.expect import Expecter
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+def make_frame(content: str) -> Frame:
+    """Build a frame with the given content."""
+    return Frame(content=content, width=80, height=24, timestamp=time.time())
+
+
+def test_expecter_reports_matching_pattern():
+    """Test that the first matching pattern is reported with its line."""
+    expecter = Expecter(["error", r"pass(ed)?"])
+    result = expecter.check(make_frame("$ pytest\n3 passed\n$"))
+
+    assert result is not None
+    assert result.index == 1
+    assert result.pattern == r"pass(ed)?"
+    assert result.text == "passed"
+    assert result.line == 1
+
+
+def test_expecter_only_checks_changed_lines():
+    """Test that unchanged lines are not searched again."""
+
+    class CountingPattern:
+        pattern = "needle"
+        flags = 0
+
+        def __init__(self) -> None:
+            self.searched: list[str] = []
+
+        def search(self, text: str) -> re.Match[str] | None:
+            self.searched.append(text)
+            return re.search("needle", text)
+
+    pattern = CountingPattern()
+    expecter = Expecter([pattern])  # type: ignore[list-item]
+
+    assert expecter.check(make_frame("a\nb\nc")) is None
+    assert pattern.searched == ["a", "b", "c"]
+
+    pattern.searched.clear()
+    assert expecter.check(make_frame("a\nb\nc")) is None
+    assert pattern.searched == []
+
+    result = expecter.check(make_frame("a\nneedle\nc\nd"))
+    assert pattern.searched == ["needle"]
+    assert result is not None and result.line == 1
+
+
+def test_expecter_cross_line_patterns():
+    """Test that patterns spanning lines search the full content."""
+    expecter = Expecter([r"first\nsecond", r"^top"])
+
+    result = expecter.check(make_frame("top\nfirst\nsecond"))
+    assert result is not None
+    assert result.index == 0
+    assert result.line is None
+
+    assert Expecter([r"^second"]).check(make_frame("first\nsecond")) is None
+    assert Expecter([r"(?m)^second"]).check(make_frame("first\nsecond")) is not None
+
+
+def test_expecter_literal_newline_patterns():
+    """Test that patterns containing a real newline search the full content."""
+    frame = make_frame("foo\nbar")
+
+    for pattern in ("foo\nbar", "o\nb", re.compile("o\nb")):
+        result = Expecter([pattern]).check(frame)
+        assert result is not None
+        assert result.line is None
+
+
+def test_expecter_wait_timeout():
+    """Test waiting on content that never matches."""
+    expecter = Expecter(["never"])
+    start = time.time()
+    assert expecter.wait(lambda: make_frame("static"), timeout=0.1) is None
+    assert time.time() - start < 0.3
+
+
+def test_expecter_requires_patterns():
+    """Test that at least one pattern is needed."""
+    with pytest.raises(ValueError):
+        Expecter([])
+
+
+@requires_tmux
+def test_session_expect_multiple():
+    """Test waiting on several patterns in a session."""
+    with TerminalSession.create(width=80, height=24) as session:
+        session.send_command("echo res''ult-ok")
+        result = session.expect("result-fail", "result-ok", timeout=5.0)
+        assert result is not None
+        assert result.index == 1
+        assert result.text == "result-ok"
+
+
+@requires_tmux
+def test_session_expect_stream_wakeup():
+    """Test that streamed output wakes the waiter promptly."""
+    with TerminalSession.create(width=80, height=24, capture_mode="stream") as session:
+        assert session.expect_text("[$#]", timeout=5.0)
+        session.send_command("sleep 0.3; echo wo''ke")
+        start = time.time()
+        result = session.expect("(?m)^woke", timeout=5.0)
+        assert result is not None
+        assert time.time() - start < 1.0
@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+import subprocess
+import sys
 import time
 
-from terminal_state.capture import Frame
+from terminal_state.capture import Frame, Recording
 
 
 def test_frame_creation():
@@ -46,3 +50,79 @@ def test_frame_with_metadata():
         metadata={"source": "test"},
     )
     assert frame.metadata["source"] == "test"
+
+
+def test_trusted_frame_matches_validated():
+    """Test that the unvalidated constructor builds an equal frame."""
+    kwargs = {"content": "a\nb", "width": 80, "height": 24, "timestamp": 1.0}
+    trusted = Frame.trusted(*kwargs.values())
+    assert trusted == Frame(**kwargs)
+    assert trusted.model_dump() == Frame(**kwargs).model_dump()
+    assert Frame.trusted("x", 1, 1, 0.0, metadata={"k": "v"}).metadata == {"k": "v"}
+
+
+def test_frame_derived_views_are_cached():
+    """Test lines, ANSI-stripped text and content hash."""
+    frame = Frame(
+        content="\x1b[1;32mok\x1b[0m\n\x1b]0;title\x07plain",
+        width=80,
+        height=24,
+        timestamp=1.0,
+    )
+    assert frame.lines == ("\x1b[1;32mok\x1b[0m", "\x1b]0;title\x07plain")
+    assert frame.text == "ok\nplain"
+    assert frame.lines is frame.lines
+    assert frame.content_hash == frame.content_hash
+
+    same = Frame(content=frame.content, width=80, height=24, timestamp=2.0)
+    resized = Frame(content=frame.content, width=100, height=24, timestamp=2.0)
+    assert same.content_hash == frame.content_hash
+    assert resized.content_hash != frame.content_hash
+
+
+def test_cached_views_do_not_affect_equality():
+    """Test that accessing cached views leaves equality and dumps unchanged."""
+    first = Frame(content="same", width=80, height=24, timestamp=1.0)
+    second = Frame(content="same", width=80, height=24, timestamp=1.0)
+    _ = first.lines, first.text, first.content_hash
+
+    assert first == second
+    assert "lines" not in first.model_dump()
+
+
+def test_copies_and_pickles_drop_cached_views():
+    """Test that an edited copy is not mistaken for the original."""
+    frame = Frame(content="abc", width=80, height=24, timestamp=1.0)
+    _ = frame.lines, frame.content_hash
+    edited = frame.model_copy(update={"content": "zzz", "timestamp": 2.0})
+
+    assert edited.lines == ("zzz",)
+    assert edited.content_hash != frame.content_hash
+    recording = Recording()
+    recording.add_frame(frame)
+    recording.add_frame(edited)
+    assert len(recording.frames) == 2
+
+    restored = pickle.loads(pickle.dumps(frame))
+    assert "lines" not in restored.__dict__
+    assert restored == frame
+    assert restored.content_hash == frame.content_hash
+
+
+def test_content_hash_is_stable_across_processes():
+    """Test that the digest does not depend on the interpreter's hash seed."""
+    code = (
+        "from terminal_state import Frame;"
+        "print(Frame(content='abc', width=80, height=24, timestamp=0).content_hash)"
+    )
+    values = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert values == {str(Frame(content="abc", width=80, height=24, timestamp=0).content_hash)}
@@ -0,0 +1,323 @@
+# tests/test_gif.py
+"""Tests for GIF rendering and export."""
+
+from __future__ import annotations
+
+import gc
+import io
+
+import pytest
+from PIL import Image, ImageChops, ImageSequence
+
+from terminal_state import Frame, GifConfig, GifExporter, Recording, ScreenshotExporter
+from terminal_state.export.gif import FrameRenderer, changed_cells, frame_timings
+from terminal_state.export.glyphs import GlyphAtlas, atlas_for, cell_width
+from terminal_state.export.palette import XTERM_COLORS, TerminalPalette
+
+
+def make_recording(count: int = 5) -> Recording:
+    """Recording where one line is added per frame."""
+    recording = Recording(started_at=0.0)
+    lines: list[str] = []
+    for i in range(count):
+        lines.append(f"$ echo {i}")
+        recording.add_frame(Frame(content="\n".join(lines), width=20, height=8, timestamp=float(i)))
+    return recording
+
+
+def test_atlas_is_shared_per_font():
+    """Test that exporters with the same font and cell size share one atlas."""
+    assert GifExporter().atlas is GifExporter(fps=5).atlas
+    assert GifExporter().atlas is not GifExporter(font_size=20).atlas
+    assert atlas_for(GifConfig()) is GifExporter().atlas
+
+
+def test_atlas_caches_glyphs_and_rows():
+    """Test that tiles and rows are rasterized once and reused."""
+    atlas = GlyphAtlas(GifExporter().font, 9, 18)
+    white, black = (255, 255, 255), (0, 0, 0)
+
+    assert atlas.glyph("a", white, black) is atlas.glyph("a", white, black)
+    assert atlas.glyph("a", white, black).size == (9, 18)
+    assert atlas.glyph("漢", white, black).size == (18, 18)
+    assert cell_width("漢") == 2
+
+    row = atlas.row("ab c", white, black)
+    assert row.size == (36, 18)
+    assert atlas.row("ab c", white, black) is row
+
+
+def test_atlas_row_cache_is_bounded():
+    """Test that least recently used rows are evicted."""
+    atlas = GlyphAtlas(GifExporter().font, 9, 18, max_rows=2)
+    white, black = (255, 255, 255), (0, 0, 0)
+    first = atlas.row("one", white, black)
+    atlas.row("two", white, black)
+    atlas.row("three", white, black)
+    assert atlas.row("one", white, black) is not first
+
+
+def test_atlas_glyph_cache_is_bounded():
+    """Test that glyph tiles for colors no longer in use are evicted."""
+    atlas = GlyphAtlas(GifExporter().font, 9, 18, max_glyphs=2)
+    black = (0, 0, 0)
+    first = atlas.glyph("a", (255, 0, 0), black)
+    for blue in range(1, 100):
+        atlas.glyph("a", (0, 0, blue), black)
+    assert len(atlas._glyphs) == 2
+    assert atlas.glyph("a", (255, 0, 0), black) is not first
+
+
+def test_render_frame_places_rows_on_cell_grid():
+    """Test that glyphs land in their cells and blank cells stay background."""
+    exporter = GifExporter()
+    frame = Frame(content="\x1b[1mx\x1b[0m\n\n  y", width=4, height=3, timestamp=0.0)
+    image = exporter._render_frame(frame)
+
+    assert image.size == (36, 54)
+    assert image.crop((0, 0, 9, 18)).getbbox() is not None
+    assert image.crop((9, 0, 36, 36)).getbbox() is None
+    assert image.crop((18, 36, 27, 54)).getbbox() is not None
+
+
+def test_export_gif(tmp_path):
+    """Test that every frame is written to the GIF."""
+    path = tmp_path / "out.gif"
+    GifExporter().export(make_recording(), path)
+
+    with Image.open(path) as image:
+        assert image.n_frames == 5
+        assert image.size == (180, 144)
+
+
+def test_changed_cells():
+    """Test the column range that differs between two versions of a line."""
+    assert changed_cells("abc", "abc") is None
+    assert changed_cells("$ ls", "$ lsx") == (4, 5)
+    assert changed_cells("abcdef", "abXdef") == (2, 3)
+    assert changed_cells("abcdef", "ab") == (2, 6)
+    assert changed_cells("漢a", "漢b") == (2, 3)
+
+
+def test_renderer_returns_changed_region():
+    """Test that only the changed cells are redrawn and reported."""
+    exporter = GifExporter()
+    renderer = FrameRenderer(exporter.atlas, (200, 200, 200), (0, 0, 0))
+    first = Frame(content="$ ls\n", width=10, height=3, timestamp=0.0)
+    second = Frame(content="$ ls\na.txt", width=10, height=3, timestamp=1.0)
+
+    region, box = renderer.render(first)
+    assert box == (0, 0, 90, 54)
+    assert renderer.render(first) is None
+
+    region, box = renderer.render(second)
+    assert box == (0, 18, 45, 36)
+    assert region.size == (45, 18)
+    assert renderer.image.convert("RGB") == exporter._render_frame(second)
+
+
+def test_export_matches_full_renders(tmp_path):
+    """Test that the sub-rectangle frames decode to the fully rendered screens."""
+    recording = make_recording()
+    recording.add_frame(Frame(content="cleared", width=20, height=8, timestamp=9.0))
+    exporter = GifExporter()
+    path = tmp_path / "out.gif"
+    exporter.export(recording, path)
+
+    with Image.open(path) as image:
+        decoded = [frame.convert("RGB") for frame in ImageSequence.Iterator(image)]
+    expected = [exporter._render_frame(frame) for frame in recording.frames]
+    assert len(decoded) == len(expected)
+    for got, want in zip(decoded, expected, strict=True):
+        assert ImageChops.difference(got, want).getbbox() is None
+
+
+def test_export_merges_repeated_frames(tmp_path):
+    """Test that unchanged frames extend the previous frame's duration."""
+    recording = Recording(started_at=0.0, dedupe=False)
+    for i in range(3):
+        recording.add_frame(Frame(content="same", width=10, height=2, timestamp=float(i)))
+    recording.add_frame(Frame(content="other", width=10, height=2, timestamp=3.0))
+    path = tmp_path / "out.gif"
+    GifExporter(fps=10, timing="fixed").export(recording, path)
+
+    with Image.open(path) as image:
+        assert image.n_frames == 2
+        assert image.info["duration"] == 300
+
+
+def test_write_streams_frames(tmp_path):
+    """Test that frames are rendered and encoded without piling up images."""
+    recording = make_recording(count=40)
+    path = tmp_path / "out.gif"
+    GifExporter().export(recording, path)
+
+    exporter = GifExporter()
+    live_images = []
+
+    def frames():
+        for frame in recording.frames:
+            images = sum(isinstance(o, Image.Image) for o in gc.get_objects())
+            # Tiles and rows held by the shared glyph atlas are bounded caches
+            cached = len(exporter.atlas._glyphs) + len(exporter.atlas._rows)
+            live_images.append(images - cached)
+            yield frame
+
+    buffer = io.BytesIO()
+    assert exporter.write(frames(), buffer) == 40
+    assert buffer.getvalue() == path.read_bytes()
+    assert max(live_images) - min(live_images) <= 3
+
+
+def test_write_requires_frames(tmp_path):
+    """Test that exporting nothing fails without creating a file."""
+    path = tmp_path / "out.gif"
+    with pytest.raises(ValueError, match="No frames"):
+        GifExporter().write(iter([]), path)
+    assert not path.exists()
+
+
+def timed_frames(*timestamps: float) -> list[Frame]:
+    """Frames numbered by position, captured at ``timestamps``."""
+    return [
+        Frame(content=str(i), width=4, height=1, timestamp=timestamp)
+        for i, timestamp in enumerate(timestamps)
+    ]
+
+
+def test_frame_timings_follow_timestamps():
+    """Test that durations come from the gaps between frames."""
+    frames = timed_frames(100.0, 100.5, 102.0)
+    timings = [(f.content, d) for f, d in frame_timings(frames, fps=10)]
+    assert timings == [("0", 500), ("1", 1500), ("2", 100)]
+
+    timings = list(frame_timings(frames, fps=10, ended_at=105.0))
+    assert timings[-1][1] == 3000
+
+
+def test_frame_timings_merge_frames_in_one_tick():
+    """Test that only the last frame captured within a tick is shown."""
+    frames = timed_frames(0.0, 0.01, 0.02, 0.25, 0.26)
+    timings = [(f.content, d) for f, d in frame_timings(frames, fps=10)]
+    assert timings == [("2", 200), ("4", 100)]
+
+
+def test_frame_timings_cap_idle_time():
+    """Test that long pauses are shortened to the idle time limit."""
+    frames = timed_frames(0.0, 600.0, 600.5)
+    timings = [d for _, d in frame_timings(frames, fps=10, idle_time_limit=2.0)]
+    assert timings == [2000, 500, 100]
+
+
+def test_frame_timings_keep_total_at_odd_fps():
+    """Test that rounding to centiseconds does not drift over many frames."""
+    frames = timed_frames(*(i / 3 for i in range(30)))
+    durations = [d for _, d in frame_timings(frames, fps=3)]
+    assert len(durations) == 30
+    assert set(durations) <= {330, 340}
+    assert sum(durations) == 10000
+
+
+def test_export_uses_timestamps(tmp_path):
+    """Test that the GIF is paced by when frames were captured."""
+    recording = Recording(started_at=0.0)
+    for i, timestamp in enumerate([0.0, 0.02, 1.0, 31.0]):
+        recording.add_frame(Frame(content=f"step {i}", width=10, height=2, timestamp=timestamp))
+    path = tmp_path / "out.gif"
+    GifExporter(fps=10, idle_time_limit=3.0).export(recording, path)
+
+    with Image.open(path) as image:
+        durations = [frame.info["duration"] for frame in ImageSequence.Iterator(image)]
+    assert durations == [1000, 3000, 100]
+
+
+def test_export_splits_long_pauses(tmp_path):
+    """Test that holds beyond the longest GIF delay continue in extra frames."""
+    recording = Recording(started_at=0.0, dedupe=False)
+    for content, timestamp in [("a", 0.0), ("b", 700.0), ("b", 1000.0), ("b", 1400.0)]:
+        recording.add_frame(Frame(content=content, width=10, height=2, timestamp=timestamp))
+    path = tmp_path / "out.gif"
+    GifExporter().export(recording, path)
+
+    with Image.open(path) as image:
+        frames = [
+            (frame.info["duration"], frame.convert("RGB"))
+            for frame in ImageSequence.Iterator(image)
+        ]
+    assert [duration for duration, _ in frames] == [655350, 44650, 655350, 44750]
+    assert ImageChops.difference(frames[0][1], frames[1][1]).getbbox() is None
+    assert ImageChops.difference(frames[2][1], frames[3][1]).getbbox() is None
+    assert sum(duration for duration, _ in frames) == 1400100
+
+
+def test_terminal_palette_keeps_xterm_colors():
+    """Test that the default colors only replace duplicate xterm entries."""
+    palette = TerminalPalette(fg=(200, 200, 200), bg=(10, 20, 30))
+
+    assert len(palette.data) == 768
+    assert palette.colors[palette.fg_index] == (200, 200, 200)
+    assert palette.colors[palette.bg_index] == (10, 20, 30)
+    assert set(XTERM_COLORS) <= set(palette.colors)
+    assert palette.index((10, 20, 30)) == palette.bg_index
+    assert palette.colors[palette.index((205, 0, 0))] == (205, 0, 0)
+    assert palette.colors[palette.index((250, 1, 1))] == (255, 0, 0)
+
+    table = palette.coverage_table((200, 200, 200), (10, 20, 30))
+    assert table[0] == palette.bg_index
+    assert table[255] == palette.fg_index
+    assert len(set(table)) == 7
+
+
+def test_fixed_palette_export(tmp_path):
+    """Test that palette-mode frames share one global palette."""
+    recording = make_recording()
+    path = tmp_path / "out.gif"
+    exporter = GifExporter(palette="fixed")
+    assert exporter.atlas.mode == "P"
+    exporter.export(recording, path)
+
+    palette = TerminalPalette(exporter.config.fg_color, exporter.config.bg_color)
+    with Image.open(path) as image:
+        assert bytes(image.global_palette.palette) == palette.data
+        frames = [frame.convert("RGB") for frame in ImageSequence.Iterator(image)]
+    for got, frame in zip(frames, recording.frames, strict=True):
+        assert ImageChops.difference(got, exporter._render_frame(frame)).getbbox() is None
+
+
+def test_adaptive_palette_export(tmp_path):
+    """Test that RGB rendering with per-frame quantization is still available."""
+    exporter = GifExporter(palette="adaptive")
+    assert exporter.atlas.mode == "RGB"
+    assert exporter.atlas is not GifExporter().atlas
+
+    path = tmp_path / "out.gif"
+    exporter.export(make_recording(), path)
+    with Image.open(path) as image:
+        assert image.n_frames == 5
+
+
+def test_parallel_export_matches_sequential(tmp_path):
+    """Test that rendering in worker processes produces the same file."""
+    recording = make_recording(count=12)
+    recording.add_frame(Frame(content="$ echo 11", width=20, height=8, timestamp=20.0))
+    sequential = io.BytesIO()
+    GifExporter().export(recording, sequential)
+
+    parallel = io.BytesIO()
+    GifExporter(workers=2, chunk_size=3).export(recording, parallel)
+    assert parallel.getvalue() == sequential.getvalue()
+
+
+def test_export_frames_in_parallel(tmp_path):
+    """Test batch PNG export with and without worker processes."""
+    recording = make_recording(count=4)
+    exporter = ScreenshotExporter()
+
+    paths = exporter.export_frames(recording.frames, tmp_path / "seq")
+    assert [p.name for p in paths] == [f"frame-{i:05d}.png" for i in range(4)]
+
+    parallel = exporter.export_frames(recording.frames, tmp_path / "par", workers=2)
+    assert [p.name for p in parallel] == [p.name for p in paths]
+    for a, b in zip(paths, parallel, strict=True):
+        with Image.open(a) as first, Image.open(b) as second:
+            assert first.tobytes() == second.tobytes()
@@ -0,0 +1,130 @@
+# tests/test_grid.py
+"""Tests for the NumPy cell grid representation."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from terminal_state import Frame
+from terminal_state.capture.grid import (
+    BOLD,
+    REVERSE,
+    CellGrid,
+    decode_color,
+    palette_color,
+    rgb_color,
+)
+
+
+def test_grid_from_text():
+    """Test that text is laid out one codepoint per cell."""
+    grid = CellGrid.from_text("ab\n\nλ→x", width=4, height=3)
+
+    assert grid.shape == (3, 4)
+    assert grid.chars[0, :3].tolist() == [ord("a"), ord("b"), 0]
+    assert grid.row_text(2) == "λ→x"
+    assert grid.text == "ab\n\nλ→x"
+    assert grid.cursor is None
+
+
+def test_grid_clips_to_screen():
+    """Test that rows and columns beyond the screen are dropped."""
+    grid = CellGrid.from_text("abcdef\n1\n2\n3", width=3, height=2)
+    assert grid.text == "abc\n1"
+
+
+def test_changed_cells():
+    """Test the vectorized comparison of two grids."""
+    before = CellGrid.from_text("$ ls\n", width=10, height=3)
+    after = CellGrid.from_text("$ ls\na.txt\n$", width=10, height=3)
+
+    assert after.changed(before).sum() == 6
+    assert after.changed_rows(before).tolist() == [1, 2]
+    assert after.changed_bbox(before) == (1, 0, 3, 5)
+    assert before.changed_bbox(before) is None
+    assert before == CellGrid.from_text("$ ls", width=10, height=3)
+    assert before != after
+
+
+def test_region_and_find():
+    """Test region queries and text search over the grid."""
+    grid = CellGrid.from_text("one two\nthree two", width=10, height=2, cursor=(1, 6))
+
+    region = grid.region(1, 6, 2, 9)
+    assert region.text == "two"
+    assert region.cursor == (0, 0)
+    assert grid.region(0, 0, 1, 3).cursor is None
+    assert grid.find("two") == [(0, 4), (1, 6)]
+
+
+def test_color_encoding():
+    """Test that palette and RGB colors round trip through the encoding."""
+    assert decode_color(0) is None
+    assert decode_color(palette_color(0)) == 0
+    assert decode_color(palette_color(255)) == 255
+    assert decode_color(rgb_color(255, 128, 0)) == (255, 128, 0)
+
+
+def test_frame_grid_is_cached():
+    """Test that frames build their grid once from the plain text."""
+    frame = Frame(content="\x1b[31mred\x1b[0m", width=5, height=2, timestamp=1.0)
+
+    assert frame.grid.text == "red\n"
+    assert frame.grid is frame.grid
+    assert frame == Frame(content="\x1b[31mred\x1b[0m", width=5, height=2, timestamp=1.0)
+
+
+def test_frame_uses_captured_grid():
+    """Test that a grid supplied at capture replaces the derived one."""
+    grid = CellGrid.from_text("hi", width=5, height=2, cursor=(0, 2))
+    frame = Frame.trusted("hi", 5, 2, 1.0, grid=grid)
+    assert frame.grid is grid
+    assert frame == Frame.trusted("hi", 5, 2, 1.0)
+
+
+def test_grid_from_pyte_screen():
+    """Test that colors, attributes and the cursor are read from pyte."""
+    pyte = pytest.importorskip("pyte")
+    screen = pyte.Screen(10, 2)
+    stream = pyte.Stream(screen)
+    stream.feed("\x1b[1;31mA\x1b[0m\x1b[7;38;2;1;2;3mB\x1b[0m\x1b[44mC\x1b[0m")
+
+    grid = CellGrid.from_screen(screen)
+    assert grid.row_text(0) == "ABC"
+    assert grid.cursor == (0, 3)
+    assert decode_color(int(grid.fg[0, 0])) == 1
+    assert grid.attrs[0, 0] == BOLD
+    assert decode_color(int(grid.fg[0, 1])) == (1, 2, 3)
+    assert grid.attrs[0, 1] == REVERSE
+    assert decode_color(int(grid.bg[0, 2])) == 4
+    assert grid.fg[1].sum() == 0
+
+
+def test_wide_characters_take_two_cells():
+    """Test that wide characters fill two cells, the second left empty."""
+    grid = CellGrid.from_text("你好x\ne\u0301", width=6, height=2)
+
+    assert grid.chars[0, :5].tolist() == [ord("你"), 0, ord("好"), 0, ord("x")]
+    assert grid.row_text(0) == "你好x"
+    assert grid.row_text(1) == "e"
+    assert grid.find("x") == [(0, 4)]
+
+    edited = CellGrid.from_text("你好y\ne\u0301", width=6, height=2)
+    assert edited.changed_bbox(grid) == (0, 4, 1, 5)
+
+    styled = Frame.trusted("你x", 6, 1, 0.0, ansi_data="\x1b[31m你\x1b[0mx".encode()).grid
+    assert styled.chars[0, :3].tolist() == [ord("你"), 0, ord("x")]
+    assert decode_color(int(styled.fg[0, 0])) == 1
+
+
+def test_wide_characters_match_pyte_layout():
+    """Test that text grids lay out wide characters as the emulator does."""
+    pyte = pytest.importorskip("pyte")
+    screen = pyte.Screen(8, 1)
+    pyte.Stream(screen).feed("ab日本c")
+
+    assert CellGrid.from_text("ab日本c", 8, 1).chars.tolist() == (
+        CellGrid.from_screen(screen).chars.tolist()
+    )
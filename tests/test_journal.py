@@ -0,0 +1,122 @@
+# tests/test_journal.py
+"""Tests for the on-disk frame journal."""
+
+from __future__ import annotations
+
+import pytest
+
+from terminal_state import Frame, JournalFrameStore, Recording
+from terminal_state.session.runner import _pack_recording, _unpack_recording
+
+
+def make_frames(count: int) -> list[Frame]:
+    """Distinct frames with increasing timestamps."""
+    return [
+        Frame(content=f"frame {i}\nline two", width=40, height=10, timestamp=100.0 + i)
+        for i in range(count)
+    ]
+
+
+def test_journal_roundtrip(tmp_path):
+    """Test that frames read back from disk equal the appended ones."""
+    frames = make_frames(50)
+    frames.append(
+        Frame(
+            content="x",
+            width=40,
+            height=10,
+            timestamp=200.0,
+            ansi_data=b"\x1b[31mx",
+            metadata={"k": "v"},
+        )
+    )
+    store = JournalFrameStore(tmp_path / "rec.journal", window=4)
+    store.extend(frames)
+
+    assert len(store) == 51
+    assert len(store._recent) == 4
+    assert list(store) == frames
+    assert store[3] == frames[3]
+    assert store[-1].ansi_data == b"\x1b[31mx"
+    assert store[10:13] == frames[10:13]
+    with pytest.raises(IndexError):
+        store[51]
+
+
+def test_journal_stores_colors_once(tmp_path):
+    """Test that colored frames are journaled as their escapes, not the text twice."""
+    colored = Frame.trusted("red\nplain", 40, 10, 1.0, b"\x1b[31mred\x1b[0m\nplain")
+    binary = Frame.trusted("x", 40, 10, 2.0, b"\xff\x1b[31mx")
+    store = JournalFrameStore(tmp_path / "rec.journal", window=1)
+    store.extend([colored, binary])
+
+    record = (tmp_path / "rec.journal").read_bytes().splitlines()[0]
+    assert record.count(b"red") == 1
+    assert store[0] == colored
+    assert store[0].ansi_data == colored.ansi_data
+    assert store[1].ansi_data == binary.ansi_data
+
+
+def test_journal_resume(tmp_path):
+    """Test reopening an existing journal and dropping a torn last write."""
+    path = tmp_path / "rec.journal"
+    frames = make_frames(10)
+    store = JournalFrameStore(path)
+    store.extend(frames)
+    store.close()
+    with open(path, "ab") as f:
+        f.write(b'["partial"')
+
+    resumed = JournalFrameStore(path, window=2, resume=True)
+    assert list(resumed) == frames
+    resumed.append(frames[0])
+    assert len(resumed) == 11
+    assert resumed[-1] == frames[0]
+
+    assert len(JournalFrameStore(path)) == 0
+
+
+def test_temporary_journal_is_removed():
+    """Test that a journal without a path is deleted on close."""
+    store = JournalFrameStore()
+    store.append(make_frames(1)[0])
+    path = store.path
+    assert path.exists()
+
+    store.close()
+    assert store.closed
+    assert not path.exists()
+
+
+def test_recording_journal_storage(tmp_path):
+    """Test that a journaled recording exports like a list-backed one."""
+    plain = Recording(started_at=100.0)
+    journaled = Recording(
+        started_at=100.0,
+        storage="journal",
+        journal_path=tmp_path / "rec.journal",
+        memory_window=2,
+    )
+    for frame in make_frames(20):
+        plain.add_frame(frame)
+        journaled.add_frame(frame)
+
+    assert isinstance(journaled.frames, JournalFrameStore)
+    assert journaled.duration == plain.duration
+
+    plain.to_asciinema(tmp_path / "plain.cast")
+    journaled.to_asciinema(tmp_path / "journal.cast")
+    assert (tmp_path / "plain.cast").read_text() == (tmp_path / "journal.cast").read_text()
+
+
+def test_runner_reopens_journal(tmp_path):
+    """Test that packing a journaled recording ships no frames."""
+    recording = Recording(storage="journal", journal_path=tmp_path / "rec.journal")
+    for frame in make_frames(5):
+        recording.add_frame(frame)
+
+    packed = _pack_recording(recording)
+    assert packed[1] == []
+
+    restored = _unpack_recording(packed)
+    assert list(restored.frames) == make_frames(5)
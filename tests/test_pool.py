@@ -0,0 +1,81 @@
+# tests/test_pool.py
+"""Tests for the pre-warmed session pool requiring tmux."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from terminal_state import SessionPool
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+PROMPT = r"[$#] ?$"
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """Create a single-session pool and close it afterwards."""
+    with SessionPool(
+        size=1,
+        width=80,
+        height=24,
+        environment={"POOL_MARKER": "clean"},
+        start_directory=tmp_path,
+        ready_pattern=PROMPT,
+        ready_timeout=30.0,
+    ) as pool:
+        yield pool
+
+
+def test_pool_fill(pool):
+    """Test that the pool starts with ready sessions."""
+    assert pool.available == 1
+
+
+def test_pool_reuses_and_resets(pool, tmp_path):
+    """Test that released sessions are reset and handed out again."""
+    with pool.session() as first:
+        session_id = first.backend.session_id
+        first.send_command("export POOL_MARKER=dirty; cd /")
+        first.send_command("echo leftover-output")
+        assert first.expect_text("leftover-output", timeout=5.0)
+        assert first.recording.frames
+
+    assert pool.available == 1
+
+    with pool.session() as second:
+        assert second.backend.session_id == session_id
+        assert second.recording.frames == []
+        assert "leftover-output" not in second.capture().content
+
+        second.send_command('echo "marker=$POOL_MARKER dir=$PWD"')
+        assert second.expect_text(f"marker=clean dir={tmp_path}", timeout=5.0)
+
+
+def test_pool_evicts_unhealthy(pool):
+    """Test that dead sessions are replaced on acquire."""
+    session = pool.acquire()
+    dead_id = session.backend.session_id
+    pool.release(session)
+
+    pool._ready[0].backend.cmd("kill-server")
+
+    replacement = pool.acquire()
+    try:
+        assert replacement.backend.session_id != dead_id
+        assert replacement.backend.is_alive()
+    finally:
+        replacement.destroy()
+
+
+def test_pool_closed(pool):
+    """Test that a closed pool refuses to hand out sessions."""
+    pool.close()
+    assert pool.available == 0
+    with pytest.raises(RuntimeError):
+        pool.acquire()
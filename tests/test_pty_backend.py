@@ -0,0 +1,141 @@
+# tests/test_pty_backend.py
+"""Tests for the tmux-free pty backend."""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from terminal_state import Keys, PtyBackend, SessionPool, TerminalSession
+from terminal_state.capture.sgr import BOLD, Style, palette_color
+from terminal_state.session.pty_backend import encode_key
+
+pytest.importorskip("pyte")
+
+requires_bash = pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+
+PROMPT = r"[$#] ?$"
+
+
+def test_encode_key_names():
+    """Test translation of tmux key names to terminal input."""
+    assert encode_key("Enter") == b"\r"
+    assert encode_key("C-c") == b"\x03"
+    assert encode_key("C-d") == b"\x04"
+    assert encode_key("M-b") == b"\x1bb"
+    assert encode_key("Up") == b"\x1b[A"
+    assert encode_key("Up", application_cursor=True) == b"\x1bOA"
+    assert encode_key("PageDown") == b"\x1b[6~"
+    assert encode_key("hello") == b"hello"
+
+
+@pytest.fixture
+def session():
+    """Pty-backed session with a plain bash prompt."""
+    sess = TerminalSession.create(
+        width=60,
+        height=12,
+        backend="pty",
+        environment={"PS1": "$ ", "HOME": "/tmp"},
+    )
+    assert sess.expect(PROMPT, timeout=20.0)
+    yield sess
+    sess.destroy()
+
+
+@requires_bash
+def test_pty_session_runs_commands(session):
+    """Test that commands run and their output is captured from memory."""
+    assert isinstance(session.backend, PtyBackend)
+    session.send_command("echo size=$(tput cols)x$(tput lines) sum=$((2 + 3))")
+    assert session.expect_text("size=60x12 sum=5", timeout=10.0)
+
+    frame = session.capture()
+    assert frame.width == 60
+    assert frame.height == 12
+    assert "sum=5" in frame.content
+    assert session.recording.frames
+
+
+@requires_bash
+def test_pty_session_control_keys(session):
+    """Test that named keys reach the shell."""
+    session.send_command("sleep 30")
+    session.send_keys(Keys.CTRL_C)
+    session.send_command("echo interrupted-$((6 * 7))")
+    assert session.expect_text("interrupted-42", timeout=10.0)
+
+
+@requires_bash
+def test_pty_destroy_stops_shell(session):
+    """Test that destroy ends the shell process."""
+    process = session.backend.process
+    assert session.backend.is_alive()
+    session.destroy()
+    assert process.poll() is not None
+    assert not session.backend.is_alive()
+
+
+@requires_bash
+def test_pty_stream_capture():
+    """Test streaming output events from the pty."""
+    with TerminalSession.create(
+        backend="pty", capture_mode="stream", environment={"PS1": "$ "}
+    ) as session:
+        session.send_command("echo streamed-$((1 + 1))")
+        assert session.expect_text("streamed-2", timeout=10.0)
+        assert any("streamed-2" in e.data for e in session.recording.events)
+
+
+@requires_bash
+def test_pty_pool_reset(tmp_path):
+    """Test that a pooled pty session gets a fresh shell on release."""
+    with SessionPool(
+        size=1, backend="pty", environment={"PS1": "$ "}, start_directory=tmp_path
+    ) as pool:
+        with pool.session() as session:
+            session.send_command("export MARKER=dirty")
+        with pool.session() as session:
+            session.send_command('echo "marker=[$MARKER] $(pwd)"')
+            assert session.expect_text(f"marker=\\[\\] {tmp_path}", timeout=10.0)
+
+
+@requires_bash
+def test_pty_cell_grid_capture():
+    """Test that frames carry the emulator's colors and cursor when enabled."""
+    pytest.importorskip("numpy")
+    with TerminalSession.create(
+        width=40, height=6, backend="pty", cell_grid=True, environment={"PS1": "$ "}
+    ) as session:
+        session.send_command("printf '\\033[31m%s\\033[0m\\n' red-$((1 + 1))")
+        assert session.expect_text("red-2", timeout=10.0)
+
+        grid = session.capture().grid
+        row, column = grid.find("red-2")[0]
+        assert grid.fg[row, column] == 2
+        assert grid.cursor is not None
+
+
+@requires_bash
+def test_pty_color_capture():
+    """Test that frames keep colors as escapes and styled runs when enabled."""
+    with TerminalSession.create(
+        width=40, height=6, backend="pty", color_capture=True, environment={"PS1": "$ "}
+    ) as session:
+        session.send_command("printf '\\033[1;32m%s\\033[0m\\n' green-$((1 + 1))")
+        assert session.expect_text("green-2", timeout=10.0)
+
+        frame = session.capture()
+        assert frame.ansi_data is not None
+        assert "\x1b" not in frame.content
+        runs = [run for line in frame.styled_lines for run in line if run.text == "green-2"]
+        assert runs[0].style == Style(fg=palette_color(2), attrs=BOLD)
+
+
+@requires_bash
+def test_pty_shell_owns_controlling_terminal(session):
+    """Test that the shell runs as the session's process with the pty as its tty."""
+    session.send_command("(exec 3</dev/tty && echo ctty-ok); echo pid=$$")
+    assert session.expect_text("ctty-ok", timeout=10.0)
+    assert session.expect_text(f"pid={session.backend.process.pid}", timeout=10.0)
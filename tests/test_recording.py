@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
+import json
 import time
 
 from terminal_state.capture import Frame, Recording
+from terminal_state.export import AsciinemaExporter
 
 
 def test_recording_creation():
@@ -55,3 +57,48 @@ def test_export_methods_exist():
     assert hasattr(recording, "to_asciinema")
     assert hasattr(recording, "to_gif")
     assert hasattr(recording, "to_screenshot")
+
+
+def test_dedupe_identical_frames():
+    """Test that identical consecutive frames extend the previous one."""
+    recording = Recording(started_at=0.0)
+    for timestamp, content in [(1.0, "a"), (2.0, "a"), (3.0, "b"), (4.0, "b"), (5.0, "a")]:
+        recording.add_frame(Frame(content=content, width=80, height=24, timestamp=timestamp))
+
+    assert [f.content for f in recording.frames] == ["a", "b", "a"]
+    assert [f.timestamp for f in recording.frames] == [1.0, 3.0, 5.0]
+
+    recording.add_frame(Frame(content="a", width=80, height=24, timestamp=9.0))
+    assert len(recording.frames) == 3
+    assert recording.ended_at == 9.0
+    assert recording.duration == 9.0
+
+
+def test_dedupe_disabled_keeps_every_sample():
+    """Test that dedupe=False records each frame."""
+    recording = Recording(dedupe=False)
+    for timestamp in (1.0, 2.0, 3.0):
+        recording.add_frame(Frame(content="same", width=80, height=24, timestamp=timestamp))
+
+    assert len(recording.frames) == 3
+
+
+def test_dedupe_respects_size():
+    """Test that a resize with the same text is not merged."""
+    recording = Recording()
+    recording.add_frame(Frame(content="x", width=80, height=24, timestamp=1.0))
+    recording.add_frame(Frame(content="x", width=100, height=24, timestamp=2.0))
+
+    assert len(recording.frames) == 2
+
+
+def test_dedupe_holds_last_frame_in_cast(tmp_path):
+    """Test that the asciinema export keeps the merged display time."""
+    recording = Recording(started_at=0.0)
+    recording.add_frame(Frame(content="x", width=80, height=24, timestamp=1.0))
+    recording.add_frame(Frame(content="x", width=80, height=24, timestamp=4.0))
+
+    path = tmp_path / "held.cast"
+    AsciinemaExporter(diff=False).export(recording, path)
+    events = [json.loads(line) for line in path.read_text().splitlines()[1:]]
+    assert events == [[1.0, "o", "x"], [4.0, "o", ""]]
@@ -0,0 +1,99 @@
+# tests/test_runner.py
+"""Tests for the parallel scenario runner."""
+
+from __future__ import annotations
+
+import shutil
+import time
+
+import pytest
+
+from terminal_state import Frame, OutputEvent, Recording, ScenarioRunner
+from terminal_state.session.runner import _pack_recording, _unpack_recording
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+def report_size(session):
+    """Scenario: print the terminal size and return it."""
+    session.send_command("echo size=$(tput cols)x$(tput lines)")
+    session.expect(r"size=\d+x\d+", timeout=20.0)
+    return (session.config.width, session.config.height)
+
+
+def failing_scenario(session):
+    """Scenario that always raises."""
+    raise ValueError("boom")
+
+
+class ScenarioBug(Exception):
+    """Exception type defined by a scenario rather than the standard library."""
+
+
+def buggy_scenario(session):
+    """Scenario that raises a custom exception on wide screens."""
+    if session.config.width > 75:
+        raise ScenarioBug("bug")
+    return session.config.width
+
+
+def test_pack_roundtrip():
+    """Test that packing preserves frames and events."""
+    recording = Recording(started_at=10.0, title="packed", environment={"TERM": "xterm"})
+    recording.add_frame(
+        Frame(content="a", width=80, height=24, timestamp=11.0, metadata={"k": "v"})
+    )
+    recording.add_event(OutputEvent(timestamp=10.5, data="a"))
+
+    restored = _unpack_recording(_pack_recording(recording))
+    assert restored == recording
+    assert restored.frames[0].metadata == {"k": "v"}
+
+
+def test_runner_validates_batch_size():
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        ScenarioRunner(sessions_per_task=0)
+
+
+@requires_tmux
+def test_runner_fans_out():
+    """Test running a scenario over several configurations."""
+    configs = [{"width": 60, "height": 20}, {"width": 100, "height": 30}]
+    runner = ScenarioRunner(max_workers=2)
+    start = time.time()
+    results = runner.run(report_size, configs)
+
+    assert [r.value for r in results] == [(60, 20), (100, 30)]
+    assert all(r.ok for r in results)
+    assert results[0].recording.width == 60
+    assert results[1].recording.frames
+    assert time.time() - start < 120
+
+
+@requires_tmux
+def test_runner_reports_errors():
+    """Test that scenario exceptions are captured per configuration."""
+    runner = ScenarioRunner(max_workers=1, sessions_per_task=2)
+    results = runner.run(failing_scenario, [{}, {}])
+
+    assert len(results) == 2
+    assert not results[0].ok
+    assert "ValueError: boom" in (results[0].error or "")
+
+
+@requires_tmux
+def test_runner_reports_custom_errors():
+    """Test that any exception type is reported without losing the other results."""
+    runner = ScenarioRunner(max_workers=1, sessions_per_task=2)
+    results = runner.run(buggy_scenario, [{"width": 70}, {"width": 80}])
+
+    assert [r.config.width for r in results] == [70, 80]
+    assert results[0].ok
+    assert results[0].value == 70
+    assert not results[1].ok
+    assert "ScenarioBug: bug" in (results[1].error or "")
+    assert results[1].recording.width == 80
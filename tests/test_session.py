@@ -9,6 +9,7 @@ import time
 import pytest
 
 from terminal_state import TerminalSession
+from terminal_state.capture.sgr import Run, Style, palette_color
 from terminal_state.input import Keys
 
 pytestmark = pytest.mark.skipif(
@@ -122,3 +123,28 @@ def test_multiple_commands(session):
     assert "command 1" in frame.content
     assert "command 2" in frame.content
     assert "command 3" in frame.content
+
+
+def test_capture_cell_grid():
+    """Test that tmux captures include the cursor position when enabled."""
+    pytest.importorskip("numpy")
+    with TerminalSession.create(width=40, height=5, cell_grid=True) as session:
+        session.send_command("clear; printf 'ab'")
+        assert session.expect_text("^ab", timeout=5.0)
+
+        grid = session.capture().grid
+        assert grid.shape == (5, 40)
+        assert grid.cursor is not None
+        assert grid.row_text(0).startswith("ab")
+
+
+def test_capture_colors():
+    """Test that tmux captures keep SGR colors when enabled."""
+    with TerminalSession.create(width=40, height=5, color_capture=True) as session:
+        session.send_command("clear; printf '\\033[31mred\\033[0m plain'")
+        assert session.expect_text("^red plain", timeout=5.0)
+
+        frame = session.capture()
+        assert frame.lines[0].startswith("red plain")
+        assert frame.styled_lines[0][0] == Run("red", Style(fg=palette_color(1)))
+        assert frame.styled_lines[0][1].style == Style()
@@ -0,0 +1,96 @@
+# tests/test_settle.py
+"""Tests for output-settle detection."""
+
+from __future__ import annotations
+
+import shutil
+import time
+
+import pytest
+
+from terminal_state import Frame, SettleConfig, TerminalSession
+from terminal_state.session.settle import settle
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+class ScriptedCapture:
+    """Capture callable returning content that changes for a while."""
+
+    def __init__(self, changes_for: float) -> None:
+        self.start = time.time()
+        self.changes_for = changes_for
+        self.calls = 0
+
+    def __call__(self) -> Frame:
+        self.calls += 1
+        now = time.time()
+        content = str(self.calls) if now - self.start < self.changes_for else "done"
+        return Frame(content=content, width=80, height=24, timestamp=now)
+
+
+class FakeStream:
+    """Stand-in for OutputStream exposing only the last output time."""
+
+    def __init__(self, last_output_at: float | None) -> None:
+        self.last_output_at = last_output_at
+
+
+def test_settle_fixed():
+    """Test the fixed-delay strategy."""
+    capture = ScriptedCapture(changes_for=0.0)
+    start = time.time()
+    frame = settle(capture, SettleConfig(strategy="fixed", delay=0.05))
+    assert time.time() - start >= 0.05
+    assert capture.calls == 1
+    assert frame.content == "done"
+
+
+def test_settle_quiet_static_screen():
+    """Test that an unchanging screen settles after the quiet period."""
+    capture = ScriptedCapture(changes_for=0.0)
+    config = SettleConfig(strategy="quiet", quiet_period=0.03, timeout=1.0)
+    start = time.time()
+    settle(capture, config)
+    assert time.time() - start < 0.2
+
+
+def test_settle_quiet_waits_for_changes():
+    """Test that a changing screen is only captured once it is quiet."""
+    capture = ScriptedCapture(changes_for=0.15)
+    config = SettleConfig(strategy="quiet", quiet_period=0.05, timeout=1.0)
+    start = time.time()
+    frame = settle(capture, config)
+    assert time.time() - start >= 0.15
+    assert frame.content == "done"
+
+
+def test_settle_quiet_timeout():
+    """Test the hard upper bound on a screen that never settles."""
+    capture = ScriptedCapture(changes_for=10.0)
+    config = SettleConfig(strategy="quiet", quiet_period=0.05, timeout=0.2)
+    start = time.time()
+    settle(capture, config)
+    assert time.time() - start < 0.4
+
+
+def test_settle_quiet_stream():
+    """Test that a quiet stream needs only one capture."""
+    capture = ScriptedCapture(changes_for=0.0)
+    stream = FakeStream(last_output_at=time.time() - 1.0)
+    config = SettleConfig(strategy="quiet", quiet_period=0.03, timeout=1.0)
+    settle(capture, config, stream)  # type: ignore[arg-type]
+    assert capture.calls == 1
+
+
+@requires_tmux
+def test_session_quiet_settle():
+    """Test recording with the quiet settle strategy."""
+    settle_config = {"strategy": "quiet", "quiet_period": 0.2}
+    with TerminalSession.create(width=80, height=24, settle=settle_config) as session:
+        assert session.expect_text(r"[$#]", timeout=5.0)
+        session.send_command("echo settled-$((1 + 1))")
+        assert "settled-2" in session.recording.frames[-1].content
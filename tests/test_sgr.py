@@ -0,0 +1,142 @@
+# tests/test_sgr.py
+"""Tests for SGR parsing and styled frames."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from terminal_state import Frame, GifConfig, GifExporter, Recording
+from terminal_state.capture import sgr
+from terminal_state.capture.sgr import (
+    BOLD,
+    DEFAULT_STYLE,
+    REVERSE,
+    UNDERLINE,
+    Run,
+    Style,
+    apply_sgr,
+    palette_color,
+    parse_styled,
+    plain_text,
+    render_line,
+    rgb_color,
+)
+from terminal_state.export.asciinema import AsciinemaWriter
+from terminal_state.export.palette import XTERM_COLORS
+
+RED = Style(fg=palette_color(1))
+
+
+def test_parse_basic_colors():
+    """Test that 16-color codes and resets split a line into runs."""
+    (line,) = parse_styled("a\x1b[1;31mred\x1b[0m \x1b[94;42mhi\x1b[m")
+
+    assert line == (
+        Run("a", DEFAULT_STYLE),
+        Run("red", Style(fg=palette_color(1), attrs=BOLD)),
+        Run(" ", DEFAULT_STYLE),
+        Run("hi", Style(fg=palette_color(12), bg=palette_color(2))),
+    )
+
+
+def test_parse_extended_colors():
+    """Test 256-color and truecolor codes in semicolon and colon form."""
+    (line,) = parse_styled("\x1b[38;5;208ma\x1b[48;2;1;2;3mb\x1b[38:2::10:20:30mc\x1b[38:5:99;49md")
+
+    assert [run.style for run in line] == [
+        Style(fg=palette_color(208)),
+        Style(fg=palette_color(208), bg=rgb_color(1, 2, 3)),
+        Style(fg=rgb_color(10, 20, 30), bg=rgb_color(1, 2, 3)),
+        Style(fg=palette_color(99)),
+    ]
+
+
+def test_parse_carries_state_across_lines():
+    """Test that a style set on one line applies to the next, as capture-pane -e emits."""
+    lines = parse_styled("\x1b[31mone\ntwo\x1b[39m three\x1b[2K\n")
+
+    assert lines[0] == (Run("one", RED),)
+    assert lines[1] == (Run("two", RED), Run(" three", DEFAULT_STYLE))
+    assert lines[2] == ()
+    assert plain_text(lines) == "one\ntwo three\n"
+
+
+def test_attribute_resets():
+    """Test that individual attributes are switched off by their own codes."""
+    style = apply_sgr(DEFAULT_STYLE, "1;4;7")
+    assert style.attrs == BOLD | UNDERLINE | REVERSE
+    assert apply_sgr(style, "22;27").attrs == UNDERLINE
+    assert apply_sgr(style, "4:0").attrs == BOLD | REVERSE
+
+
+def test_apply_sgr_caches_transitions():
+    """Test that repeated transitions are looked up instead of parsed."""
+    first = apply_sgr(RED, "1;44")
+    assert sgr._transitions[(RED, "1;44")] is first
+    assert apply_sgr(RED, "1;44") is first
+
+
+def test_render_line_round_trips():
+    """Test that rendered lines parse back to the same runs and end reset."""
+    (line,) = parse_styled("x\x1b[1;4;91;48;5;17my\x1b[38;2;9;8;7mz\x1b[0m w\x1b[7mv")
+    rendered = render_line(line)
+
+    assert rendered.endswith("\x1b[0m")
+    assert parse_styled(rendered) == (line,)
+
+
+def test_frame_styled_lines():
+    """Test that frames parse their escapes once and expose plain text."""
+    escaped = "\x1b[31mred\x1b[0m\nplain"
+    frame = Frame.trusted("red\nplain", 10, 2, 0.0, ansi_data=escaped.encode())
+
+    assert frame.styled_lines[0] == (Run("red", RED),)
+    assert frame.styled_lines is frame.styled_lines
+    assert Frame.trusted("red", 10, 1, 0.0).styled_lines == ((Run("red", DEFAULT_STYLE),),)
+
+
+def test_grid_from_styled_lines():
+    """Test that the cell grid takes colors and attributes from the escapes."""
+    pytest.importorskip("numpy")
+    frame = Frame.trusted("ab\ncd", 4, 2, 0.0, ansi_data=b"a\x1b[1;32;45mb\ncd\x1b[0m")
+    grid = frame.grid
+
+    assert grid.text == "ab\ncd"
+    assert grid.fg[0].tolist() == [0, palette_color(2), 0, 0]
+    assert grid.bg[1, :2].tolist() == [palette_color(5)] * 2
+    assert grid.attrs[0, 1] == BOLD
+
+
+def test_gif_renders_colors():
+    """Test that colored runs are drawn in their colors, bold as bright."""
+    exporter = GifExporter(GifConfig(char_width=8, char_height=16))
+    frame = Frame.trusted("  X", 4, 1, 0.0, ansi_data=b"\x1b[41m  \x1b[1;32mX\x1b[0m")
+    image = exporter._render_frame(frame)
+
+    assert image.getpixel((1, 1)) == XTERM_COLORS[1]
+    colors = {color for _, color in image.crop((16, 0, 24, 16)).getcolors()}
+    assert XTERM_COLORS[10] in colors
+    assert image.getpixel((30, 8)) == exporter.config.bg_color
+
+
+def test_gif_redraws_style_changes(tmp_path):
+    """Test that a change of color alone produces a new frame."""
+    recording = Recording(width=4, height=1)
+    recording.add_frame(Frame.trusted("ok", 4, 1, 0.0, ansi_data=b"\x1b[32mok"))
+    recording.add_frame(Frame.trusted("ok", 4, 1, 1.0, ansi_data=b"\x1b[31mok"))
+
+    assert GifExporter().write(recording.frames, tmp_path / "colors.gif") == 2
+
+
+def test_asciinema_writes_colored_rows(tmp_path):
+    """Test that casts of colored frames keep their escapes per row."""
+    recording = Recording(width=10, height=2)
+    recording.add_frame(Frame.trusted("one\ntwo", 10, 2, 0.0, ansi_data=b"\x1b[31mone\ntwo\x1b[0m"))
+    path = tmp_path / "colors.cast"
+    with AsciinemaWriter(recording, path) as writer:
+        writer.write(recording.frames[0])
+
+    event = json.loads(path.read_text().splitlines()[1])
+    assert "\x1b[2;1H\x1b[0;31mtwo\x1b[0m" in event[2]
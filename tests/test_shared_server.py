@@ -0,0 +1,52 @@
+# tests/test_shared_server.py
+"""Tests for sessions sharing one tmux server."""
+
+from __future__ import annotations
+
+import shutil
+import uuid
+
+import pytest
+
+from terminal_state import TerminalSession
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+@pytest.mark.parametrize("control_mode", [False, True])
+def test_shared_server_sessions(control_mode):
+    """Test that sessions share a server and clean up only their own target."""
+    server_name = f"shared-{uuid.uuid4().hex[:8]}"
+    sessions = [
+        TerminalSession.create(
+            width=80, height=24, server_name=server_name, control_mode=control_mode
+        )
+        for _ in range(3)
+    ]
+    first, second, third = sessions
+    try:
+        assert len({s.backend.socket_path for s in sessions}) == 1
+        assert len({s.backend.session_id for s in sessions}) == 3
+        if control_mode:
+            assert first.backend.control is second.backend.control is third.backend.control
+
+        listed = first.backend.cmd("list-sessions", "-F", "#{session_name}")
+        assert sorted(listed) == sorted(s.backend.session_id for s in sessions)
+
+        first.destroy()
+        assert first.backend.socket_path.exists()
+
+        listed = second.backend.cmd("list-sessions", "-F", "#{session_name}")
+        assert sorted(listed) == sorted(s.backend.session_id for s in (second, third))
+
+        second.send_command("echo still-$((10 + 1))")
+        assert second.expect_text("still-11", timeout=10.0)
+        assert "still-11" not in third.capture().content
+    finally:
+        for session in sessions:
+            session.destroy()
+
+    assert not first.backend.socket_path.exists()
@@ -0,0 +1,73 @@
+# tests/test_stream.py
+"""Tests for streamed output capture."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from terminal_state import OutputEvent, Recording, TerminalSession
+from terminal_state.session.stream import OutputStream
+
+requires_tmux = pytest.mark.skipif(
+    shutil.which("tmux") is None,
+    reason="tmux not available",
+)
+
+
+def test_output_stream_fifo(tmp_path):
+    """Test that bytes written to the FIFO become events."""
+    stream = OutputStream(tmp_path / "pane.fifo")
+    events: list[OutputEvent] = []
+    stream.subscribe(events.append)
+    stream.open()
+
+    fd = os.open(stream.fifo_path, os.O_WRONLY)
+    os.write(fd, "héllo ".encode()[:2])
+    os.write(fd, "héllo ".encode()[2:] + b"world\r\n")
+    os.close(fd)
+    time.sleep(0.1)
+    stream.close()
+
+    assert "".join(event.data for event in events) == "héllo world\r\n"
+    assert stream.last_output_at is not None
+    assert not stream.fifo_path.exists()
+
+
+def test_recording_events_duration():
+    """Test that streamed events count towards duration."""
+    recording = Recording(started_at=100.0)
+    recording.add_event(OutputEvent(timestamp=101.5, data="a"))
+    recording.add_event(OutputEvent(timestamp=102.0, data="b"))
+    assert recording.duration == 2.0
+
+
+def test_asciinema_export_events(tmp_path):
+    """Test that streamed events are exported verbatim."""
+    recording = Recording(started_at=100.0, width=80, height=24)
+    recording.add_event(OutputEvent(timestamp=100.25, data="$ ls\r\n"))
+
+    cast_file = tmp_path / "stream.cast"
+    recording.to_asciinema(cast_file)
+
+    lines = cast_file.read_text().splitlines()
+    assert json.loads(lines[1]) == [0.25, "o", "$ ls\r\n"]
+
+
+@requires_tmux
+def test_stream_capture_session():
+    """Test that a streaming session records pane output as events."""
+    with TerminalSession.create(width=80, height=24, capture_mode="stream") as session:
+        session.send_command("echo stream-$((6 * 7))")
+        assert session.expect_text("stream-42", timeout=5.0)
+        time.sleep(0.1)
+
+        output = "".join(event.data for event in session.recording.events)
+        assert "stream-42" in output
+        assert session.recording.frames == []
+
+    assert session.backend.stream is None
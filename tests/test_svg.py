@@ -0,0 +1,141 @@
+# tests/test_svg.py
+"""Tests for animated SVG and HTML export."""
+
+from __future__ import annotations
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from terminal_state import Frame, Recording, SvgExporter
+from terminal_state.export.svg import SvgConfig
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def make_recording(*screens: str, ansi: bool = False) -> Recording:
+    """Recording of ``screens`` half a second apart."""
+    recording = Recording(width=20, height=3)
+    for i, screen in enumerate(screens):
+        ansi_data = screen.encode() if ansi else None
+        content = screen if not ansi else screen.replace("\x1b[31m", "").replace("\x1b[0m", "")
+        recording.add_frame(Frame.trusted(content, 20, 3, i * 0.5, ansi_data=ansi_data))
+    return recording
+
+
+def render(recording: Recording, **kwargs: object) -> str:
+    """SVG document for ``recording``."""
+    buffer = io.StringIO()
+    SvgExporter(**kwargs).write(recording.frames, buffer, ended_at=recording.ended_at)
+    return buffer.getvalue()
+
+
+def test_rows_are_defined_once():
+    """Test that a row shared by several frames is written a single time."""
+    recording = make_recording("$ top\nload 1", "$ top\nload 2", "$ top\nload 3")
+    root = ET.fromstring(render(recording))
+
+    definitions = [node for node in root.iter() if node.get("id")]
+    assert len(definitions) == 4
+    assert sum(node.text == "$ top" for node in definitions) == 1
+    uses = [node.get("href") for node in root.iter(f"{SVG}use")]
+    assert uses.count(f"#{definitions[0].get('id')}") == 3
+
+
+def test_repeated_screen_reuses_its_slot():
+    """Test that a screen shown again is not drawn a second time."""
+    recording = make_recording("a", "b", "a", "b")
+    document = render(recording)
+
+    assert document.count("<use ") == 2
+    assert document.count("translateX(0px)") == 2
+    assert "steps(1,end) infinite" in document
+
+
+def test_keyframes_follow_timestamps():
+    """Test that frames start at their share of the total duration."""
+    recording = make_recording("a", "b")
+    recording.add_frame(Frame.trusted("c", 20, 3, 1.5))
+    document = render(recording, idle_time_limit=None)
+
+    assert "animation:play 1600ms" in document
+    assert "31.250%{transform:translateX(-180px)}" in document
+    assert "93.750%{transform:translateX(-360px)}" in document
+
+
+def test_colored_rows():
+    """Test that styled runs keep their colors and stay searchable text."""
+    recording = make_recording("\x1b[31merror\x1b[0m: boom", ansi=True)
+    root = ET.fromstring(render(recording))
+
+    spans = list(root.iter(f"{SVG}tspan"))
+    assert [span.text for span in spans] == ["error", ": boom"]
+    assert spans[0].get("fill") == "#cd0000"
+    assert spans[1].get("fill") is None
+    assert "<style>" not in render(recording)
+
+
+def test_rows_share_the_cell_grid():
+    """Test that plain and styled rows place text on the same cells, wide characters on two."""
+    recording = make_recording("ab 你好 cd")
+    recording.add_frame(
+        Frame.trusted("ab 你好 cd", 20, 3, 1.0, ansi_data="\x1b[41mab\x1b[0m 你好 cd".encode())
+    )
+    root = ET.fromstring(render(recording))
+
+    def cells(node: ET.Element) -> tuple[str | None, str | None, str | None]:
+        return node.get("x"), node.get("textLength"), node.text
+
+    plain = next(node for node in root.iter(f"{SVG}text") if node.get("id"))
+    placed = [cells(span) for span in plain.iter(f"{SVG}tspan")]
+    assert placed == [("0", "27", "ab "), ("27", "36", "你好"), ("63", "27", " cd")]
+    assert {span.get("lengthAdjust") for span in plain} == {"spacingAndGlyphs"}
+
+    styled = next(node for node in root.iter(f"{SVG}g") if node.get("id"))
+    placed = [cells(span) for span in styled.iter(f"{SVG}tspan")]
+    assert placed == [
+        ("0", "18", "ab"),
+        ("18", "9", " "),
+        ("27", "36", "你好"),
+        ("63", "27", " cd"),
+    ]
+    rect = styled.find(f"{SVG}rect")
+    assert (rect.get("x"), rect.get("width")) == ("0", "18")
+
+    single = ET.fromstring(render(make_recording("a  b")))
+    text = next(node for node in single.iter(f"{SVG}text") if node.get("id"))
+    assert cells(text) == ("0", "36", "a  b")
+
+
+def test_text_is_escaped():
+    """Test that markup characters in terminal text stay text."""
+    recording = make_recording("<b> & \x07bell")
+    root = ET.fromstring(render(recording))
+
+    assert "<b> & bell" in [node.text for node in root.iter(f"{SVG}text")]
+
+
+def test_export_html(tmp_path):
+    """Test that .html paths get the animation wrapped in a page."""
+    recording = make_recording("one", "two")
+    recording.to_svg(tmp_path / "demo.html")
+    page = (tmp_path / "demo.html").read_text()
+
+    assert page.startswith("<!DOCTYPE html>")
+    assert page.count("<svg ") == 2
+
+    recording.to_svg(tmp_path / "demo.svg")
+    assert ET.parse(tmp_path / "demo.svg").getroot().tag == f"{SVG}svg"
+
+
+def test_fixed_timing_and_no_frames(tmp_path):
+    """Test fixed pacing and that empty input leaves no file behind."""
+    exporter = SvgExporter(SvgConfig(timing="fixed", fps=4, loop=False))
+    buffer = io.StringIO()
+    assert exporter.write(make_recording("a", "b").frames, buffer) == 2
+    assert "animation:play 500ms steps(1,end) 1 forwards" in buffer.getvalue()
+
+    with pytest.raises(ValueError, match="No frames"):
+        exporter.write([], tmp_path / "empty.svg")
+    assert not (tmp_path / "empty.svg").exists()